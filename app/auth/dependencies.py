@@ -6,14 +6,24 @@ from pydantic import ValidationError
 from config import settings, logger as logging
 from .schemas import JWTData, JWTSession
 from .security import oauth2_token, ALGORITHM
+from .pool import session_pool
+from .kuma_token import kuma_token_cache
+from .token_cache import VerifiedTokenCache
+from utils.executor import run_blocking
+
+verified_tokens = VerifiedTokenCache(max_size=settings.JWT_CACHE_SIZE)
 
 
 def decode_jwt(token: str) -> JWTData:
+    # an expired token is not found in the cache and fails the verification below
+    token_data = verified_tokens.get(token)
+    if token_data is not None:
+        return token_data
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[ALGORITHM]
-        )
-        return JWTData(**payload)
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+        token_data = JWTData(**payload)
+        verified_tokens.put(token, token_data, payload.get("exp"))
+        return token_data
     except (jwt.exceptions.InvalidSignatureError, ValidationError) as e:
         logging.info(f"JWT Decode Error: {e}")
         raise HTTPException(status_code=403, detail="Invalid credentials")
@@ -24,16 +34,26 @@ def decode_jwt(token: str) -> JWTData:
 
 def create_api_session(token_data: JWTData) -> UptimeKumaApi:
     try:
-        api = UptimeKumaApi(settings.KUMA_SERVER, wait_events=settings.KUMA_WAIT_EVENTS)
+        api = UptimeKumaApi(
+            settings.KUMA_SERVER,
+            wait_events=settings.KUMA_WAIT_EVENTS,
+            http_pool_size=settings.KUMA_HTTP_POOL_SIZE,
+        )
         api.login_by_token(token_data.sub)
         return api
     except UptimeKumaException as e:
         logging.fatal(f"API Login Error: {e}")
+        kuma_token_cache.invalidate(token_data.sub)
         raise HTTPException(status_code=400, detail={"error": str(e)})
 
 
 async def get_jwt_session(token: str = Depends(oauth2_token)):
     token_data = decode_jwt(token)
 
-    with create_api_session(token_data) as api:
+    api = await run_blocking(
+        session_pool.acquire, token_data.sub, lambda: create_api_session(token_data)
+    )
+    try:
         yield JWTSession(token=token_data.sub, api=api)
+    finally:
+        await run_blocking(session_pool.release, api)
@@ -0,0 +1,56 @@
+import asyncio
+import time
+from typing import Optional
+
+from uptime_kuma_api import UptimeKumaApi
+
+from config import settings
+from utils.executor import run_blocking
+
+
+def kuma_login() -> str:
+    with UptimeKumaApi(settings.KUMA_SERVER) as api:
+        return api.login(settings.KUMA_USERNAME, settings.KUMA_PASSWORD)["token"]
+
+
+class KumaTokenCache:
+    """Reuses the token of the Kuma login for the access tokens issued by the API.
+
+    Concurrent logins wait for the same Kuma login instead of starting their own.
+
+    :param ttl: Seconds a token is reused, 0 disables the cache.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _cached(self) -> Optional[str]:
+        if self._token is not None and time.monotonic() < self._expires_at:
+            return self._token
+        return None
+
+    async def get(self) -> str:
+        token = self._cached()
+        if token is not None:
+            return token
+        if self._lock is None:
+            # created on demand, so that it belongs to the running event loop
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            token = self._cached()
+            if token is None:
+                token = await run_blocking(kuma_login)
+                self._token = token
+                self._expires_at = time.monotonic() + self.ttl
+            return token
+
+    def invalidate(self, token: str) -> None:
+        # a token rejected by Kuma is not handed out again
+        if self._token == token:
+            self._token = None
+
+
+kuma_token_cache = KumaTokenCache(ttl=settings.KUMA_TOKEN_TTL)
@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from uptime_kuma_api import UptimeKumaApi
+
+from config import settings, logger as logging
+
+
+class SessionPool:
+    """Keeps warm, logged-in UptimeKumaApi instances keyed by Kuma token.
+
+    A borrowed instance is used by a single request at a time. Idle instances keep
+    receiving the events Kuma pushes, so the next request finds an already synchronized
+    connection instead of paying for a new handshake and login.
+
+    :param max_size: Maximum number of instances (idle and borrowed) kept by the pool.
+                     Requests beyond that get a temporary instance that is closed on release.
+    :param idle_timeout: Seconds after which an unused instance is disconnected.
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        # token -> [(api, released_at)], most recently released last
+        self._idle: Dict[str, List[Tuple[UptimeKumaApi, float]]] = {}
+        self._borrowed: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self, token: str, factory: Callable[[], UptimeKumaApi]
+    ) -> UptimeKumaApi:
+        stale = []
+        api = None
+        with self._lock:
+            idle = self._idle.get(token, [])
+            while idle:
+                candidate, released_at = idle.pop()
+                if self._is_healthy(candidate, released_at):
+                    api = candidate
+                    break
+                stale.append(candidate)
+            if not idle:
+                self._idle.pop(token, None)
+            if api is None and self._total() >= self.max_size:
+                evicted = self._pop_oldest_idle()
+                if evicted:
+                    stale.append(evicted)
+        self._close(stale)
+
+        if api is None:
+            api = factory()
+            with self._lock:
+                if self._total() >= self.max_size:
+                    # pool is full of borrowed instances, this one is closed on release
+                    return api
+        with self._lock:
+            self._borrowed[id(api)] = token
+        return api
+
+    def release(self, api: UptimeKumaApi) -> None:
+        with self._lock:
+            token = self._borrowed.pop(id(api), None)
+            if token is not None and api.sio.connected:
+                self._idle.setdefault(token, []).append((api, time.monotonic()))
+                return
+        self._close([api])
+
+    def evict_idle(self) -> None:
+        stale = []
+        with self._lock:
+            for token in list(self._idle):
+                alive = []
+                for api, released_at in self._idle[token]:
+                    if self._is_healthy(api, released_at):
+                        alive.append((api, released_at))
+                    else:
+                        stale.append(api)
+                if alive:
+                    self._idle[token] = alive
+                else:
+                    del self._idle[token]
+        self._close(stale)
+
+    def close(self) -> None:
+        with self._lock:
+            apis = [api for idle in self._idle.values() for api, _ in idle]
+            self._idle.clear()
+        self._close(apis)
+
+    def _is_healthy(self, api: UptimeKumaApi, released_at: float) -> bool:
+        if time.monotonic() - released_at > self.idle_timeout:
+            return False
+        return api.sio.connected
+
+    def _total(self) -> int:
+        return len(self._borrowed) + sum(len(i) for i in self._idle.values())
+
+    def _pop_oldest_idle(self) -> Optional[UptimeKumaApi]:
+        oldest = None
+        for token, idle in self._idle.items():
+            if idle and (oldest is None or idle[0][1] < oldest[1]):
+                oldest = (token, idle[0][1])
+        if oldest is None:
+            return None
+        token = oldest[0]
+        api, _ = self._idle[token].pop(0)
+        if not self._idle[token]:
+            del self._idle[token]
+        return api
+
+    @staticmethod
+    def _close(apis: List[UptimeKumaApi]) -> None:
+        for api in apis:
+            try:
+                api.disconnect()
+            except Exception as e:
+                logging.info(f"Error while closing Kuma session: {e}")
+
+
+session_pool = SessionPool(
+    max_size=settings.KUMA_POOL_MAX_SIZE,
+    idle_timeout=settings.KUMA_POOL_IDLE_TIMEOUT,
+)
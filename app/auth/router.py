@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from datetime import datetime, timedelta
-from uptime_kuma_api import UptimeKumaException, UptimeKumaApi
+from uptime_kuma_api import UptimeKumaException
 
 from .schemas import JWToken
 from .models import User
 from .security import create_access_token
 from .security import authenticate
+from .kuma_token import kuma_token_cache
 from config import logger as logging, settings
 
 router = APIRouter(redirect_slashes=True)
@@ -15,7 +16,7 @@ router = APIRouter(redirect_slashes=True)
 @router.post("/access-token", response_model=JWToken)
 async def login_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
     user_model = await User.get_or_none(username=form_data.username)
-    user = authenticate(user_model, form_data.password)
+    user = await authenticate(user_model, form_data.password)
 
     if not user:
         logging.info("Incorrect username or password")
@@ -25,13 +26,12 @@ async def login_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
         user.last_visit = datetime.now()
         await user.save(update_fields=["last_visit"])
 
-        with UptimeKumaApi(settings.KUMA_SERVER) as api:
-            login_response = api.login(settings.KUMA_USERNAME, settings.KUMA_PASSWORD)
+        kuma_token = await kuma_token_cache.get()
 
         logging.fatal(f"User {user.username} logged in into {settings.KUMA_SERVER}")
 
         expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE)
-        token = create_access_token(login_response["token"], expires)
+        token = create_access_token(kuma_token, expires)
 
         return JWToken(access_token=token)
     except UptimeKumaException as e:
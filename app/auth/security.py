@@ -1,5 +1,7 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from typing import Any, Callable, Union, Optional
 
 import jwt
 from passlib.context import CryptContext
@@ -12,20 +14,31 @@ ALGORITHM = "HS256"
 # Create a single instance of CryptContext for better performance and thread safety.
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_token = OAuth2PasswordBearer(tokenUrl="/login/access-token/")
+# bcrypt releases the GIL, so a few dedicated threads hash in parallel without holding up the event loop.
+# Hashes beyond the cap are queued instead of competing with the Kuma calls for the CPU.
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+)
 
 
-def authenticate(user: UserCreate, password: str) -> Optional[UserResponse]:
+async def run_password_hashing(func: Callable[..., Any], *args) -> Any:
+    """Runs a password hashing function in the password executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, func, *args)
+
+
+async def authenticate(user: UserCreate, password: str) -> Optional[UserResponse]:
     if not user:
         return None
 
-    if not verify_password(password, user.password_hash):
+    if not await run_password_hashing(verify_password, password, user.password_hash):
         return None
 
     return user
 
 
 def create_access_token(
-        subject: Union[str, Any], expire_delta: Optional[timedelta] = None
+    subject: Union[str, Any], expire_delta: Optional[timedelta] = None
 ) -> str:
     """Create an access token with an expiration date.
 
@@ -35,7 +48,7 @@ def create_access_token(
     """
     # Calculate the expiration time
     expire = datetime.utcnow() + (
-            expire_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE)
+        expire_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE)
     )
 
     # Create the JWT payload
@@ -69,6 +82,8 @@ async def ensure_admin_exists() -> User:
     if not admin:
         admin = await User.create(
             username="admin",
-            password_hash=hash_password(settings.ADMIN_PASSWORD)
+            password_hash=await run_password_hashing(
+                hash_password, settings.ADMIN_PASSWORD
+            ),
         )
     return admin
@@ -0,0 +1,53 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from .schemas import JWTData
+
+
+class VerifiedTokenCache:
+    """Remembers the access tokens whose signature has been verified, the least recently used are dropped first.
+
+    Entries are keyed by the SHA-256 digest of the token and are removed once the token expires.
+
+    :param max_size: Maximum number of tokens kept, 0 disables the cache.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # digest -> (token data, expiration as epoch time or None)
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[JWTData]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            data, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def put(self, token: str, data: JWTData, expires_at: Optional[float]) -> None:
+        if self.max_size <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (data, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -23,6 +23,21 @@ class Settings(BaseSettings):
     KUMA_USERNAME: str = os.environ.get("KUMA_USERNAME")
     KUMA_PASSWORD: str = os.environ.get("KUMA_PASSWORD")
     KUMA_WAIT_EVENTS: float = os.environ.get("KUMA_WAIT_EVENTS", 0.2)
+    KUMA_POOL_MAX_SIZE: int = os.environ.get("KUMA_POOL_MAX_SIZE", 10)
+    KUMA_POOL_IDLE_TIMEOUT: float = os.environ.get(
+        "KUMA_POOL_IDLE_TIMEOUT", 300
+    )  # 5 minutes
+    KUMA_DASHBOARD_TIMEOUT: float = os.environ.get("KUMA_DASHBOARD_TIMEOUT", 5)
+    KUMA_READY_TIMEOUT: float = os.environ.get("KUMA_READY_TIMEOUT", 1)
+    KUMA_EXECUTOR_MAX_WORKERS: int = os.environ.get("KUMA_EXECUTOR_MAX_WORKERS", 32)
+    KUMA_UPSTREAM_CONCURRENCY: int = os.environ.get("KUMA_UPSTREAM_CONCURRENCY", 16)
+    KUMA_HTTP_POOL_SIZE: int = os.environ.get("KUMA_HTTP_POOL_SIZE", 10)
+    KUMA_BULK_CONCURRENCY: int = os.environ.get("KUMA_BULK_CONCURRENCY", 8)
+
+    KUMA_TOKEN_TTL: float = os.environ.get("KUMA_TOKEN_TTL", 60 * 60)  # 1 hour
+    PASSWORD_HASH_WORKERS: int = os.environ.get("PASSWORD_HASH_WORKERS", 2)
+    JWT_CACHE_SIZE: int = os.environ.get("JWT_CACHE_SIZE", 1024)
+    RESPONSE_CACHE_TTL: float = os.environ.get("RESPONSE_CACHE_TTL", 60)
 
     ADMIN_PASSWORD: str = os.environ.get("ADMIN_PASSWORD")
 
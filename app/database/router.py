@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from config import logger as logging
 from auth.schemas import JWTSession
 from auth.dependencies import get_jwt_session
+from utils.executor import run_blocking
 
 router = APIRouter(redirect_slashes=True)
 
@@ -10,7 +11,7 @@ router = APIRouter(redirect_slashes=True)
 @router.get("/size", description="Get database size")
 async def get_db_size(s: JWTSession = Depends(get_jwt_session)):
     try:
-        resp = s.api.get_database_size()
+        resp = await run_blocking(s.api.get_database_size)
         return {**resp, "unit": "octet"}
     except Exception as e:
         logging.fatal(e)
@@ -20,7 +21,7 @@ async def get_db_size(s: JWTSession = Depends(get_jwt_session)):
 @router.post("/shrink", description="Shrink database")
 async def shrink_db(s: JWTSession = Depends(get_jwt_session)):
     try:
-        details = s.api.shrink_database()
+        details = await run_blocking(s.api.shrink_database)
         return {"message": "DB Shrinked", "details": details}
     except Exception as e:
         logging.fatal(e)
@@ -1,16 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from uptime_kuma_api import Event
 
 from config import logger as logging
 from auth.schemas import JWTSession
 from auth.dependencies import get_jwt_session
+from state import state_api
+from utils.response_cache import response_cache
 
 router = APIRouter(redirect_slashes=True)
 
 
 @router.get("", description="Get information about the Uptime Kuma API")
-async def get_info(s: JWTSession = Depends(get_jwt_session)):
+async def get_info(request: Request, s: JWTSession = Depends(get_jwt_session)):
     try:
-        return s.api.info()
+        api = state_api(s)
+        return await response_cache.get(
+            "info", api, Event.INFO, api.info, request=request
+        )
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
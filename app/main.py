@@ -16,6 +16,7 @@ import info
 import settings
 import maintenances
 import statuspages
+import metrics
 
 app = FastAPI(title=app_settings.PROJECT_NAME)
 app.router.redirect_slashes = True
@@ -32,6 +33,7 @@ app.include_router(maintenances.router, prefix="/maintenances", tags=["Maintenan
 app.include_router(tags.router, prefix="/tags", tags=["Tags"])
 app.include_router(cert.router, prefix="/cert-info", tags=["Certificates Info"])
 app.include_router(info.router, prefix="/info", tags=["Server Information"])
+app.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
 
 
 @app.on_event("startup")
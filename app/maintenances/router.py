@@ -1,29 +1,55 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Path
-from uptime_kuma_api import UptimeKumaException
-from .schemas import Maintenance, MaintenanceUpdate, MonitorMaintenance, StatusPageMaintenance
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from uptime_kuma_api import Event, UptimeKumaException
+from .schemas import (
+    Maintenance,
+    MaintenanceUpdate,
+    MonitorMaintenance,
+    StatusPageMaintenance,
+)
 from auth.schemas import JWTSession
 from auth.dependencies import get_jwt_session
 from config import logger as logging
 from .raises import raise_maintenance_not_found
+from utils.etag import conditional_get, expected_revision
+from utils.executor import run_blocking
+from utils.response_cache import response_cache
+from state import state_api
 
 router = APIRouter(redirect_slashes=True)
 
 
 @router.get("", description="Get all maintenances")
-async def get_maintenances(s: JWTSession = Depends(get_jwt_session)):
+async def get_maintenances(request: Request, s: JWTSession = Depends(get_jwt_session)):
     try:
-        return s.api.get_maintenances()
+        api = state_api(s)
+        return await response_cache.get(
+            "maintenances",
+            api,
+            Event.MAINTENANCE_LIST,
+            api.get_maintenances,
+            request=request,
+        )
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
 
 
 @router.get("/{maintenance_id}", description="Get maintenances by ID")
-async def get_maintenance(maintenance_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
+async def get_maintenance(
+    request: Request,
+    response: Response,
+    maintenance_id: int = Path(...),
+    s: JWTSession = Depends(get_jwt_session),
+):
     try:
-        return s.api.get_maintenance(maintenance_id)
+        api = state_api(s)
+        # Kuma pushes the maintenance list after every change of a maintenance
+        unchanged = conditional_get(request, response, api, Event.MAINTENANCE_LIST)
+        if unchanged is not None:
+            return unchanged
+        return await run_blocking(api.get_maintenance, maintenance_id)
     except UptimeKumaException as e:
         logging.info(e)
         raise_maintenance_not_found()
@@ -33,9 +59,11 @@ async def get_maintenance(maintenance_id: int = Path(...), s: JWTSession = Depen
 
 
 @router.post("", description="Create a maintenances")
-async def create_maintenance(maintenance: Maintenance, s: JWTSession = Depends(get_jwt_session)):
+async def create_maintenance(
+    maintenance: Maintenance, s: JWTSession = Depends(get_jwt_session)
+):
     try:
-        return s.api.add_maintenance(**maintenance.dict())
+        return await run_blocking(s.api.add_maintenance, **maintenance.dict())
     except TypeError as e:
         logging.error(e)
         raise HTTPException(422, str(e))
@@ -46,14 +74,27 @@ async def create_maintenance(maintenance: Maintenance, s: JWTSession = Depends(g
 
 @router.patch("/{maintenance_id}", description="Update a specific maintenances")
 async def update_maintenance(
-        maintenance: MaintenanceUpdate,
-        maintenance_id: int = Path(...),
-        s: JWTSession = Depends(get_jwt_session)
+    request: Request,
+    maintenance: MaintenanceUpdate,
+    maintenance_id: int = Path(...),
+    s: JWTSession = Depends(get_jwt_session),
 ):
+    # the client sends the ETag of its read in If-Match, the edit is refused if the maintenance changed since then
+    api = state_api(s)
+    revision = expected_revision(request, api, Event.MAINTENANCE_LIST)
     try:
         return {
-            **s.api.edit_maintenance(id_=maintenance_id, **maintenance.dict(exclude_unset=True)),
-            "maintenances": maintenance.dict(exclude_unset=True)
+            **(
+                await run_blocking(
+                    s.api.edit_maintenance,
+                    id_=maintenance_id,
+                    refresh=False,
+                    # the revisions of the subscriber do not apply to the list of the session
+                    revision=revision if api is s.api else None,
+                    **maintenance.dict(exclude_unset=True)
+                )
+            ),
+            "maintenances": maintenance.dict(exclude_unset=True),
         }
     except UptimeKumaException as e:
         logging.info(e)
@@ -67,10 +108,12 @@ async def update_maintenance(
 
 
 @router.delete("/{maintenance_id}", description="Delete a specific Maintenance")
-async def delete_maintenance(maintenance_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
+async def delete_maintenance(
+    maintenance_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
+):
     try:
         # kinda dumb the api doesnt check if th id exists he just sends an event
-        return s.api.delete_maintenance(maintenance_id)
+        return await run_blocking(s.api.delete_maintenance, maintenance_id)
     except UptimeKumaException as e:
         logging.info(e)
         raise_maintenance_not_found()
@@ -80,9 +123,11 @@ async def delete_maintenance(maintenance_id: int = Path(...), s: JWTSession = De
 
 
 @router.post("/{maintenance_id}/pause", description="Pause a specific maintenances")
-async def pause_maintenance(maintenance_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
+async def pause_maintenance(
+    maintenance_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
+):
     try:
-        return s.api.pause_maintenance(maintenance_id)
+        return await run_blocking(s.api.pause_maintenance, maintenance_id)
     except UptimeKumaException as e:
         logging.info(e)
         raise_maintenance_not_found()
@@ -92,9 +137,11 @@ async def pause_maintenance(maintenance_id: int = Path(...), s: JWTSession = Dep
 
 
 @router.post("/{maintenance_id}/resume", description="Resume a specific maintenances")
-async def resume_maintenance(maintenance_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
+async def resume_maintenance(
+    maintenance_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
+):
     try:
-        return s.api.resume_maintenance(maintenance_id)
+        return await run_blocking(s.api.resume_maintenance, maintenance_id)
     except UptimeKumaException as e:
         logging.info(e)
         raise_maintenance_not_found()
@@ -105,11 +152,10 @@ async def resume_maintenance(maintenance_id: int = Path(...), s: JWTSession = De
 
 @router.get("/{maintenance_id}/monitors", description="Get monitors to a maintenances")
 async def add_monitor_maintenance(
-        maintenance_id: int = Path(...),
-        s: JWTSession = Depends(get_jwt_session)
+    maintenance_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
 ) -> List[dict]:
     try:
-        return s.api.get_monitor_maintenance(maintenance_id)
+        return await run_blocking(s.api.get_monitor_maintenance, maintenance_id)
     except UptimeKumaException as e:
         logging.info(e)
         raise_maintenance_not_found()
@@ -118,15 +164,17 @@ async def add_monitor_maintenance(
         raise HTTPException(500, str(e))
 
 
-@router.post("/{maintenance_id}/monitors", description="Adds monitors to a maintenances")
+@router.post(
+    "/{maintenance_id}/monitors", description="Adds monitors to a maintenances"
+)
 async def add_monitor_maintenance(
-        monitors: List[MonitorMaintenance],
-        maintenance_id: int = Path(...),
-        s: JWTSession = Depends(get_jwt_session)
+    monitors: List[MonitorMaintenance],
+    maintenance_id: int = Path(...),
+    s: JWTSession = Depends(get_jwt_session),
 ):
     try:
         mns = [m.dict() for m in monitors]
-        return s.api.add_monitor_maintenance(maintenance_id, mns)
+        return await run_blocking(s.api.add_monitor_maintenance, maintenance_id, mns)
     except UptimeKumaException as e:
         logging.info(e)
         raise HTTPException(404, {"message": "Maintenance or monitors not found!"})
@@ -135,13 +183,14 @@ async def add_monitor_maintenance(
         raise HTTPException(500, str(e))
 
 
-@router.get("/{maintenance_id}/status-pages", description="Get status pages to a maintenances")
+@router.get(
+    "/{maintenance_id}/status-pages", description="Get status pages to a maintenances"
+)
 async def get_status_page_maintenance(
-        maintenance_id: int = Path(...),
-        s: JWTSession = Depends(get_jwt_session)
+    maintenance_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
 ) -> List[dict]:
     try:
-        return s.api.get_status_page_maintenance(maintenance_id)
+        return await run_blocking(s.api.get_status_page_maintenance, maintenance_id)
     except UptimeKumaException as e:
         logging.info(e)
         raise_maintenance_not_found()
@@ -150,15 +199,19 @@ async def get_status_page_maintenance(
         raise HTTPException(500, str(e))
 
 
-@router.post("/{maintenance_id}/status-pages", description="Adds status pages to a maintenances")
+@router.post(
+    "/{maintenance_id}/status-pages", description="Adds status pages to a maintenances"
+)
 async def add_status_page_maintenance(
-        status_pages: List[StatusPageMaintenance],
-        maintenance_id: int = Path(...),
-        s: JWTSession = Depends(get_jwt_session)
+    status_pages: List[StatusPageMaintenance],
+    maintenance_id: int = Path(...),
+    s: JWTSession = Depends(get_jwt_session),
 ):
     try:
         sps = [s.dict() for s in status_pages]
-        return s.api.add_status_page_maintenance(maintenance_id, sps)
+        return await run_blocking(
+            s.api.add_status_page_maintenance, maintenance_id, sps
+        )
     except UptimeKumaException as e:
         logging.info(e)
         raise HTTPException(404, {"message": "Maintenance or status pages not found!"})
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Depends
+
+from auth.schemas import JWTSession
+from auth.dependencies import get_jwt_session
+from utils.executor import kuma_executor
+
+router = APIRouter(redirect_slashes=True)
+
+
+@router.get("/executor", description="Get the queue depths of the Kuma executor")
+async def get_executor_metrics(_s: JWTSession = Depends(get_jwt_session)):
+    return kuma_executor.metrics()
@@ -1,101 +1,305 @@
-from fastapi import APIRouter, Depends, HTTPException, Path
-from uptime_kuma_api import UptimeKumaException
+from functools import partial
 
-from .schemas import Monitor, MonitorUpdate, MonitorTag
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from uptime_kuma_api import (
+    Event,
+    MonitorStatus,
+    MonitorType,
+    Timeout,
+    UptimeKumaException,
+)
+
+from .schemas import Monitor, MonitorOperation, MonitorUpdate, MonitorTag
 from auth.schemas import JWTSession
 from auth.dependencies import get_jwt_session
-from config import logger as logging
+from config import settings, logger as logging
 from .raises import raise_monitor_not_found
-from pings.utils import get_avg_pings
-from uptimes.utils import get_uptimes
+from .utils import (
+    bulk_operation,
+    cert_summary,
+    gather_sources,
+    get_monitor_cert,
+    project,
+)
+from pings.utils import get_monitor_avg_ping
+from uptimes.utils import get_monitor_uptimes
+from state import subscriber, state_api
+from utils.executor import run_blocking
+from utils.etag import conditional_get, expected_revision
+from utils.response_cache import response_cache
 
 router = APIRouter(redirect_slashes=True)
 
 
-@router.get("", description="Get all monitors")
-async def get_monitors(s: JWTSession = Depends(get_jwt_session)):
+@router.get(
+    "", description="Get all monitors, optionally filtered, projected and paginated"
+)
+async def get_monitors(
+    request: Request,
+    response: Response,
+    type: Optional[MonitorType] = None,
+    active: Optional[bool] = None,
+    tag: Optional[int] = Query(None, description="Tag ID"),
+    parent: Optional[int] = Query(
+        None, description="Group monitor ID, 0 for monitors without a group"
+    ),
+    status: Optional[int] = Query(
+        None,
+        ge=MonitorStatus.DOWN,
+        le=MonitorStatus.MAINTENANCE,
+        description="Status of the last heartbeat: 0 down, 1 up, 2 pending, 3 maintenance",
+    ),
+    name: Optional[str] = Query(None, description="Case-insensitive name prefix"),
+    fields: Optional[str] = Query(
+        None, description="Comma separated fields to return, e.g. id,name,type"
+    ),
+    cursor: Optional[int] = Query(None, description="next_cursor of the previous page"),
+    limit: Optional[int] = Query(None, ge=1),
+    s: JWTSession = Depends(get_jwt_session),
+):
     try:
-        return {"monitors": s.api.get_monitors()}
+        api = state_api(s)
+        if status is not None:
+            status = MonitorStatus(status)
+        filters = dict(
+            type=type,
+            active=active,
+            tag_id=tag,
+            parent=parent,
+            status=status,
+            name_prefix=name,
+        )
+        if all(value is None for value in (*filters.values(), fields, cursor, limit)):
+            return await response_cache.get(
+                "monitors",
+                api,
+                Event.MONITOR_LIST,
+                lambda: {"monitors": api.get_monitors(refresh=False)},
+                request=request,
+            )
+
+        if status is None:
+            # the status filter depends on the heartbeats
+            unchanged = conditional_get(request, response, api, Event.MONITOR_LIST)
+            if unchanged is not None:
+                return unchanged
+        monitors = await run_blocking(
+            api.find_monitors, after=cursor, limit=limit, **filters
+        )
+        if fields:
+            monitors = project(
+                monitors,
+                [field.strip() for field in fields.split(",") if field.strip()],
+            )
+        result = {"monitors": monitors}
+        if limit is not None:
+            result["next_cursor"] = (
+                monitors[-1]["id"] if len(monitors) == limit else None
+            )
+        return result
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
 
 
-@router.get("/{monitor_id}", description="Get monitor by ID")
-async def get_monitor(monitor_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)) -> Monitor:
+@router.get(
+    "/indexes",
+    description="Get the monitor IDs by type, active state, tag, parent and status",
+)
+async def get_monitor_indexes(s: JWTSession = Depends(get_jwt_session)):
     try:
-        return s.api.get_monitor(monitor_id)
-    except UptimeKumaException as e:
-        logging.info(e)
-        raise_monitor_not_found()
+        # the status index changes with every heartbeat, it is not cached
+        return await run_blocking(state_api(s).get_monitor_indexes)
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
 
 
-@router.get("/{monitor_id}/dashboard", description="Get monitors dashboard data")
-async def get_monitor_dashboard(
-        monitor_id: int = Path(...),
-        heartbeat_hours: int = 1,
-        s: JWTSession = Depends(get_jwt_session)
+@router.get(
+    "/status",
+    description="Get the status and time of the last heartbeat of all monitors",
+)
+async def get_monitor_statuses(
+    request: Request, response: Response, s: JWTSession = Depends(get_jwt_session)
 ):
     try:
-        monitor = s.api.get_monitor(monitor_id)
-    except UptimeKumaException as e:
-        logging.info(e)
-        raise_monitor_not_found()
+        api = state_api(s)
+        unchanged = conditional_get(request, response, api, Event.HEARTBEAT_LIST)
+        if unchanged is not None:
+            return unchanged
+        return {"statuses": await run_blocking(api.get_monitor_statuses)}
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
 
-    response = {
-        "monitor": monitor,
-        "avgResponseTime": None,
-        "uptimes": {
-            "24": None,
-            "720": None,
-        },
-        "cert": None,
-    }
 
+@router.get(
+    "/beats",
+    description="Get the beats of many monitors in the last N hours ( by default its 1 hour). Beats answered from the "
+    "heartbeats Kuma pushed have no id and down_count, they are null",
+)
+async def monitors_beats(
+    ids: List[int] = Query(..., description="Monitor IDs"),
+    hours: int = 1,
+    s: JWTSession = Depends(get_jwt_session),
+):
     try:
-        pings = await get_avg_pings(s.api)
-        if monitor_id in pings:
-            response["avgResponseTime"] = pings[monitor_id]
+        # only the monitors whose pushed heartbeats do not cover the period are requested, concurrently
+        return {
+            "beats": await run_blocking(
+                state_api(s).get_monitor_beats_many, ids, hours, refresh=False
+            )
+        }
+    except UptimeKumaException as e:
+        logging.info(e)
+        raise_monitor_not_found()
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
 
-    try:
-        uptimes = await get_uptimes(s.api)
-        if monitor_id in uptimes:
-            response["uptimes"] = uptimes[monitor_id]
-    except Exception as e:
-        logging.fatal(e)
-        raise HTTPException(500, str(e))
 
-    try:
-        beats = s.api.get_monitor_beats(monitor_id, heartbeat_hours)
-        response["heartbeats"] = beats
-    except Exception as e:
-        logging.fatal(e)
-        raise HTTPException(500, str(e))
+@router.get("/dashboard", description="Get dashboard data of all monitors")
+async def get_monitors_dashboard(
+    ids: Optional[List[int]] = Query(None),
+    beats: int = 10,
+    s: JWTSession = Depends(get_jwt_session),
+):
+    api = state_api(s)
+    results, errors = await gather_sources(
+        {
+            "monitors": partial(api.get_monitors, refresh=False),
+            "heartbeats": partial(api.get_heartbeats, limit=max(beats, 1)),
+            "avgResponseTime": api.avg_ping,
+            "uptimes": api.uptime,
+            "cert": api.cert_info,
+        },
+        timeout=settings.KUMA_DASHBOARD_TIMEOUT,
+    )
+
+    if "monitors" in errors:
+        logging.fatal(errors["monitors"])
+        raise HTTPException(500, str(errors["monitors"]))
+
+    # the maps are empty lists if there are no monitors
+    heartbeats = results.get("heartbeats") or {}
+    pings = results.get("avgResponseTime") or {}
+    uptimes = results.get("uptimes") or {}
+    certs = results.get("cert") or {}
+
+    dashboards = []
+    for monitor in results["monitors"]:
+        monitor_id = monitor["id"]
+        if ids is not None and monitor_id not in ids:
+            continue
+        monitor_beats = heartbeats.get(monitor_id, [])
+        dashboards.append(
+            {
+                "monitor": monitor,
+                "status": monitor_beats[-1]["status"] if monitor_beats else None,
+                "avgResponseTime": pings.get(monitor_id),
+                "uptimes": uptimes.get(monitor_id)
+                or {
+                    "24": None,
+                    "720": None,
+                },
+                "cert": cert_summary(certs.get(monitor_id)),
+                "heartbeats": monitor_beats[-beats:] if beats > 0 else [],
+            }
+        )
+
+    response = {"monitors": dashboards}
+    if errors:
+        # answer with the sources that are available
+        for name, error in errors.items():
+            logging.error(f"Monitors dashboard: {name} failed: {error!r}")
+        response["errors"] = {
+            name: str(error) or type(error).__name__ for name, error in errors.items()
+        }
+    return response
 
+
+@router.get("/{monitor_id}", description="Get monitor by ID")
+async def get_monitor(
+    request: Request,
+    response: Response,
+    monitor_id: int = Path(...),
+    s: JWTSession = Depends(get_jwt_session),
+) -> Monitor:
     try:
-        info = s.api.cert_info()
-        if monitor_id in info:
-            response["cert"] = info[monitor_id]
+        api = state_api(s)
+        unchanged = conditional_get(request, response, api, Event.MONITOR_LIST)
+        if unchanged is not None:
+            return unchanged
+        return await run_blocking(api.get_monitor, monitor_id, refresh=False)
+    except UptimeKumaException as e:
+        logging.info(e)
+        raise_monitor_not_found()
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
 
+
+@router.get(
+    "/{monitor_id}/dashboard",
+    description="Get monitors dashboard data. Heartbeats answered from the heartbeats Kuma pushed have no id and "
+    "down_count, they are null",
+)
+async def get_monitor_dashboard(
+    monitor_id: int = Path(...),
+    heartbeat_hours: int = 1,
+    s: JWTSession = Depends(get_jwt_session),
+):
+    api = state_api(s)
+    results, errors = await gather_sources(
+        {
+            "monitor": partial(api.get_monitor, monitor_id, refresh=False),
+            "avgResponseTime": partial(get_monitor_avg_ping, api, monitor_id),
+            "uptimes": partial(get_monitor_uptimes, api, monitor_id),
+            "heartbeats": partial(
+                api.get_monitor_beats, monitor_id, heartbeat_hours, refresh=False
+            ),
+            "cert": partial(get_monitor_cert, api, monitor_id),
+        },
+        timeout=settings.KUMA_DASHBOARD_TIMEOUT,
+    )
+
+    error = errors.get("monitor")
+    if isinstance(error, UptimeKumaException) and not isinstance(error, Timeout):
+        logging.info(error)
+        raise_monitor_not_found()
+
+    response = {
+        "monitor": results.get("monitor"),
+        "avgResponseTime": results.get("avgResponseTime"),
+        "uptimes": results.get("uptimes")
+        or {
+            "24": None,
+            "720": None,
+        },
+        "cert": results.get("cert"),
+        "heartbeats": results.get("heartbeats"),
+    }
+    if errors:
+        # answer with the sources that are available
+        for name, error in errors.items():
+            logging.error(
+                f"Dashboard of monitor {monitor_id}: {name} failed: {error!r}"
+            )
+        response["errors"] = {
+            name: str(error) or type(error).__name__ for name, error in errors.items()
+        }
+
     return response
 
 
 @router.get("/{monitor_id}/cert", description="Get monitors certificate info")
-async def get_monitor_cert_info(monitor_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
+async def get_monitor_cert_info(
+    monitor_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
+):
     try:
-        info = s.api.cert_info()
+        info = await run_blocking(state_api(s).cert_info)
         if monitor_id not in info:
             raise_monitor_not_found()
         return info[monitor_id]
@@ -110,7 +314,7 @@ async def get_monitor_cert_info(monitor_id: int = Path(...), s: JWTSession = Dep
 @router.post("", description="Create a monitor")
 async def create_monitor(monitor: Monitor, s: JWTSession = Depends(get_jwt_session)):
     try:
-        return s.api.add_monitor(**monitor.dict())
+        return await run_blocking(s.api.add_monitor, **monitor.dict())
     except TypeError as e:
         logging.error(e)
         raise HTTPException(422, str(e))
@@ -119,16 +323,48 @@ async def create_monitor(monitor: Monitor, s: JWTSession = Depends(get_jwt_sessi
         raise HTTPException(500, str(e))
 
 
+@router.post(
+    "/bulk",
+    description="Create, update, delete, pause and resume many monitors at once",
+)
+async def bulk_monitors(
+    operations: List[MonitorOperation], s: JWTSession = Depends(get_jwt_session)
+):
+    try:
+        results = await run_blocking(
+            s.api.run_monitor_operations,
+            [bulk_operation(operation) for operation in operations],
+            concurrency=settings.KUMA_BULK_CONCURRENCY,
+        )
+        return {"results": results}
+    except Exception as e:
+        logging.fatal(e)
+        raise HTTPException(500, str(e))
+
+
 @router.patch("/{monitor_id}", description="Update a specific monitor")
 async def update_monitor(
-        monitor: MonitorUpdate,
-        monitor_id: int = Path(...),
-        s: JWTSession = Depends(get_jwt_session)
+    request: Request,
+    monitor: MonitorUpdate,
+    monitor_id: int = Path(...),
+    s: JWTSession = Depends(get_jwt_session),
 ):
+    # the client sends the ETag of its read in If-Match, the edit is refused if the monitor changed since then
+    api = state_api(s)
+    revision = expected_revision(request, api, Event.MONITOR_LIST)
     try:
         return {
-            **s.api.edit_monitor(id_=monitor_id, **monitor.dict(exclude_unset=True)),
-            "monitor": monitor.dict(exclude_unset=True)
+            **(
+                await run_blocking(
+                    s.api.edit_monitor,
+                    id_=monitor_id,
+                    refresh=False,
+                    # the revisions of the subscriber do not apply to the list of the session
+                    revision=revision if api is s.api else None,
+                    **monitor.dict(exclude_unset=True),
+                )
+            ),
+            "monitor": monitor.dict(exclude_unset=True),
         }
     except UptimeKumaException as e:
         logging.info(e)
@@ -142,10 +378,12 @@ async def update_monitor(
 
 
 @router.delete("/{monitor_id}", description="Delete a specific monitor")
-async def delete_monitor(monitor_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
+async def delete_monitor(
+    monitor_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
+):
     try:
         # kinda dumb the api doesnt check if th id exists he just sends an event
-        return s.api.delete_monitor(monitor_id)
+        return await run_blocking(s.api.delete_monitor, monitor_id)
     except UptimeKumaException as e:
         logging.info(e)
         raise_monitor_not_found()
@@ -155,9 +393,11 @@ async def delete_monitor(monitor_id: int = Path(...), s: JWTSession = Depends(ge
 
 
 @router.post("/{monitor_id}/pause", description="Pause a specific monitor")
-async def pause_monitor(monitor_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
+async def pause_monitor(
+    monitor_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
+):
     try:
-        return s.api.pause_monitor(monitor_id)
+        return await run_blocking(s.api.pause_monitor, monitor_id)
     except UptimeKumaException as e:
         logging.info(e)
         raise_monitor_not_found()
@@ -167,9 +407,11 @@ async def pause_monitor(monitor_id: int = Path(...), s: JWTSession = Depends(get
 
 
 @router.post("/{monitor_id}/resume", description="Resume a specific monitor")
-async def resume_monitor(monitor_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
+async def resume_monitor(
+    monitor_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
+):
     try:
-        return s.api.resume_monitor(monitor_id)
+        return await run_blocking(s.api.resume_monitor, monitor_id)
     except UptimeKumaException as e:
         logging.info(e)
         raise_monitor_not_found()
@@ -178,14 +420,20 @@ async def resume_monitor(monitor_id: int = Path(...), s: JWTSession = Depends(ge
         raise HTTPException(500, str(e))
 
 
-@router.get("/{monitor_id}/beats", description="Get monitor beats in the last N hours ( by default its 1 hour) ")
+@router.get(
+    "/{monitor_id}/beats",
+    description="Get monitor beats in the last N hours ( by default its 1 hour). Beats answered from the heartbeats "
+    "Kuma pushed have no id and down_count, they are null",
+)
 async def monitor_beats(
-        monitor_id: int = Path(...),
-        hours: int = 1,
-        s: JWTSession = Depends(get_jwt_session)
+    monitor_id: int = Path(...),
+    hours: int = 1,
+    s: JWTSession = Depends(get_jwt_session),
 ):
     try:
-        return s.api.get_monitor_beats(monitor_id, hours)
+        return await run_blocking(
+            state_api(s).get_monitor_beats, monitor_id, hours, refresh=False
+        )
     except UptimeKumaException as e:
         logging.info(e)
         raise_monitor_not_found()
@@ -194,14 +442,20 @@ async def monitor_beats(
         raise HTTPException(500, str(e))
 
 
-@router.post("/{monitor_id}/tag", description="Add an already created tag to a specific monitors")
+@router.post(
+    "/{monitor_id}/tag", description="Add an already created tag to a specific monitors"
+)
 async def add_monitor_tag(
-        tag: MonitorTag,
-        monitor_id: int = Path(...),
-        s: JWTSession = Depends(get_jwt_session)
+    tag: MonitorTag,
+    monitor_id: int = Path(...),
+    s: JWTSession = Depends(get_jwt_session),
 ):
     try:
-        return s.api.add_monitor_tag(monitor_id=monitor_id, **tag.dict())
+        r = await run_blocking(
+            s.api.add_monitor_tag, monitor_id=monitor_id, **tag.dict()
+        )
+        await run_blocking(subscriber.refresh_monitors)
+        return r
     except UptimeKumaException as e:
         logging.info(e)
         raise HTTPException(404, {"message": "Monitor or Tag not found!"})
@@ -212,12 +466,15 @@ async def add_monitor_tag(
 
 @router.delete("/{monitor_id}/tag", description="Delete a tag from a specific monitors")
 async def delete_monitor_tag(
-        tag: MonitorTag,
-        monitor_id: int = Path(...),
-        s: JWTSession = Depends(get_jwt_session)
+    tag: MonitorTag,
+    monitor_id: int = Path(...),
+    s: JWTSession = Depends(get_jwt_session),
 ):
     try:
-        msg = s.api.delete_monitor_tag(monitor_id=monitor_id, **tag.dict())
+        msg = await run_blocking(
+            s.api.delete_monitor_tag, monitor_id=monitor_id, **tag.dict()
+        )
+        await run_blocking(subscriber.refresh_monitors)
     except UptimeKumaException as e:
         logging.info(e)
         raise HTTPException(404, {"message": "Monitor or Tag not found!"})
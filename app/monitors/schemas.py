@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
@@ -128,3 +129,19 @@ class MonitorUpdate(Monitor):
 class MonitorTag(BaseModel):
     tag_id: int
     value: Optional[str] = ""
+
+
+class MonitorAction(str, Enum):
+    ADD = "add"
+    EDIT = "edit"
+    DELETE = "delete"
+    PAUSE = "pause"
+    RESUME = "resume"
+
+
+class MonitorOperation(BaseModel):
+    action: MonitorAction
+    # the monitor of every action except add
+    id: Optional[int] = None
+    # the fields of add and edit
+    monitor: Optional[MonitorUpdate] = None
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from uptime_kuma_api import UptimeKumaApi
+from utils.executor import run_blocking
+from .schemas import Monitor, MonitorAction, MonitorOperation
+
+
+def get_monitor_cert(api: UptimeKumaApi, monitor_id: int):
+    info = api.cert_info()
+    return info.get(monitor_id) if info else None
+
+
+async def gather_sources(
+    sources: Dict[str, Callable[[], Any]], timeout: float
+) -> Tuple[Dict[str, Any], Dict[str, BaseException]]:
+    """Runs the blocking data sources concurrently in the Kuma executor.
+
+    A source that fails or does not answer within the timeout is left out of the results
+    and reported in the errors instead. A source that is still waiting for a slot of the
+    executor is not started anymore. One that already runs cannot be interrupted, it keeps
+    its slot until the client call returns, so the work left behind by timeouts never exceeds
+    the upstream limit of the executor and each call ends after the client timeout at the latest.
+    """
+
+    async def run(source: Callable[[], Any]) -> Any:
+        return await asyncio.wait_for(run_blocking(source), timeout)
+
+    names = list(sources)
+    outcomes = await asyncio.gather(
+        *(run(sources[name]) for name in names), return_exceptions=True
+    )
+
+    results = {}
+    errors = {}
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, BaseException):
+            errors[name] = outcome
+        else:
+            results[name] = outcome
+    return results, errors
+
+
+def project(monitors: List[dict], fields: List[str]) -> List[dict]:
+    # the id is always returned, it is the cursor of the pagination
+    fields = ["id"] + [field for field in fields if field != "id"]
+    return [
+        {field: monitor[field] for field in fields if field in monitor}
+        for monitor in monitors
+    ]
+
+
+def cert_summary(info: Optional[dict]) -> Optional[dict]:
+    # the certificate chain is left out
+    if not info:
+        return None
+    cert = info.get("certInfo") or {}
+    return {
+        "valid": info.get("valid"),
+        "subject": cert.get("subject"),
+        "issuer": cert.get("issuer"),
+        "validFrom": cert.get("validFrom"),
+        "validTo": cert.get("validTo"),
+        "daysRemaining": cert.get("daysRemaining"),
+    }
+
+
+def bulk_operation(operation: MonitorOperation) -> dict:
+    """Arguments of an operation of `run_monitor_operations`, the client validates them."""
+    fields = operation.monitor.dict(exclude_unset=True) if operation.monitor else {}
+    if (
+        operation.action == MonitorAction.ADD
+        and fields.get("type")
+        and fields.get("name")
+    ):
+        # new monitors get the defaults of POST /monitors, without type or name the client reports the error
+        fields = Monitor(**fields).dict()
+    if operation.id is not None:
+        fields["id"] = operation.id
+    return {"action": operation.action.value, **fields}
@@ -1,27 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from uptime_kuma_api import Event
 
 from config import logger as logging
 from auth.schemas import JWTSession
 from auth.dependencies import get_jwt_session
-from .utils import get_avg_pings
+from state import state_api
+from utils.etag import conditional_get
+from utils.executor import run_blocking
+from .utils import wait_for_pings
 from monitors.raises import raise_monitor_not_found
 
 router = APIRouter(redirect_slashes=True)
 
 
 @router.get("", description="Get average pings")
-async def get_avg_ping(s: JWTSession = Depends(get_jwt_session)):
+async def get_avg_ping(
+    request: Request, response: Response, s: JWTSession = Depends(get_jwt_session)
+):
     try:
-        return await get_avg_pings(s.api)
+        api = state_api(s)
+        # the revision is read once the data of every monitor has arrived
+        await run_blocking(wait_for_pings, api)
+        unchanged = conditional_get(request, response, api, Event.AVG_PING)
+        if unchanged is not None:
+            return unchanged
+        return await run_blocking(api.avg_ping)
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
 
 
 @router.get("/{monitor_id}", description="Get average pings by monitors ID")
-async def get_avg_ping_by_monitor_id(monitor_id: int, s: JWTSession = Depends(get_jwt_session)):
+async def get_avg_ping_by_monitor_id(
+    request: Request,
+    response: Response,
+    monitor_id: int,
+    s: JWTSession = Depends(get_jwt_session),
+):
     try:
-        pings = await get_avg_pings(s.api)
+        api = state_api(s)
+        # the revision is read once the data of every monitor has arrived
+        await run_blocking(wait_for_pings, api)
+        unchanged = conditional_get(request, response, api, Event.AVG_PING)
+        if unchanged is not None:
+            return unchanged
+        pings = await run_blocking(api.avg_ping)
 
         if monitor_id not in pings:
             raise_monitor_not_found()
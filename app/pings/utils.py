@@ -1,13 +1,12 @@
-import time
-from uptime_kuma_api import UptimeKumaApi
+from uptime_kuma_api import Event, UptimeKumaApi
 
+from config import settings
 
-async def get_avg_pings(api: UptimeKumaApi):
+
+def wait_for_pings(api: UptimeKumaApi):
+    api.wait_for_monitor_data(Event.AVG_PING, timeout=settings.KUMA_READY_TIMEOUT)
+
+
+def get_monitor_avg_ping(api: UptimeKumaApi, monitor_id: int):
     pings = api.avg_ping()
-    monitors = api.get_monitors()
-    timeout = 0.1
-    while len(monitors) > len(pings) and timeout < 1:
-        time.sleep(0.1)
-        pings = api.avg_ping()
-        timeout += 0.1
-    return pings
+    return pings.get(monitor_id) if pings else None
@@ -1 +1 @@
-success = {"success": True}
\ No newline at end of file
+success = {"success": True}
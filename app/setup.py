@@ -1,8 +1,36 @@
+import asyncio
+
 from fastapi import FastAPI
 from tortoise import Tortoise
 from auth.security import ensure_admin_exists
+from auth.pool import session_pool
+from auth.security import password_executor
+from config import settings, logger as logging
+from utils.executor import kuma_executor
+from state import subscriber
 import db
 
+POOL_EVICTION_INTERVAL = 30
+SUBSCRIBER_RETRY_INTERVAL = 10
+
+
+async def evict_idle_sessions():
+    while True:
+        await asyncio.sleep(POOL_EVICTION_INTERVAL)
+        session_pool.evict_idle()
+
+
+async def run_subscriber():
+    loop = asyncio.get_running_loop()
+    while True:
+        if subscriber.api is None:
+            try:
+                await loop.run_in_executor(None, subscriber.start)
+                logging.info(f"Subscribed to {settings.KUMA_SERVER}")
+            except Exception as e:
+                logging.error(f"Kuma subscriber error: {e}")
+        await asyncio.sleep(SUBSCRIBER_RETRY_INTERVAL)
+
 
 async def init(app: FastAPI):
     await db.setup()
@@ -10,7 +38,20 @@ async def init(app: FastAPI):
     @app.on_event("startup")
     async def startup_event():
         await ensure_admin_exists()
+        # the event loop only keeps weak references to its tasks
+        app.state.background_tasks = [asyncio.create_task(evict_idle_sessions())]
+        if settings.KUMA_USERNAME:
+            app.state.background_tasks.append(asyncio.create_task(run_subscriber()))
 
     @app.on_event("shutdown")
     async def shutdown_event():
+        tasks = getattr(app.state, "background_tasks", [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # waits for a subscriber start that is still running in the default executor
+        await asyncio.get_running_loop().run_in_executor(None, subscriber.stop)
+        session_pool.close()
+        kuma_executor.shutdown()
+        password_executor.shutdown(wait=False)
         await Tortoise.close_connections()
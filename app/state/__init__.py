@@ -0,0 +1 @@
+from .subscriber import subscriber, state_api
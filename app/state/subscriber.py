@@ -0,0 +1,78 @@
+import threading
+from typing import Optional
+
+from uptime_kuma_api import UptimeKumaApi
+
+from auth.schemas import JWTSession
+from config import settings
+
+
+class KumaSubscriber:
+    """Holds one long-lived, authenticated connection to Kuma.
+
+    Kuma pushes monitor lists, heartbeats, average pings, uptimes and certificate infos to
+    every connection of the logged-in user and the client applies each event to its event
+    store. Once the initial burst after login has settled, reads are answered straight from
+    that in-memory state instead of waiting for Kuma to push it again. The client is thread-safe,
+    so all threads of the Kuma executor share this one connection.
+    """
+
+    def __init__(self):
+        self._api: Optional[UptimeKumaApi] = None
+        self._lock = threading.Lock()
+
+    @property
+    def api(self) -> Optional[UptimeKumaApi]:
+        api = self._api
+        if api is not None and api.sio.connected:
+            return api
+        return None
+
+    def start(self) -> None:
+        with self._lock:
+            if self.api is not None:
+                return
+            self._disconnect()
+
+            api = UptimeKumaApi(
+                settings.KUMA_SERVER,
+                wait_events=settings.KUMA_WAIT_EVENTS,
+                http_pool_size=settings.KUMA_HTTP_POOL_SIZE,
+            )
+            try:
+                api.login(settings.KUMA_USERNAME, settings.KUMA_PASSWORD)
+                # wait once for the initial burst of per monitor events
+                api.get_monitors(refresh=False)
+                api.get_heartbeats()
+                api.avg_ping()
+                api.uptime()
+            except Exception:
+                api.disconnect()
+                raise
+            # from now on the event store is kept up to date by the server
+            api.wait_events = 0
+            self._api = api
+
+    def stop(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def refresh_monitors(self) -> None:
+        # monitor tag changes are not pushed by the server
+        api = self.api
+        if api is not None:
+            api.get_monitors()
+
+    def _disconnect(self) -> None:
+        if self._api is not None:
+            self._api.disconnect()
+            self._api = None
+
+
+subscriber = KumaSubscriber()
+
+
+def state_api(session: JWTSession) -> UptimeKumaApi:
+    """Api to answer reads from: the subscriber's in-memory state while it is connected,
+    the request's own session otherwise."""
+    return subscriber.api or session.api
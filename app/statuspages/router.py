@@ -1,6 +1,6 @@
-from typing import List
+from typing import Any, Callable, List
 from config import logger as logging
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Request, Response
 from auth.schemas import JWTSession
 from auth.dependencies import get_jwt_session
 from .schemas import (
@@ -14,44 +14,70 @@ from .schemas import (
     StatusPage,
     UnpinIncidentResponse,
 )
-from uptime_kuma_api import IncidentStyle, UptimeKumaException
+from uptime_kuma_api import Event, IncidentStyle, UptimeKumaException
 from utils.api import with_exceptions_handling
+from utils.etag import content_etag, is_not_modified, not_modified
+from utils.response_cache import response_cache, serialize
 from response import success
 
 router = APIRouter(redirect_slashes=True)
 
 
 @router.get("", response_model=List[StatusPage], description="Get all status pages")
-async def get_all_status_pages(s: JWTSession = Depends(get_jwt_session)):
-    return await with_exceptions_handling(s.api.get_status_pages)
+async def get_all_status_pages(
+    request: Request, s: JWTSession = Depends(get_jwt_session)
+):
+    # Kuma pushes no event when a status page is saved or deleted, only the session that made the change
+    # updates its copy of the list, so the list is not read from the subscriber
+    return await with_exceptions_handling(
+        response_cache.get,
+        "status-pages",
+        s.api,
+        Event.STATUS_PAGE_LIST,
+        s.api.get_status_pages,
+        List[StatusPage],
+        request,
+    )
+
+
+async def change_status_page(func: Callable[..., Any], *args, **kwargs) -> Any:
+    try:
+        return await with_exceptions_handling(func, *args, **kwargs)
+    finally:
+        response_cache.invalidate("status-pages")
 
 
 @router.get("/{slug}", response_model=StatusPage, description="Get a status page")
-async def get_status_page(slug: str, s: JWTSession = Depends(get_jwt_session)):
-    return await with_exceptions_handling(s.api.get_status_page, slug)
+async def get_status_page(
+    request: Request, slug: str, s: JWTSession = Depends(get_jwt_session)
+):
+    status_page = await with_exceptions_handling(s.api.get_status_page, slug)
+    # saving a status page and posting an incident push no event, the ETag is taken from the body
+    body = serialize(status_page, StatusPage)
+    etag = content_etag(body)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.post("", response_model=AddStatusPageResponse, description="Add a status page")
 async def add_status_page(
-        status_page_data: AddStatusPageRequest,
-        s: JWTSession = Depends(get_jwt_session)
+    status_page_data: AddStatusPageRequest, s: JWTSession = Depends(get_jwt_session)
 ):
-    return await with_exceptions_handling(
+    return await change_status_page(
         s.api.add_status_page, status_page_data.slug, status_page_data.title
     )
 
 
 @router.post(
-    "/{slug}",
-    response_model=SaveStatusPageResponse,
-    description="Save a status page"
+    "/{slug}", response_model=SaveStatusPageResponse, description="Save a status page"
 )
 async def save_status_page(
-        status_page_data: SaveStatusPageRequest,
-        slug: str = Path(...),
-        s: JWTSession = Depends(get_jwt_session),
+    status_page_data: SaveStatusPageRequest,
+    slug: str = Path(...),
+    s: JWTSession = Depends(get_jwt_session),
 ):
-    return await with_exceptions_handling(
+    return await change_status_page(
         s.api.save_status_page,
         slug,
         title=status_page_data.title,
@@ -66,7 +92,7 @@ async def save_status_page(
         showPoweredBy=status_page_data.showPoweredBy,
         showCertificateExpiry=status_page_data.showCertificateExpiry,
         icon=status_page_data.icon,
-        publicGroupList=status_page_data.publicGroupList
+        publicGroupList=status_page_data.publicGroupList,
     )
 
 
@@ -76,8 +102,7 @@ async def save_status_page(
     description="Delete a status page",
 )
 async def delete_status_page(
-        slug: str = Path(...),
-        s: JWTSession = Depends(get_jwt_session)
+    slug: str = Path(...), s: JWTSession = Depends(get_jwt_session)
 ):
     def delete_status_page_api(slug):
         try:
@@ -92,7 +117,7 @@ async def delete_status_page(
                 logging.info(f"Exception: {e}")
                 return success
 
-    return await with_exceptions_handling(delete_status_page_api, slug)
+    return await change_status_page(delete_status_page_api, slug)
 
 
 @router.post(
@@ -101,11 +126,11 @@ async def delete_status_page(
     description="Post an incident to a status page",
 )
 async def post_incident(
-        slug: str,
-        incident_data: PostIncidentRequest,
-        s: JWTSession = Depends(get_jwt_session),
+    slug: str,
+    incident_data: PostIncidentRequest,
+    s: JWTSession = Depends(get_jwt_session),
 ):
-    return await with_exceptions_handling(
+    return await change_status_page(
         s.api.post_incident,
         slug,
         incident_data.title,
@@ -120,4 +145,4 @@ async def post_incident(
     description="Unpin an incident from a status page",
 )
 async def unpin_incident(slug: str, s: JWTSession = Depends(get_jwt_session)):
-    return await with_exceptions_handling(s.api.unpin_incident, slug)
+    return await change_status_page(s.api.unpin_incident, slug)
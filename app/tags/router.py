@@ -1,5 +1,5 @@
-from typing import Dict, List
-from fastapi import APIRouter, Depends, HTTPException, Path
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from uptime_kuma_api import UptimeKumaException
 
 from auth.schemas import JWTSession
@@ -7,14 +7,27 @@ from auth.dependencies import get_jwt_session
 from .schemas import Tag, TagUpdate
 from config import logger as logging
 from .raises import raise_tag_not_found
+from utils.executor import run_blocking
+from utils.response_cache import response_cache
 
 router = APIRouter(redirect_slashes=True)
 
 
 @router.get("", description="Get all tags")
-async def get_tags(s: JWTSession = Depends(get_jwt_session)) -> Dict[str, List[Dict]]:
+async def get_tags(
+    ids: Optional[List[int]] = Query(
+        None, description="Only return the tags with these IDs"
+    ),
+    s: JWTSession = Depends(get_jwt_session),
+) -> Dict[str, List[Dict]]:
     try:
-        return {"tags": s.api.get_tags()}
+        if ids is not None:
+            # the tags are requested from Kuma only if one of the ids is not cached
+            return {"tags": await run_blocking(s.api.get_tags, ids=ids, refresh=False)}
+        # tags are not pushed by Kuma, the entry expires or is invalidated by the routes below
+        return await response_cache.get(
+            "tags", s.api, None, lambda: {"tags": s.api.get_tags(refresh=False)}
+        )
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
@@ -23,7 +36,9 @@ async def get_tags(s: JWTSession = Depends(get_jwt_session)) -> Dict[str, List[D
 @router.post("", description="Add a tag by name and color")
 async def add_tag(tag: Tag, s: JWTSession = Depends(get_jwt_session)):
     try:
-        return s.api.add_tag(**tag.dict())
+        r = await run_blocking(s.api.add_tag, **tag.dict())
+        response_cache.invalidate("tags")
+        return r
     except TypeError as e:
         logging.error(e)
         raise HTTPException(422, str(e))
@@ -35,7 +50,7 @@ async def add_tag(tag: Tag, s: JWTSession = Depends(get_jwt_session)):
 @router.get("/{tag_id}", description="Get a Tag By ID")
 async def get_tag(tag_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
     try:
-        tag = s.api.get_tag(tag_id)
+        tag = await run_blocking(s.api.get_tag, tag_id, refresh=False)
     except UptimeKumaException as e:
         logging.info(e)
         raise_tag_not_found()
@@ -50,7 +65,9 @@ async def get_tag(tag_id: int = Path(...), s: JWTSession = Depends(get_jwt_sessi
 async def delete_tag(tag_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
     try:
         # kinda dumb the api doesnt check if th id exists he just sends an event
-        return s.api.delete_tag(tag_id)
+        r = await run_blocking(s.api.delete_tag, tag_id)
+        response_cache.invalidate("tags")
+        return r
     except UptimeKumaException as e:
         logging.info(e)
         raise_tag_not_found()
@@ -60,9 +77,13 @@ async def delete_tag(tag_id: int = Path(...), s: JWTSession = Depends(get_jwt_se
 
 
 @router.patch("/{tag_id}", description="Update a specific Tag By ID")
-async def update_tag(tag: TagUpdate, tag_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)):
+async def update_tag(
+    tag: TagUpdate, tag_id: int = Path(...), s: JWTSession = Depends(get_jwt_session)
+):
     try:
-        return s.api.edit_tag(tag_id, **tag.dict())
+        r = await run_blocking(s.api.edit_tag, tag_id, **tag.dict())
+        response_cache.invalidate("tags")
+        return r
     except UptimeKumaException as e:
         logging.info(e)
         raise_tag_not_found()
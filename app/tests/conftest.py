@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the app modules are imported from the app directory, like uvicorn does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,28 @@
+from unittest import mock
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from uptime_kuma_api import UptimeKumaApi
+
+from auth.dependencies import get_jwt_session
+from auth.schemas import JWTSession
+
+
+def offline_api() -> UptimeKumaApi:
+    """A client that is not connected to Kuma, the tests feed its events and replace `_call`."""
+    with mock.patch.object(UptimeKumaApi, "connect"):
+        api = UptimeKumaApi("http://127.0.0.1:3001", timeout=1, wait_events=0)
+    api.sio.connected = True
+    return api
+
+
+def route_client(router: APIRouter, prefix: str, api: UptimeKumaApi) -> TestClient:
+    """Serves the router with every request authenticated as a session of the api."""
+    app = FastAPI()
+    app.include_router(router, prefix=prefix)
+
+    async def session():
+        yield JWTSession(token="token", api=api)
+
+    app.dependency_overrides[get_jwt_session] = session
+    return TestClient(app)
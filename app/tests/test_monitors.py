@@ -0,0 +1,98 @@
+import unittest
+from unittest import mock
+
+from uptime_kuma_api import MonitorStatus, MonitorType
+
+from monitors import router
+from state.subscriber import subscriber
+from utils.response_cache import response_cache
+from routes import offline_api, route_client
+
+
+def monitor(id_):
+    return {
+        "id": id_,
+        "name": f"monitor {id_}",
+        "type": MonitorType.HTTP,
+        "active": True,
+        "parent": None,
+        "tags": [],
+        "url": "http://127.0.0.1",
+        "interval": 60,
+        "maxretries": 0,
+        "retryInterval": 60,
+        "maxredirects": 10,
+        "accepted_statuscodes": ["200-299"],
+        "dns_resolve_type": "A",
+        "databaseConnectionString": None,
+        "notificationIDList": {},
+    }
+
+
+def heartbeat(monitor_id, status):
+    return {
+        "monitorID": monitor_id,
+        "status": status,
+        "time": "2022-12-15 12:38:42.661",
+        "msg": "",
+        "ping": None,
+        "important": False,
+        "duration": 0,
+    }
+
+
+class TestMonitors(unittest.TestCase):
+    def setUp(self):
+        self.api = offline_api()
+        self.api._event_monitor_list({str(i): monitor(i) for i in range(1, 4)})
+        self.api._event_heartbeat(heartbeat(1, MonitorStatus.DOWN))
+        self.api._event_heartbeat(heartbeat(2, MonitorStatus.UP))
+        patcher = mock.patch.object(subscriber, "_api", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        response_cache.clear()
+        self.addCleanup(response_cache.clear)
+        self.client = route_client(router, "/monitors", self.api)
+
+    def test_status_filter(self):
+        response = self.client.get("/monitors", params={"status": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [monitor["id"] for monitor in response.json()["monitors"]], [2]
+        )
+
+    def test_unknown_status(self):
+        response = self.client.get("/monitors", params={"status": 9})
+        self.assertEqual(response.status_code, 422)
+
+    def edit(self, **headers):
+        def call(event, data=None):
+            self.api._event_update_monitor_into_list(
+                {str(data["id"]): {**data, "notificationIDList": {}}}
+            )
+            return {"msg": "Saved.", "monitorID": data["id"]}
+
+        self.api._call = call
+        return self.client.patch(
+            "/monitors/2", json={"name": "renamed"}, headers=headers
+        )
+
+    def test_edit_read_revision(self):
+        etag = self.client.get("/monitors/2").headers["ETag"]
+        response = self.edit(**{"If-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.api.get_monitor(2, refresh=False)["name"], "renamed")
+
+    def test_edit_changed_since_read(self):
+        etag = self.client.get("/monitors/2").headers["ETag"]
+        self.api._event_update_monitor_into_list(
+            {"3": {**monitor(3), "name": "changed"}}
+        )
+        response = self.edit(**{"If-Match": etag})
+        self.assertEqual(response.status_code, 412)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertEqual(self.api.get_monitor(2, refresh=False)["name"], "monitor 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import json
+import unittest
+from unittest import mock
+
+from starlette.requests import Request
+from uptime_kuma_api import Event
+
+from utils.etag import make_etag
+from utils.response_cache import ResponseCache
+
+
+class FakeApi:
+    def __init__(self):
+        self.revisions = {Event.MONITOR_LIST: 1}
+
+    def get_revision(self, event):
+        return self.revisions[event]
+
+
+def request(etag=None):
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cache = ResponseCache(ttl=60)
+        self.api = FakeApi()
+        self.builds = 0
+
+    def build(self):
+        self.builds += 1
+        return {"build": self.builds}
+
+    async def get(self, key="monitors", event=Event.MONITOR_LIST, request=None):
+        return await self.cache.get(key, self.api, event, self.build, request=request)
+
+    async def test_hit(self):
+        first = await self.get()
+        second = await self.get()
+        self.assertEqual(json.loads(second.body), {"build": 1})
+        self.assertEqual(second.body, first.body)
+        self.assertEqual(self.builds, 1)
+
+    async def test_invalidated_by_new_revision(self):
+        await self.get()
+        self.api.revisions[Event.MONITOR_LIST] = 2
+        response = await self.get()
+        self.assertEqual(json.loads(response.body), {"build": 2})
+        self.assertEqual(
+            response.headers["ETag"], make_etag(self.api, Event.MONITOR_LIST)
+        )
+
+    async def test_change_during_build(self):
+        def build():
+            # the event changes while the response is built
+            self.api.revisions[Event.MONITOR_LIST] = 2
+            return self.build()
+
+        await self.cache.get("monitors", self.api, Event.MONITOR_LIST, build)
+        response = await self.get()
+        self.assertEqual(json.loads(response.body), {"build": 2})
+
+    async def test_ttl(self):
+        with mock.patch("utils.response_cache.time.monotonic", return_value=1000):
+            await self.get()
+        with mock.patch("utils.response_cache.time.monotonic", return_value=1059):
+            await self.get()
+        self.assertEqual(self.builds, 1)
+        with mock.patch("utils.response_cache.time.monotonic", return_value=1060):
+            await self.get()
+        self.assertEqual(self.builds, 2)
+
+    async def test_without_event(self):
+        await self.get(key="tags", event=None)
+        response = await self.get(key="tags", event=None)
+        self.assertEqual(self.builds, 1)
+        self.assertNotIn("ETag", response.headers)
+
+    async def test_invalidate(self):
+        await self.get()
+        await self.get(key="tags", event=None)
+        self.cache.invalidate("monitors")
+        await self.get()
+        await self.get(key="tags", event=None)
+        # only the invalidated entry is built again
+        self.assertEqual(self.builds, 3)
+        self.cache.clear()
+        await self.get(key="tags", event=None)
+        self.assertEqual(self.builds, 4)
+
+    async def test_disabled(self):
+        self.cache = ResponseCache(ttl=0)
+        await self.get()
+        await self.get()
+        self.assertEqual(self.builds, 2)
+
+    async def test_not_modified(self):
+        etag = (await self.get()).headers["ETag"]
+        response = await self.get(request=request(etag))
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+
+        self.api.revisions[Event.MONITOR_LIST] = 2
+        response = await self.get(request=request(etag))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from auth.pool import SessionPool
+
+
+class FakeApi:
+    def __init__(self):
+        self.sio = SimpleNamespace(connected=True)
+        self.disconnected = False
+
+    def disconnect(self):
+        self.sio.connected = False
+        self.disconnected = True
+
+
+class TestSessionPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = SessionPool(max_size=2, idle_timeout=300)
+        self.created = []
+
+    def factory(self):
+        api = FakeApi()
+        self.created.append(api)
+        return api
+
+    def test_reuse(self):
+        api = self.pool.acquire("token", self.factory)
+        self.pool.release(api)
+        self.assertIs(self.pool.acquire("token", self.factory), api)
+        self.assertEqual(len(self.created), 1)
+        self.assertFalse(api.disconnected)
+
+    def test_tokens_do_not_share_instances(self):
+        api = self.pool.acquire("token 1", self.factory)
+        self.pool.release(api)
+        self.assertIsNot(self.pool.acquire("token 2", self.factory), api)
+        self.assertEqual(len(self.created), 2)
+
+    def test_borrowed_instance_is_not_shared(self):
+        api1 = self.pool.acquire("token", self.factory)
+        api2 = self.pool.acquire("token", self.factory)
+        self.assertIsNot(api1, api2)
+
+    def test_idle_timeout(self):
+        with mock.patch("auth.pool.time.monotonic", return_value=1000):
+            api = self.pool.acquire("token", self.factory)
+            self.pool.release(api)
+        with mock.patch("auth.pool.time.monotonic", return_value=1000 + 301):
+            self.assertIsNot(self.pool.acquire("token", self.factory), api)
+        self.assertTrue(api.disconnected)
+
+    def test_disconnected_instance_is_replaced(self):
+        api = self.pool.acquire("token", self.factory)
+        self.pool.release(api)
+        api.sio.connected = False
+        self.assertIsNot(self.pool.acquire("token", self.factory), api)
+        self.assertTrue(api.disconnected)
+
+    def test_release_disconnected(self):
+        api = self.pool.acquire("token", self.factory)
+        api.sio.connected = False
+        self.pool.release(api)
+        self.assertTrue(api.disconnected)
+        self.assertIsNot(self.pool.acquire("token", self.factory), api)
+
+    def test_oldest_idle_is_evicted_when_full(self):
+        with mock.patch("auth.pool.time.monotonic", return_value=1000):
+            api1 = self.pool.acquire("token 1", self.factory)
+            self.pool.release(api1)
+        with mock.patch("auth.pool.time.monotonic", return_value=1001):
+            api2 = self.pool.acquire("token 2", self.factory)
+            self.pool.release(api2)
+            self.pool.acquire("token 3", self.factory)
+            self.assertTrue(api1.disconnected)
+            self.assertFalse(api2.disconnected)
+            self.assertIs(self.pool.acquire("token 2", self.factory), api2)
+
+    def test_temporary_instance_when_all_are_borrowed(self):
+        self.pool.acquire("token", self.factory)
+        self.pool.acquire("token", self.factory)
+        temporary = self.pool.acquire("token", self.factory)
+        self.pool.release(temporary)
+        self.assertTrue(temporary.disconnected)
+
+    def test_evict_idle(self):
+        with mock.patch("auth.pool.time.monotonic", return_value=1000):
+            api1 = self.pool.acquire("token 1", self.factory)
+            self.pool.release(api1)
+        with mock.patch("auth.pool.time.monotonic", return_value=1200):
+            api2 = self.pool.acquire("token 2", self.factory)
+            self.pool.release(api2)
+        with mock.patch("auth.pool.time.monotonic", return_value=1400):
+            self.pool.evict_idle()
+        self.assertTrue(api1.disconnected)
+        self.assertFalse(api2.disconnected)
+
+    def test_close(self):
+        api1 = self.pool.acquire("token 1", self.factory)
+        api2 = self.pool.acquire("token 2", self.factory)
+        self.pool.release(api1)
+        self.pool.close()
+        self.assertTrue(api1.disconnected)
+        # borrowed instances are closed on release
+        self.assertFalse(api2.disconnected)
+
+
+if __name__ == "__main__":
+    unittest.main()
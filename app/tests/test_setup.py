@@ -0,0 +1,40 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import setup
+from state import subscriber
+
+
+class TestLifecycle(unittest.TestCase):
+    def test_shutdown_stops_background_tasks(self):
+        app = FastAPI()
+        with mock.patch.object(setup.db, "setup"):
+            asyncio.run(setup.init(app))
+
+        with mock.patch.object(setup, "ensure_admin_exists"), mock.patch.object(
+            setup.settings, "KUMA_USERNAME", "admin"
+        ), mock.patch.object(setup.Tortoise, "close_connections"), mock.patch.object(
+            setup, "session_pool"
+        ), mock.patch.object(
+            setup, "kuma_executor"
+        ), mock.patch.object(
+            setup, "password_executor"
+        ), mock.patch.object(
+            subscriber, "start"
+        ), mock.patch.object(
+            subscriber, "stop"
+        ) as stop:
+            with TestClient(app):
+                tasks = app.state.background_tasks
+                self.assertEqual(len(tasks), 2)
+                self.assertFalse(any(task.done() for task in tasks))
+            self.assertTrue(all(task.cancelled() for task in tasks))
+            stop.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest import mock
+
+from statuspages import router
+from state.subscriber import subscriber
+from utils.response_cache import response_cache
+from routes import offline_api, route_client
+
+
+def status_page(id_, slug):
+    return {
+        "id": id_,
+        "slug": slug,
+        "title": slug,
+        "description": None,
+        "icon": "/icon.svg",
+        "theme": "auto",
+        "published": True,
+        "showTags": False,
+        "domainNameList": [],
+        "customCSS": "",
+        "footerText": None,
+        "showPoweredBy": True,
+        "googleAnalyticsId": None,
+        "showCertificateExpiry": False,
+    }
+
+
+class TestStatusPages(unittest.TestCase):
+    def setUp(self):
+        pages = {"1": status_page(1, "page-1"), "2": status_page(2, "page-2")}
+        self.api = offline_api()
+        self.api._event_status_page_list(pages)
+        self.api._call = lambda event, data=None: {}
+        # the subscriber receives no event when a page of another connection is deleted
+        subscriber_api = offline_api()
+        subscriber_api._event_status_page_list(pages)
+        patcher = mock.patch.object(subscriber, "_api", subscriber_api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        response_cache.clear()
+        self.addCleanup(response_cache.clear)
+        self.client = route_client(router, "/status-pages", self.api)
+
+    def slugs(self):
+        response = self.client.get("/status-pages")
+        self.assertEqual(response.status_code, 200)
+        return [page["slug"] for page in response.json()]
+
+    def test_delete_then_list(self):
+        self.assertEqual(self.slugs(), ["page-1", "page-2"])
+        self.assertEqual(self.client.delete("/status-pages/page-1").status_code, 200)
+        self.assertEqual(self.slugs(), ["page-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
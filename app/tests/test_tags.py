@@ -0,0 +1,38 @@
+import unittest
+
+from tags import router
+from utils.response_cache import response_cache
+from routes import offline_api, route_client
+
+
+class TestTags(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.api = offline_api()
+
+        def call(event, data=None):
+            self.calls.append(event)
+            return {"tags": [{"id": 1, "name": "tag 1", "color": "#ffffff"}]}
+
+        self.api._call = call
+        response_cache.clear()
+        self.addCleanup(response_cache.clear)
+        self.client = route_client(router, "/tags", self.api)
+
+    def test_get_tag_from_cache(self):
+        for _ in range(2):
+            response = self.client.get("/tags/1")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["tag"]["name"], "tag 1")
+        self.assertEqual(self.calls, ["getTags"])
+
+    def test_unknown_tag_refreshes_once(self):
+        self.assertEqual(self.client.get("/tags/1").status_code, 200)
+        for _ in range(2):
+            self.assertEqual(self.client.get("/tags/2").status_code, 404)
+        # the miss is looked up on the server once, then remembered
+        self.assertEqual(self.calls, ["getTags", "getTags"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import time
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from fastapi import HTTPException
+
+from auth import dependencies
+from auth.dependencies import decode_jwt, verified_tokens
+from auth.schemas import JWTData
+from auth.security import create_access_token
+from auth.token_cache import VerifiedTokenCache
+from config import settings
+
+
+class TestVerifiedTokenCache(unittest.TestCase):
+    def test_get(self):
+        cache = VerifiedTokenCache(max_size=2)
+        data = JWTData(sub="kuma token")
+        cache.put("token", data, time.time() + 60)
+        self.assertIs(cache.get("token"), data)
+        self.assertIsNone(cache.get("other token"))
+
+    def test_expiry(self):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("token", JWTData(sub="kuma token"), 1000)
+        with mock.patch("auth.token_cache.time.time", return_value=999):
+            self.assertIsNotNone(cache.get("token"))
+        with mock.patch("auth.token_cache.time.time", return_value=1000):
+            self.assertIsNone(cache.get("token"))
+        # the expired entry is removed
+        self.assertEqual(len(cache._entries), 0)
+
+    def test_without_expiry(self):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("token", JWTData(sub="kuma token"), None)
+        self.assertIsNotNone(cache.get("token"))
+
+    def test_least_recently_used_is_dropped(self):
+        cache = VerifiedTokenCache(max_size=2)
+        for token in ("token 1", "token 2"):
+            cache.put(token, JWTData(sub=token), None)
+        cache.get("token 1")
+        cache.put("token 3", JWTData(sub="token 3"), None)
+        self.assertIsNotNone(cache.get("token 1"))
+        self.assertIsNone(cache.get("token 2"))
+        self.assertIsNotNone(cache.get("token 3"))
+
+    def test_disabled(self):
+        cache = VerifiedTokenCache(max_size=0)
+        cache.put("token", JWTData(sub="kuma token"), None)
+        self.assertIsNone(cache.get("token"))
+
+    def test_tokens_are_not_stored(self):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("token", JWTData(sub="kuma token"), None)
+        self.assertNotIn("token", cache._entries)
+
+
+def access_token(subject: str, expire_delta: timedelta) -> str:
+    # the token arrives as a string in the Authorization header
+    token = create_access_token(subject, expire_delta)
+    return token.decode() if isinstance(token, bytes) else token
+
+
+class TestDecodeJwt(unittest.TestCase):
+    def setUp(self):
+        verified_tokens.clear()
+        self.addCleanup(verified_tokens.clear)
+
+    def test_cached(self):
+        token = access_token("kuma token", timedelta(minutes=5))
+        self.assertEqual(decode_jwt(token).sub, "kuma token")
+        with mock.patch.object(dependencies.jwt, "decode") as decode:
+            self.assertEqual(decode_jwt(token).sub, "kuma token")
+        decode.assert_not_called()
+
+    def test_expired_token_is_verified_again(self):
+        token = access_token("kuma token", timedelta(minutes=5))
+        decode_jwt(token)
+        with mock.patch(
+            "auth.token_cache.time.time", return_value=time.time() + 10 * 60
+        ):
+            self.assertIsNone(verified_tokens.get(token))
+        expired = access_token("kuma token", timedelta(minutes=-1))
+        with self.assertRaises(HTTPException) as e:
+            decode_jwt(expired)
+        self.assertEqual(e.exception.detail, "Token expired!")
+
+    def test_invalid_signature_is_not_cached(self):
+        with mock.patch.object(settings, "SECRET_KEY", "other key"):
+            forged = access_token("kuma token", timedelta(minutes=5))
+        for _ in range(2):
+            with self.assertRaises(HTTPException):
+                decode_jwt(forged)
+
+    def test_revocation(self):
+        # rotating the secret key revokes the issued tokens once the cache is cleared
+        token = access_token("kuma token", timedelta(minutes=5))
+        decode_jwt(token)
+        with mock.patch.object(settings, "SECRET_KEY", "rotated"):
+            verified_tokens.clear()
+            with self.assertRaises(HTTPException) as e:
+                decode_jwt(token)
+        self.assertEqual(e.exception.status_code, 403)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,26 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from uptime_kuma_api import Event
 
 from config import logger as logging
 from auth.dependencies import get_jwt_session
+from state import state_api
 from auth.schemas import JWTSession
-from .utils import get_uptimes
+from utils.etag import conditional_get
+from utils.executor import run_blocking
+from .utils import wait_for_uptimes
 
 router = APIRouter(redirect_slashes=True)
 
 
 @router.get("", description="Uptime")
-async def get_uptime(s: JWTSession = Depends(get_jwt_session)):
+async def get_uptime(
+    request: Request, response: Response, s: JWTSession = Depends(get_jwt_session)
+):
     try:
-        return await get_uptimes(s.api)
+        api = state_api(s)
+        # the revision is read once the data of every monitor has arrived
+        await run_blocking(wait_for_uptimes, api)
+        unchanged = conditional_get(request, response, api, Event.UPTIME)
+        if unchanged is not None:
+            return unchanged
+        return await run_blocking(api.uptime)
     except Exception as e:
         logging.fatal(e)
         raise HTTPException(500, str(e))
 
 
 @router.get("/{monitor_id}", description="Uptime for a specific monitors")
-async def get_monitor_uptime(monitor_id: int, s: JWTSession = Depends(get_jwt_session)):
+async def get_monitor_uptime(
+    request: Request,
+    response: Response,
+    monitor_id: int,
+    s: JWTSession = Depends(get_jwt_session),
+):
     try:
-        uptimes = await get_uptimes(s.api)
+        api = state_api(s)
+        # the revision is read once the data of every monitor has arrived
+        await run_blocking(wait_for_uptimes, api)
+        unchanged = conditional_get(request, response, api, Event.UPTIME)
+        if unchanged is not None:
+            return unchanged
+        uptimes = await run_blocking(api.uptime)
         return uptimes[monitor_id] if monitor_id in uptimes else 0
     except Exception as e:
         logging.fatal(e)
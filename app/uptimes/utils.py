@@ -1,13 +1,12 @@
-import time
-from uptime_kuma_api import UptimeKumaApi
+from uptime_kuma_api import Event, UptimeKumaApi
 
+from config import settings
 
-async def get_uptimes(api: UptimeKumaApi):
+
+def wait_for_uptimes(api: UptimeKumaApi):
+    api.wait_for_monitor_data(Event.UPTIME, timeout=settings.KUMA_READY_TIMEOUT)
+
+
+def get_monitor_uptimes(api: UptimeKumaApi, monitor_id: int):
     uptimes = api.uptime()
-    monitors = api.get_monitors()
-    timeout = 0.1
-    while len(monitors) > len(uptimes) and timeout < 1:
-        time.sleep(0.1)
-        uptimes = api.uptime()
-        timeout += 0.1
-    return uptimes
+    return uptimes.get(monitor_id) if uptimes else None
@@ -5,7 +5,7 @@ from tortoise.contrib.fastapi import HTTPNotFoundError
 
 from auth.schemas import JWTSession
 from auth.models import User, UserResponse
-from auth.security import hash_password
+from auth.security import hash_password, run_password_hashing
 from auth.dependencies import get_jwt_session
 from .schemas import RegisterUser
 from response import success
@@ -14,14 +14,17 @@ router = APIRouter(redirect_slashes=True)
 
 
 @router.post("", response_model=UserResponse)
-async def create_user(user_in: RegisterUser, _s: JWTSession = Depends(get_jwt_session)) -> Any:
+async def create_user(
+    user_in: RegisterUser, _s: JWTSession = Depends(get_jwt_session)
+) -> Any:
     """Sign up."""
     user = await User.get_or_none(username=user_in.username)
     if user:
         raise HTTPException(status_code=400, detail="Username already exists")
 
     user = await User.create(
-        username=user_in.username, password_hash=hash_password(user_in.password)
+        username=user_in.username,
+        password_hash=await run_password_hashing(hash_password, user_in.password),
     )
     return await UserResponse.from_tortoise_orm(user)
 
@@ -2,6 +2,7 @@ from typing import Any, Callable
 from fastapi import HTTPException
 from config import logger as logging
 from uptime_kuma_api import UptimeKumaException
+from utils.executor import run_blocking
 import asyncio
 
 
@@ -10,7 +11,7 @@ async def with_exceptions_handling(func: Callable[..., Any], *args, **kwargs) ->
         if asyncio.iscoroutinefunction(func):
             result = await func(*args, **kwargs)
         else:
-            result = func(*args, **kwargs)
+            result = await run_blocking(func, *args, **kwargs)
         return result
     except UptimeKumaException as e:
         logging.error(e)
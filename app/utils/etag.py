@@ -0,0 +1,69 @@
+import hashlib
+import secrets
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response
+from uptime_kuma_api import Event, UptimeKumaApi
+
+# the revisions of the Kuma data restart with the process
+PROCESS_TAG = secrets.token_hex(4)
+
+
+def make_etag(api: UptimeKumaApi, event: Event) -> str:
+    """Strong ETag of the current revision of the event data."""
+    return f'"{PROCESS_TAG}-{api.get_revision(event)}"'
+
+
+def content_etag(body: bytes) -> str:
+    """Strong ETag of a response body, for the data that Kuma does not push."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    etags = [value.strip() for value in header.split(",")]
+    return etag in etags or f"W/{etag}" in etags
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def conditional_get(
+    request: Request, response: Response, api: UptimeKumaApi, event: Event
+) -> Optional[Response]:
+    """Sets the ETag of the event data on the response.
+
+    Returns a 304 response if the client already has the current revision, the body does not need to be built then.
+    """
+    etag = make_etag(api, event)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return None
+
+
+def expected_revision(
+    request: Request, api: UptimeKumaApi, event: Event
+) -> Optional[int]:
+    """Checks the If-Match header of a write against the current revision of the event data.
+
+    Returns the revision the client read, None without the header. Raises 412 if the data changed since then.
+    """
+    header = request.headers.get("if-match")
+    if not header:
+        return None
+    etag = make_etag(api, event)
+    # If-Match uses the strong comparison
+    if header.strip() != "*" and etag not in [
+        value.strip() for value in header.split(",")
+    ]:
+        raise HTTPException(
+            412, {"message": "Modified since it was read"}, headers={"ETag": etag}
+        )
+    return api.get_revision(event)
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config import settings
+
+
+class UpstreamStats:
+    def __init__(self, limit: int):
+        self.limit = limit
+        # waiting for a free slot of the upstream
+        self.queued = 0
+        self.max_queued = 0
+        # submitted to the thread pool, waiting for a worker or running
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        # running, but the caller stopped waiting for the result
+        self.abandoned = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "limit": self.limit,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "abandoned": self.abandoned,
+        }
+
+
+class KumaExecutor:
+    """Runs the blocking Kuma client calls of the async route handlers in a bounded thread pool.
+
+    Each upstream Kuma server gets at most `upstream_limit` concurrent calls, further calls wait
+    on the event loop without occupying a worker thread.
+
+    :param max_workers: Number of worker threads.
+    :param upstream_limit: Maximum number of concurrent calls per upstream Kuma server.
+    """
+
+    def __init__(self, max_workers: int, upstream_limit: int):
+        self.max_workers = max_workers
+        self.upstream_limit = upstream_limit
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kuma"
+        )
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, UpstreamStats] = {}
+        # submitted to the pool but not yet picked up by a worker
+        self._pool_queued = 0
+        # running calls whose caller was cancelled
+        self._abandoned = set()
+        self._lock = threading.Lock()
+
+    async def run(
+        self, upstream: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        if upstream not in self._semaphores:
+            # created on demand, so that it belongs to the running event loop
+            self._semaphores[upstream] = asyncio.Semaphore(self.upstream_limit)
+            self._stats[upstream] = UpstreamStats(self.upstream_limit)
+        semaphore = self._semaphores[upstream]
+        stats = self._stats[upstream]
+
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.queued -= 1
+        stats.running += 1
+        with self._lock:
+            self._pool_queued += 1
+        try:
+            future = self._pool.submit(self._call, func, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._pool_queued -= 1
+            self._finish(None, semaphore, stats)
+            raise
+        loop = asyncio.get_running_loop()
+
+        def done(f: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(self._finish, f, semaphore, stats)
+            except RuntimeError:
+                # the event loop is closed
+                pass
+
+        # the slot is held until the worker thread finished, also if the awaiting route gave up on the call
+        future.add_done_callback(done)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.running():
+                # a worker cannot be interrupted, the call keeps its slot until it returns
+                self._abandoned.add(future)
+                stats.abandoned += 1
+            raise
+
+    def _finish(
+        self,
+        future: Optional[Future],
+        semaphore: asyncio.Semaphore,
+        stats: UpstreamStats,
+    ) -> None:
+        if future is not None and future.cancelled():
+            # cancelled before a worker picked it up
+            with self._lock:
+                self._pool_queued -= 1
+        if future is None or future.cancelled() or future.exception() is not None:
+            stats.failed += 1
+        else:
+            stats.completed += 1
+        if future in self._abandoned:
+            self._abandoned.discard(future)
+            stats.abandoned -= 1
+        stats.running -= 1
+        semaphore.release()
+
+    def _call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        with self._lock:
+            self._pool_queued -= 1
+        return func(*args, **kwargs)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            pool_queued = self._pool_queued
+        return {
+            "max_workers": self.max_workers,
+            "pool_queued": pool_queued,
+            "upstreams": {
+                upstream: stats.as_dict() for upstream, stats in self._stats.items()
+            },
+        }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False)
+
+
+kuma_executor = KumaExecutor(
+    max_workers=settings.KUMA_EXECUTOR_MAX_WORKERS,
+    upstream_limit=settings.KUMA_UPSTREAM_CONCURRENCY,
+)
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Runs a blocking call to the Kuma server off the event loop."""
+    return await kuma_executor.run(settings.KUMA_SERVER, func, *args, **kwargs)
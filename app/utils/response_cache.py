@@ -0,0 +1,84 @@
+import time
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import parse_obj_as
+from uptime_kuma_api import Event, UptimeKumaApi
+
+from config import settings
+from utils.etag import is_not_modified, make_etag, not_modified
+from utils.executor import run_blocking
+
+
+def serialize(data: Any, model: Any = None) -> bytes:
+    """Encodes the data like FastAPI encodes the return value of a route."""
+    if model is not None:
+        data = parse_obj_as(model, data)
+    return JSONResponse(jsonable_encoder(data)).body
+
+
+class ResponseCache:
+    """Keeps the serialized responses of the read endpoints.
+
+    An entry is reused until the Kuma event it was built from changes, or the TTL expires
+    for the data that Kuma does not push. Hits skip the Kuma call and the JSON encoding.
+    Responses built from an event carry the ETag of its revision.
+
+    :param ttl: Seconds an entry is reused at most, 0 disables the cache.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # key -> (revision of the event, expiration, body)
+        self._entries: Dict[str, tuple] = {}
+
+    async def get(
+        self,
+        key: str,
+        api: UptimeKumaApi,
+        event: Optional[Event],
+        build: Callable[[], Any],
+        model: Any = None,
+        request: Optional[Request] = None,
+    ) -> Response:
+        """Answers from the cache or builds and stores the response.
+
+        :param key: The name of the entry.
+        :param api: The api the data is read from, its event revision validates the entry.
+        :param event: The Kuma event the data is built from, None if only the TTL applies.
+        :param build: Blocking function that returns the data.
+        :param model: Response model the data is validated with.
+        :param request: The request, answered with 304 if its If-None-Match header has the current ETag.
+        """
+        # read before building, a change during the build invalidates the entry
+        revision = None
+        headers = {}
+        if event is not None:
+            # the revisions are unique across the api instances
+            revision = api.get_revision(event)
+            headers["ETag"] = make_etag(api, event)
+            if request is not None and is_not_modified(request, headers["ETag"]):
+                return not_modified(headers["ETag"])
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry_revision, expires_at, body = entry
+            if entry_revision == revision and time.monotonic() < expires_at:
+                return Response(body, media_type="application/json", headers=headers)
+
+        data = await run_blocking(build)
+        body = serialize(data, model)
+        if self.ttl > 0:
+            self._entries[key] = (revision, time.monotonic() + self.ttl, body)
+        return Response(body, media_type="application/json", headers=headers)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+response_cache = ResponseCache(ttl=settings.RESPONSE_CACHE_TTL)
@@ -33,7 +33,8 @@ setup(
     install_requires=[
         "python-socketio[client]>=5.0.0",
         "packaging",
-        "requests"
+        "requests",
+        "aiohttp>=3.8.0"
     ],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
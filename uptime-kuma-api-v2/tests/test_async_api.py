@@ -0,0 +1,47 @@
+import unittest
+
+from uptime_kuma_api import AsyncUptimeKumaApi, MonitorType, UptimeKumaException
+from uptime_kuma_test_case import UptimeKumaTestCase
+
+
+class TestAsyncApi(UptimeKumaTestCase, unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.async_api = AsyncUptimeKumaApi(self.url, timeout=1, wait_events=0.01)
+        await self.async_api.connect()
+        await self.async_api.login(self.username, self.password)
+
+    async def asyncTearDown(self):
+        await self.async_api.disconnect()
+
+    async def test_info(self):
+        info = await self.async_api.info()
+        self.assertIn("version", info)
+
+    async def test_monitor(self):
+        r = await self.async_api.add_monitor(type=MonitorType.HTTP, name="monitor 1", url="http://127.0.0.1")
+        monitor_id = r["monitorID"]
+
+        monitor = await self.async_api.get_monitor(monitor_id)
+        self.assertEqual(monitor["name"], "monitor 1")
+
+        monitors = await self.async_api.get_monitors()
+        self.assertIn(monitor_id, [i["id"] for i in monitors])
+
+        await self.async_api.edit_monitor(monitor_id, name="monitor 2")
+        monitor = await self.async_api.get_monitor(monitor_id, refresh=False)
+        self.assertEqual(monitor["name"], "monitor 2")
+
+        await self.async_api.delete_monitor(monitor_id)
+        with self.assertRaises(UptimeKumaException):
+            await self.async_api.get_monitor(monitor_id)
+
+    async def test_status_page(self):
+        slug = "slug1"
+        await self.async_api.add_status_page(slug, "status page 1")
+        status_page = await self.async_api.get_status_page(slug)
+        self.assertEqual(status_page["slug"], slug)
+        await self.async_api.delete_status_page(slug)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+from uptime_kuma_api import Event
 from uptime_kuma_test_case import UptimeKumaTestCase
 
 
@@ -8,6 +9,15 @@ class TestAvgPing(UptimeKumaTestCase):
         self.add_monitor()
         self.api.avg_ping()
 
+    def test_wait_for_monitor_data(self):
+        self.add_monitor()
+        self.assertTrue(self.api.wait_for_monitor_data(Event.AVG_PING))
+        monitor_ids = [monitor["id"] for monitor in self.api.get_monitors(refresh=False)]
+        self.assertTrue(all(monitor_id in self.api.avg_ping() for monitor_id in monitor_ids))
+
+        with self.assertRaises(ValueError):
+            self.api.wait_for_monitor_data(Event.CERT_INFO)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from uptime_kuma_api import MonitorStatus
+from uptime_kuma_api.heartbeat_store import HeartbeatBuffer
+
+# a row of getMonitorBeats and the heartbeat the server pushed for it
+SERVER_BEAT = {
+    "down_count": 0,
+    "duration": 0,
+    "id": 25,
+    "important": True,
+    "monitor_id": 1,
+    "msg": "200 - OK",
+    "ping": 201,
+    "status": MonitorStatus.UP,
+    "time": "2022-12-15 12:38:42.661"
+}
+PUSHED_HEARTBEAT = {
+    "monitorID": 1,
+    "status": MonitorStatus.UP,
+    "time": "2022-12-15 12:38:42.661",
+    "msg": "200 - OK",
+    "ping": 201,
+    "important": True,
+    "duration": 0
+}
+
+
+class TestHeartbeatStore(unittest.TestCase):
+    def test_heartbeats(self):
+        buffer = HeartbeatBuffer(10, [PUSHED_HEARTBEAT])
+        self.assertEqual(buffer.heartbeats(), [PUSHED_HEARTBEAT])
+        self.assertIs(type(buffer.heartbeats()[0]["ping"]), int)
+
+    def test_beats_match_server_rows(self):
+        beat = HeartbeatBuffer(10, [PUSHED_HEARTBEAT]).beats()[0]
+        self.assertEqual(set(beat), set(SERVER_BEAT))
+        for key, value in SERVER_BEAT.items():
+            if key in ("id", "down_count"):
+                self.assertIsNone(beat[key])
+            else:
+                self.assertEqual(beat[key], value)
+                self.assertIs(type(beat[key]), type(value))
+
+    def test_ping_types(self):
+        pings = [201, 20.5, None]
+        buffer = HeartbeatBuffer(10, [{**PUSHED_HEARTBEAT, "ping": ping} for ping in pings])
+        self.assertEqual([heartbeat["ping"] for heartbeat in buffer.heartbeats()], pings)
+        self.assertEqual([type(heartbeat["ping"]) for heartbeat in buffer.heartbeats()], [int, float, type(None)])
+
+    def test_capacity(self):
+        buffer = HeartbeatBuffer(2)
+        for i in range(3):
+            buffer.append({**PUSHED_HEARTBEAT, "time": f"2022-12-15 12:38:4{i}.000"})
+        self.assertEqual(
+            [heartbeat["time"] for heartbeat in buffer.heartbeats()],
+            ["2022-12-15 12:38:41.000", "2022-12-15 12:38:42.000"]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,13 @@ class TestHelperMethods(UptimeKumaTestCase):
         status = self.api.get_monitor_status(monitor_id)
         self.assertTrue(type(status) == MonitorStatus)
 
+    def test_monitor_statuses(self):
+        monitor_id = self.add_monitor()
+        self.api.get_monitor_status(monitor_id)
+        statuses = self.api.get_monitor_statuses()
+        self.assertEqual(statuses[monitor_id]["status"], self.api.get_monitor_status(monitor_id))
+        self.assertIn("time", statuses[monitor_id])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -41,7 +41,14 @@ class TestMaintenance(UptimeKumaTestCase):
         # edit maintenance
         expected_maintenance["strategy"] = MaintenanceStrategy.RECURRING_INTERVAL
         expected_maintenance["title"] = "maintenance 1 new"
-        r = self.api.edit_maintenance(maintenance_id, **expected_maintenance)
+        r = self.api.edit_maintenance(maintenance_id, wait=True, **expected_maintenance)
+        self.assertEqual(r["msg"], "Saved.")
+        maintenance = self.api.get_maintenance(maintenance_id)
+        self.compare(maintenance, expected_maintenance)
+
+        # edit the pushed maintenance
+        expected_maintenance["title"] = "maintenance 1 pushed"
+        r = self.api.edit_maintenance(maintenance_id, refresh=False, title=expected_maintenance["title"])
         self.assertEqual(r["msg"], "Saved.")
         maintenance = self.api.get_maintenance(maintenance_id)
         self.compare(maintenance, expected_maintenance)
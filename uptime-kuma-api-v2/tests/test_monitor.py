@@ -2,7 +2,7 @@ import time
 import unittest
 from packaging.version import parse as parse_version
 
-from uptime_kuma_api import UptimeKumaException, MonitorType, AuthMethod, MonitorStatus
+from uptime_kuma_api import UptimeKumaException, MonitorType, AuthMethod, MonitorStatus, Event
 from uptime_kuma_test_case import UptimeKumaTestCase
 
 
@@ -55,6 +55,14 @@ class TestMonitor(UptimeKumaTestCase):
         monitor = self.api.get_monitor(monitor_id)
         self.compare(monitor, expected_monitor)
 
+        # edit the pushed monitor
+        expected_monitor["name"] = "monitor 1 pushed"
+        revision = self.api.get_revision(Event.MONITOR_LIST)
+        r = self.api.edit_monitor(monitor_id, refresh=False, revision=revision, name=expected_monitor["name"])
+        self.assertEqual(r["msg"], "Saved.")
+        monitor = self.api.get_monitor(monitor_id)
+        self.compare(monitor, expected_monitor)
+
         # pause monitor
         r = self.api.pause_monitor(monitor_id)
         self.assertEqual(r["msg"], "successPaused")
@@ -67,6 +75,12 @@ class TestMonitor(UptimeKumaTestCase):
         r = self.api.get_monitor_beats(monitor_id, 6)
         self.assertTrue(type(r[0]["status"]) == MonitorStatus)
 
+        # get beats and monitors of many monitors
+        r = self.api.get_monitor_beats_many([monitor_id], 6)
+        self.assertTrue(type(r[monitor_id][0]["status"]) == MonitorStatus)
+        r = self.api.get_monitor_many([monitor_id])
+        self.compare(r[monitor_id], expected_monitor)
+
         # delete monitor
         r = self.api.delete_monitor(monitor_id)
         self.assertEqual(r["msg"], "successDeleted")
@@ -93,6 +107,56 @@ class TestMonitor(UptimeKumaTestCase):
         self.compare(monitor, expected_monitor)
         return monitor
 
+    def test_get_revision(self):
+        self.api.get_monitors()
+        revision = self.api.get_revision(Event.MONITOR_LIST)
+        self.assertEqual(self.api.get_revision(Event.MONITOR_LIST), revision)
+
+        self.add_monitor()
+        self.api.get_monitors()
+        self.assertGreater(self.api.get_revision(Event.MONITOR_LIST), revision)
+
+    def test_find_monitors(self):
+        http_monitor_id = self.add_monitor(name="find http")
+        ping_monitor_id = self.api.add_monitor(
+            type=MonitorType.PING,
+            name="find ping",
+            hostname="127.0.0.1"
+        )["monitorID"]
+        self.api.pause_monitor(ping_monitor_id)
+        self.api.get_monitors()
+
+        ids = [monitor["id"] for monitor in self.api.find_monitors(name_prefix="FIND")]
+        self.assertEqual(ids, sorted([http_monitor_id, ping_monitor_id]))
+
+        ids = [monitor["id"] for monitor in self.api.find_monitors(type=MonitorType.PING, active=False)]
+        self.assertEqual(ids, [ping_monitor_id])
+
+        page = self.api.find_monitors(name_prefix="find", limit=1)
+        self.assertEqual(len(page), 1)
+        next_page = self.api.find_monitors(name_prefix="find", after=page[0]["id"], limit=1)
+        self.assertEqual(len(next_page), 1)
+        self.assertGreater(next_page[0]["id"], page[0]["id"])
+
+    def test_run_monitor_operations(self):
+        monitor_id = self.add_monitor()
+        paused_monitor_id = self.add_monitor(name="monitor 2")
+        results = self.api.run_monitor_operations([
+            {"action": "add", "type": MonitorType.HTTP, "name": "bulk monitor", "url": "http://127.0.0.1"},
+            {"action": "edit", "id": monitor_id, "name": "monitor 1 bulk"},
+            {"action": "pause", "id": paused_monitor_id},
+            {"action": "delete", "id": 42},
+            {"action": "add", "type": MonitorType.HTTP}
+        ])
+        self.assertEqual([result["ok"] for result in results], [True, True, True, False, False])
+
+        monitors = self.api.get_monitors(refresh=False)
+        added = self.find_by_id(monitors, results[0]["monitorID"])
+        self.assertEqual(added["name"], "bulk monitor")
+        monitor = self.find_by_id(monitors, monitor_id)
+        self.assertEqual(monitor["name"], "monitor 1 bulk")
+        self.assertFalse(self.find_by_id(monitors, paused_monitor_id)["active"])
+
     def test_monitor_type_http(self):
         proxy_id = self.add_proxy()
 
@@ -384,6 +448,20 @@ class TestMonitor(UptimeKumaTestCase):
         with self.assertRaises(UptimeKumaException):
             self.api.delete_monitor(42)
 
+    def test_get_monitors_without_refresh(self):
+        monitor_id = self.add_monitor()
+
+        monitors = self.api.get_monitors(refresh=False)
+        monitor = self.find_by_id(monitors, monitor_id)
+        self.assertIsNotNone(monitor)
+        self.assertTrue(type(monitor["type"]) == MonitorType)
+
+        monitor = self.api.get_monitor(monitor_id, refresh=False)
+        self.assertEqual(monitor["id"], monitor_id)
+
+        with self.assertRaises(UptimeKumaException):
+            self.api.get_monitor(42, refresh=False)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,179 @@
+import threading
+import unittest
+from unittest import mock
+
+from uptime_kuma_api import MonitorStatus, MonitorType, UptimeKumaApi
+from uptime_kuma_api.monitor_index import MonitorIndex
+
+
+def monitor(id_, name=None, type_=MonitorType.HTTP, active=True, parent=None, tags=()):
+    return {
+        "id": id_,
+        "name": name or f"monitor {id_}",
+        "type": type_,
+        "active": active,
+        "parent": parent,
+        "tags": [{"tag_id": tag_id, "monitor_id": id_, "value": ""} for tag_id in tags]
+    }
+
+
+class TestMonitorIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = MonitorIndex([
+            monitor(1, tags=[1]),
+            monitor(2, type_=MonitorType.PING, tags=[1, 2]),
+            monitor(3, type_=MonitorType.GROUP, active=False),
+            monitor(4, parent=3, tags=[2])
+        ])
+
+    def test_add(self):
+        self.index.add(monitor(5, name="Google", type_=MonitorType.PING, parent=3, tags=[2]))
+        self.assertEqual(self.index.ids("by_type", MonitorType.PING), [2, 5])
+        self.assertEqual(self.index.ids("by_parent", 3), [4, 5])
+        self.assertEqual(self.index.ids("by_tag", 2), [2, 4, 5])
+        self.assertEqual(self.index.find(name_prefix="goo"), [5])
+        self.assertEqual(self.index.find(), [1, 2, 3, 4, 5])
+
+    def test_remove(self):
+        self.index.set_status(2, int(MonitorStatus.UP))
+        self.index.remove(2)
+        self.assertEqual(self.index.find(), [1, 3, 4])
+        self.assertEqual(self.index.ids("by_type", MonitorType.PING), [])
+        self.assertEqual(self.index.ids("by_tag", 1), [1])
+        self.assertEqual(self.index.find(status=MonitorStatus.UP), [])
+        # empty keys are dropped from the tables
+        self.assertNotIn(MonitorType.PING, self.index.tables()["by_type"])
+        self.assertNotIn(int(MonitorStatus.UP), self.index.tables()["by_status"])
+
+        # removing an unknown monitor is ignored
+        self.index.remove(2)
+        self.assertEqual(self.index.find(), [1, 3, 4])
+
+    def test_retag(self):
+        self.index.add(monitor(1, tags=[2, 3]))
+        self.assertEqual(self.index.ids("by_tag", 1), [2])
+        self.assertEqual(self.index.ids("by_tag", 2), [1, 2, 4])
+        self.assertEqual(self.index.ids("by_tag", 3), [1])
+
+        self.index.add(monitor(1))
+        self.assertEqual(self.index.ids("by_tag", 2), [2, 4])
+        self.assertNotIn(3, self.index.tables()["by_tag"])
+
+    def test_update(self):
+        self.index.add(monitor(4, name="renamed", type_=MonitorType.PING, active=False))
+        self.assertEqual(self.index.ids("by_type", MonitorType.HTTP), [1])
+        self.assertEqual(self.index.ids("by_type", MonitorType.PING), [2, 4])
+        self.assertEqual(self.index.ids("by_active", False), [3, 4])
+        self.assertEqual(self.index.ids("by_parent", 0), [1, 2, 3, 4])
+        self.assertEqual(self.index.find(name_prefix="monitor"), [1, 2, 3])
+        self.assertEqual(self.index.find(name_prefix="renamed"), [4])
+        self.assertEqual(self.index.find(), [1, 2, 3, 4])
+
+    def test_status_transitions(self):
+        self.index.set_status(1, int(MonitorStatus.UP))
+        self.index.set_status(2, int(MonitorStatus.UP))
+        self.assertEqual(self.index.find(status=MonitorStatus.UP), [1, 2])
+
+        self.index.set_status(1, int(MonitorStatus.DOWN))
+        self.assertEqual(self.index.find(status=MonitorStatus.UP), [2])
+        self.assertEqual(self.index.find(status=MonitorStatus.DOWN), [1])
+
+        self.index.set_status(1, None)
+        self.assertEqual(self.index.find(status=MonitorStatus.DOWN), [])
+
+        # the status is kept when the monitor is updated or the list is replaced
+        self.index.add(monitor(2, name="renamed"))
+        self.index.reset(self.index.monitors.values())
+        self.assertEqual(self.index.find(status=MonitorStatus.UP), [2])
+
+    def test_status_before_monitor(self):
+        self.index.set_status(5, int(MonitorStatus.UP))
+        self.assertEqual(self.index.find(status=MonitorStatus.UP), [])
+        self.index.add(monitor(5))
+        self.assertEqual(self.index.find(status=MonitorStatus.UP), [5])
+
+    def test_reset(self):
+        self.index.set_status(1, int(MonitorStatus.UP))
+        self.index.set_status(2, int(MonitorStatus.UP))
+        self.index.reset([monitor(2), monitor(6, tags=[1])])
+        self.assertEqual(self.index.find(), [2, 6])
+        self.assertEqual(self.index.ids("by_tag", 1), [6])
+        # the status of the removed monitor is dropped
+        self.assertEqual(self.index.find(status=MonitorStatus.UP), [2])
+        self.assertEqual(self.index.tables()["by_status"], {int(MonitorStatus.UP): [2]})
+
+    def test_find(self):
+        self.assertEqual(self.index.find(tag_id=2, type=MonitorType.HTTP), [4])
+        self.assertEqual(self.index.find(active=True), [1, 2, 4])
+        self.assertEqual(self.index.find(after=1, limit=2), [2, 3])
+        self.assertEqual(self.index.find(tag_id=9), [])
+
+
+def pushed(monitor):
+    # the monitors the server pushes map the notification ids to True
+    return {**monitor, "notificationIDList": {}}
+
+
+class TestMonitorIndexEvents(unittest.TestCase):
+    def setUp(self):
+        with mock.patch.object(UptimeKumaApi, "connect"):
+            self.api = UptimeKumaApi("http://127.0.0.1:3001", timeout=1)
+        self.api._event_monitor_list({str(i): pushed(monitor(i, tags=[1])) for i in range(1, 4)})
+
+    def test_update_monitor_into_list(self):
+        self.api._event_update_monitor_into_list({"2": pushed(monitor(2, type_=MonitorType.PING, tags=[2]))})
+        self.assertEqual(self.api.get_monitor_ids_by_tag(1), [1, 3])
+        self.assertEqual(self.api.get_monitor_ids_by_tag(2), [2])
+        self.assertEqual(self.api.get_monitor_ids_by_type(MonitorType.PING), [2])
+
+    def test_delete_monitor_from_list(self):
+        self.api._event_heartbeat({
+            "monitorID": 2,
+            "status": MonitorStatus.DOWN,
+            "time": "2022-12-15 12:38:42.661",
+            "msg": "timeout",
+            "ping": None,
+            "important": True,
+            "duration": 0
+        })
+        self.assertEqual(self.api.get_monitor_ids_by_status(MonitorStatus.DOWN), [2])
+        self.api._event_delete_monitor_from_list(2)
+        self.assertEqual(self.api.get_monitor_ids_by_tag(1), [1, 3])
+        self.assertEqual(self.api.get_monitor_ids_by_status(MonitorStatus.DOWN), [])
+
+    def test_unknown_status(self):
+        heartbeat = {
+            "monitorID": 2,
+            "status": 9,
+            "time": "2022-12-15 12:38:42.661",
+            "msg": "",
+            "ping": None,
+            "important": False,
+            "duration": 0
+        }
+        self.api._event_heartbeat(heartbeat)
+        # the status is kept as sent
+        self.assertEqual(self.api.get_monitor_status(2), 9)
+        self.assertEqual(self.api.get_monitor_statuses()[2]["status"], 9)
+        self.assertEqual(self.api.get_monitor_ids_by_status(9), [2])
+
+        self.api._event_heartbeat({**heartbeat, "status": MonitorStatus.UP})
+        self.assertEqual(self.api.get_monitor_status(2), MonitorStatus.UP)
+        self.assertEqual(self.api.get_monitor_ids_by_status(9), [])
+
+    def test_run_monitor_operations_waits_for_list(self):
+        def call(event, data=None):
+            if event == "getMonitorList":
+                # the handler of the pushed list runs after the response
+                pushed_list = {str(i): pushed(monitor(i, active=i != 2, tags=[1])) for i in range(1, 4)}
+                threading.Timer(0.1, self.api._event_monitor_list, (pushed_list,)).start()
+            return {"msg": "Paused Successfully."}
+
+        self.api._call = call
+        results = self.api.run_monitor_operations([{"action": "pause", "id": 2}])
+        self.assertEqual(results, [{"ok": True, "msg": "Paused Successfully."}])
+        self.assertEqual(self.api.find_monitors(active=False)[0]["id"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,9 @@ class TestMonitorTag(UptimeKumaTestCase):
         monitor = self.find_by_id(monitors, monitor_id)
         self.assertEqual(monitor["tags"][0]["tag_id"], tag_id)
 
+        # check if monitor is indexed by tag
+        self.assertEqual(self.api.get_monitor_ids_by_tag(tag_id), [monitor_id])
+
         # delete monitor tag
         r = self.api.delete_monitor_tag(**expected_monitor_tag)
         self.assertEqual(r["msg"], "Deleted Successfully.")
@@ -32,6 +35,7 @@ class TestMonitorTag(UptimeKumaTestCase):
         monitors = self.api.get_monitors()
         monitor = self.find_by_id(monitors, monitor_id)
         self.assertEqual(monitor["tags"], [])
+        self.assertEqual(self.api.get_monitor_ids_by_tag(tag_id), [])
 
     def test_delete_not_existing_monitor_tag(self):
         with self.assertRaises(UptimeKumaException):
@@ -0,0 +1,85 @@
+import unittest
+from unittest import mock
+
+from uptime_kuma_api import Event, FrozenList, MonitorStatus, UptimeKumaApi
+from uptime_kuma_api.ring_buffer import RingBuffer
+
+
+def heartbeat(i, important=True):
+    return {
+        "monitorID": 1,
+        "status": MonitorStatus.UP,
+        "time": f"2022-12-15 12:38:{i:02}.000",
+        "msg": "200 - OK",
+        "ping": 201,
+        "important": important,
+        "duration": 0
+    }
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_capacity(self):
+        buffer = RingBuffer(3, range(5))
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.snapshot(), [2, 3, 4])
+
+    def test_append(self):
+        buffer = RingBuffer(3)
+        for i in range(5):
+            buffer.append(i)
+        # the oldest items are evicted, the order is kept
+        self.assertEqual(buffer.snapshot(), [2, 3, 4])
+
+    def test_appendleft(self):
+        buffer = RingBuffer(3)
+        for i in range(5):
+            buffer.appendleft(i)
+        self.assertEqual(buffer.snapshot(), [4, 3, 2])
+
+    def test_extend(self):
+        buffer = RingBuffer(3, [1])
+        buffer.extend([2, 3, 4])
+        self.assertEqual(buffer.snapshot(), [2, 3, 4])
+
+    def test_snapshot(self):
+        buffer = RingBuffer(3, [1, 2])
+        snapshot = buffer.snapshot()
+        self.assertIsInstance(snapshot, FrozenList)
+        self.assertIs(buffer.snapshot(), snapshot)
+        with self.assertRaises(TypeError):
+            snapshot.append(3)
+
+        # a change builds a new snapshot, the old one is unchanged
+        buffer.append(3)
+        self.assertEqual(buffer.snapshot(), [1, 2, 3])
+        self.assertEqual(snapshot, [1, 2])
+
+
+class TestImportantHeartbeatCapacity(unittest.TestCase):
+    def setUp(self):
+        with mock.patch.object(UptimeKumaApi, "connect"):
+            self.api = UptimeKumaApi("http://127.0.0.1:3001", timeout=1, important_heartbeat_capacity=2)
+
+    def important_times(self):
+        return [heartbeat["time"] for heartbeat in self.api._event_data[Event.IMPORTANT_HEARTBEAT_LIST][1].snapshot()]
+
+    def test_pushed_heartbeats(self):
+        for i in range(4):
+            self.api._event_heartbeat(heartbeat(i))
+        self.api._event_heartbeat(heartbeat(4, important=False))
+        # the newest important heartbeat comes first
+        self.assertEqual(self.important_times(), ["2022-12-15 12:38:03.000", "2022-12-15 12:38:02.000"])
+
+    def test_list(self):
+        self.api._event_important_heartbeat_list("1", [heartbeat(i) for i in reversed(range(4))], True)
+        self.assertEqual(self.important_times(), ["2022-12-15 12:38:03.000", "2022-12-15 12:38:02.000"])
+
+    def test_older_heartbeats_keep_the_newest(self):
+        self.api._event_important_heartbeat_list("1", [heartbeat(3)], True)
+        self.api._event_heartbeat(heartbeat(4))
+        self.api._event_important_heartbeat_list("1", [heartbeat(2), heartbeat(1)], False)
+        self.assertEqual(self.important_times(), ["2022-12-15 12:38:04.000", "2022-12-15 12:38:03.000"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,6 +26,14 @@ class TestTag(UptimeKumaTestCase):
         self.assertIsNotNone(tag)
         self.compare(tag, expected_tag)
 
+        # get tags by id
+        tags = self.api.get_tags(ids=[tag_id, 42])
+        self.assertEqual([tag["id"] for tag in tags], [tag_id])
+
+        # get tag by name
+        tag = self.api.get_tag_by_name(expected_tag["name"])
+        self.assertEqual(tag["id"], tag_id)
+
         # edit tag
         expected_tag["name"] = "tag 1 new"
         expected_tag["color"] = "#000000"
@@ -0,0 +1,89 @@
+import time
+import unittest
+from unittest import mock
+
+from uptime_kuma_api import UptimeKumaApi, UptimeKumaException
+from uptime_kuma_api.api import TAG_REGISTRY_TTL
+from uptime_kuma_api.tag_registry import TagRegistry
+
+TAGS = [
+    {"id": 1, "name": "tag 1", "color": "#ffffff"},
+    {"id": 2, "name": "tag 2", "color": "#000000"}
+]
+
+
+class TestTagRegistry(unittest.TestCase):
+    def setUp(self):
+        with mock.patch.object(UptimeKumaApi, "connect"):
+            self.api = UptimeKumaApi("http://127.0.0.1:3001", timeout=1)
+        self.tags = list(TAGS)
+        self.requests = 0
+
+        def call(event, data=None):
+            self.assertEqual(event, "getTags")
+            self.requests += 1
+            return {"tags": self.tags}
+
+        self.api._call = call
+
+    def test_refresh_by_default(self):
+        self.assertEqual(self.api.get_tags(), TAGS)
+        self.api.get_tags()
+        self.api.get_tag(1)
+        self.api.get_tag_by_name("tag 1")
+        self.assertEqual(self.requests, 4)
+
+    def test_cache(self):
+        self.api.get_tags(refresh=False)
+        self.assertEqual(self.api.get_tags(ids=[2, 1], refresh=False), [TAGS[1], TAGS[0]])
+        self.assertEqual(self.api.get_tag(2, refresh=False), TAGS[1])
+        self.assertEqual(self.requests, 1)
+
+    def test_ttl(self):
+        with mock.patch("uptime_kuma_api.tag_registry.time.monotonic", return_value=1000):
+            self.api.get_tags(refresh=False)
+        self.tags = TAGS + [{"id": 3, "name": "tag 3", "color": "#ff0000"}]
+        with mock.patch("uptime_kuma_api.tag_registry.time.monotonic", return_value=1000 + TAG_REGISTRY_TTL - 1):
+            self.assertEqual(len(self.api.get_tags(refresh=False)), 2)
+        with mock.patch("uptime_kuma_api.tag_registry.time.monotonic", return_value=1000 + TAG_REGISTRY_TTL):
+            self.assertEqual(len(self.api.get_tags(refresh=False)), 3)
+        self.assertEqual(self.requests, 2)
+
+    def test_name_lookup(self):
+        self.assertEqual(self.api.get_tag_by_name("tag 2", refresh=False), TAGS[1])
+        # names are case-sensitive like on the server
+        with self.assertRaises(UptimeKumaException):
+            self.api.get_tag_by_name("TAG 2", refresh=False)
+
+        # a tag added by another client is found by requesting the tags again
+        self.tags = TAGS + [{"id": 3, "name": "tag 3", "color": "#ff0000"}]
+        self.assertEqual(self.api.get_tag_by_name("tag 3", refresh=False)["id"], 3)
+
+    def test_unknown_tags_are_requested_once(self):
+        self.api.get_tags(refresh=False)
+        for _ in range(3):
+            with self.assertRaises(UptimeKumaException):
+                self.api.get_tag(42, refresh=False)
+            with self.assertRaises(UptimeKumaException):
+                self.api.get_tag_by_name("tag 42", refresh=False)
+            self.assertEqual(self.api.get_tags(ids=[1, 42], refresh=False), [TAGS[0]])
+        # the first lookups of the id and the name request the tags again, the misses are remembered
+        self.assertEqual(self.requests, 3)
+
+        # the misses expire with the cache
+        self.tags = TAGS + [{"id": 42, "name": "tag 42", "color": "#ff0000"}]
+        expired = time.monotonic() + TAG_REGISTRY_TTL
+        with mock.patch("uptime_kuma_api.tag_registry.time.monotonic", return_value=expired):
+            self.assertEqual(self.api.get_tag(42, refresh=False)["name"], "tag 42")
+
+    def test_registry(self):
+        registry = TagRegistry(TAGS, TAG_REGISTRY_TTL)
+        self.assertEqual(registry.get(1), TAGS[0])
+        self.assertEqual(registry.get_by_name("tag 2"), TAGS[1])
+        self.assertIsNone(registry.get(3))
+        self.assertFalse(registry.is_stale())
+        self.assertTrue(TagRegistry(TAGS, 0).is_stale())
+
+
+if __name__ == '__main__':
+    unittest.main()
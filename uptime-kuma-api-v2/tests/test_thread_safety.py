@@ -0,0 +1,56 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from uptime_kuma_api import Event, MonitorStatus, MonitorType
+from uptime_kuma_test_case import UptimeKumaTestCase
+
+
+class TestThreadSafety(UptimeKumaTestCase):
+    def test_concurrent_reads_and_writes(self):
+        tag_id = self.add_tag()
+        monitor_ids = [self.add_monitor(name=f"monitor {i}") for i in range(5)]
+        # the readers ask for the status, which is only known after the first heartbeat of each monitor
+        self.assertTrue(self.api.wait_for_monitor_data(Event.HEARTBEAT_LIST, timeout=30))
+
+        def read(i):
+            monitor_id = monitor_ids[i % len(monitor_ids)]
+            self.api.get_monitors(refresh=False)
+            self.api.get_monitor(monitor_id, refresh=False)
+            self.api.find_monitors(type=MonitorType.HTTP, name_prefix="monitor")
+            self.api.get_monitor_indexes()
+            self.api.get_monitor_statuses()
+            self.api.get_heartbeats(limit=10)
+            self.api.get_monitor_beats(monitor_id, 1, refresh=False)
+            return self.api.get_monitor_status(monitor_id)
+
+        def write(i):
+            monitor_id = monitor_ids[i % len(monitor_ids)]
+            if i % 3 == 0:
+                self.api.pause_monitor(monitor_id)
+                self.api.resume_monitor(monitor_id)
+            elif i % 3 == 1:
+                self.api.edit_monitor(monitor_id, refresh=False, name=f"monitor {i}")
+            else:
+                self.api.add_monitor_tag(tag_id, monitor_id, f"value {i}")
+            return monitor_id
+
+        # one client instance serves all threads
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            reads = [executor.submit(read, i) for i in range(100)]
+            writes = [executor.submit(write, i) for i in range(30)]
+            for future in reads:
+                self.assertTrue(type(future.result()) == MonitorStatus)
+            for future in writes:
+                future.result()
+
+        # the indexes match the monitor list after the concurrent updates
+        self.api.get_monitors()
+        monitors = self.api.get_monitors(refresh=False)
+        ids = [monitor["id"] for monitor in monitors if monitor["type"] == MonitorType.HTTP]
+        self.assertEqual(self.api.get_monitor_ids_by_type(MonitorType.HTTP), sorted(ids))
+        tagged = [monitor["id"] for monitor in monitors if any(tag["tag_id"] == tag_id for tag in monitor["tags"])]
+        self.assertEqual(self.api.get_monitor_ids_by_tag(tag_id), sorted(tagged))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,5 +9,7 @@ from .docker_type import DockerType
 from .maintenance_strategy import MaintenanceStrategy
 from .exceptions import UptimeKumaException, Timeout
 from .event import Event
+from .frozen import FrozenDict, FrozenList, thaw
 from .api import UptimeKumaApi
+from .async_api import AsyncUptimeKumaApi
 from .dto import MonitorBuilder
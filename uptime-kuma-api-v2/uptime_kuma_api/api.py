@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import itertools
 import json
 import random
 import string
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
-from copy import deepcopy
 from typing import Any
 
 import requests
 import socketio
+from requests.adapters import HTTPAdapter
 from packaging.version import parse as parse_version
 
 from . import (
@@ -29,6 +33,11 @@ from . import (
     notification_provider_options
 )
 
+from .frozen import FrozenDict, freeze, thaw
+from .heartbeat_store import HeartbeatBuffer
+from .monitor_index import MonitorIndex
+from .ring_buffer import RingBuffer
+from .tag_registry import TagRegistry
 from .docstrings import (
     append_docstring,
     docker_host_docstring,
@@ -39,6 +48,47 @@ from .docstrings import (
     tag_docstring
 )
 
+# per-monitor events that uptime kuma only sends if there are monitors
+MONITOR_EVENTS = [
+    Event.AVG_PING,
+    Event.UPTIME,
+    Event.HEARTBEAT_LIST,
+    Event.IMPORTANT_HEARTBEAT_LIST,
+    Event.CERT_INFO
+]
+
+# uptime kuma sends the uptime of these periods (in hours) for every monitor
+UPTIME_PERIODS = [24, 720]
+
+# the quiet period after the last event of a burst is a multiple of the measured gap between its events
+QUIET_PERIOD_FACTOR = 4
+QUIET_PERIOD_MIN = 0.005
+
+# seconds after which the cached tags are requested again, changes made by this client invalidate them earlier
+TAG_REGISTRY_TTL = 60
+
+# actions of the bulk monitor operations and their socket events
+MONITOR_OPERATIONS = {
+    "add": "add",
+    "edit": "editMonitor",
+    "delete": "deleteMonitor",
+    "pause": "pauseMonitor",
+    "resume": "resumeMonitor"
+}
+
+# the revisions of the event data are drawn from a shared counter, so that a revision identifies the data
+# of one client instance at one point in time
+_revisions = itertools.count(1)
+
+
+def _synchronized(method):
+    # runs the method while holding the lock of the event data
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 def int_to_bool(data, keys) -> None:
     if isinstance(data, list):
@@ -116,6 +166,35 @@ def _convert_monitor_return(monitor) -> None:
         monitor["notificationIDList"] = [int(i) for i in monitor["notificationIDList"].keys()]
 
 
+def _parse_monitor(monitor) -> None:
+    _convert_monitor_return(monitor)
+    int_to_bool(monitor, ["active"])
+    parse_monitor_type(monitor)
+    parse_auth_method(monitor)
+
+
+def _check_response(r) -> Any:
+    # raises the error of a failed call and removes the ok flag of a successful one
+    if isinstance(r, dict) and "ok" in r:
+        if not r["ok"]:
+            raise UptimeKumaException(r.get("msg"))
+        r.pop("ok")
+    return r
+
+
+def _parse_heartbeats(heartbeats) -> None:
+    int_to_bool(heartbeats, ["important"])
+    parse_monitor_status(heartbeats)
+
+
+def _snapshot_value(value) -> Any:
+    if isinstance(value, RingBuffer):
+        return value.snapshot()
+    if isinstance(value, HeartbeatBuffer):
+        return value.heartbeats()
+    return value
+
+
 def _convert_monitor_input(kwargs) -> None:
     if not kwargs["accepted_statuscodes"]:
         kwargs["accepted_statuscodes"] = ["200-299"]
@@ -445,6 +524,12 @@ class UptimeKumaApi(object):
                 url="https://google.com"
             )
 
+    An instance is thread-safe and can be shared by the threads of a thread pool after the login. The socketio
+    client runs every event handler in its own thread. The handlers update the pushed data while holding a lock of
+    the instance, and readers take the same lock to copy the data. The pushed data is returned as frozen objects that
+    are never changed afterwards. Calls to the server from several threads are in flight at the same time on the one
+    connection. Log in once before sharing the instance, the login itself is not meant to run concurrently.
+
     :param str url: The url to the Uptime Kuma instance. For example ``http://127.0.0.1:3001``
     :param float timeout: How many seconds the client should wait for the connection, an expected event or a server
                           response. Default is ``10``.
@@ -452,14 +537,20 @@ class UptimeKumaApi(object):
     :param bool ssl_verify: ``True`` to verify SSL certificates, or ``False`` to skip SSL certificate
                             verification, allowing connections to servers with self signed certificates.
                             Default is ``True``.
-    :param float wait_events: How many seconds the client should wait for the next event of the same type.
-                              There is no way to determine when the last message of a certain type has arrived.
-                              Therefore, a timeout is required. If no further message has arrived within this time,
-                              it is assumed that it was the last message. Defaults is ``0.2``.
+    :param float wait_events: The maximum number of seconds the client waits for the next event of the same type.
+                              Per-monitor events are complete as soon as every monitor of the monitor list is
+                              covered. Otherwise the client waits until no further message arrived for a few times
+                              the measured gap between the messages, but never longer than this value.
+                              Defaults is ``0.2``.
     :param logger: To enable logging set to ``True`` or pass a logger object to
                    use. To disable logging set to ``False``. The default is
                    ``False``. Note that fatal errors are logged even when
                    ``logger`` is ``False``.
+    :param int heartbeat_capacity: How many of the latest heartbeats are kept for each monitor. Default is ``150``.
+    :param int important_heartbeat_capacity: How many of the latest important heartbeats are kept for each monitor.
+                                             Default is ``500``.
+    :param int http_pool_size: How many keep-alive connections the client keeps open for its HTTP requests.
+                               Default is ``10``.
     :raises UptimeKumaException: When connection to server failed.
     """
     def __init__(
@@ -470,14 +561,28 @@ class UptimeKumaApi(object):
             ssl_verify: bool = True,
             wait_events: float = 0.2,
             logger=False,
+            heartbeat_capacity: int = 150,
+            important_heartbeat_capacity: int = 500,
+            http_pool_size: int = 10,
     ) -> None:
         self.url = url.rstrip("/")
         self.timeout = timeout
         self.headers = headers
         self.wait_events = wait_events
-        self.sio = socketio.Client(ssl_verify=ssl_verify, logger=logger)
+        self.heartbeat_capacity = heartbeat_capacity
+        self.important_heartbeat_capacity = important_heartbeat_capacity
+        # the HTTP requests of the client and the socketio polling transport share the keep-alive connections
+        self.http = requests.Session()
+        self.http.verify = ssl_verify
+        adapter = HTTPAdapter(pool_maxsize=http_pool_size)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        self.sio = socketio.Client(ssl_verify=ssl_verify, logger=logger, http_session=self.http)
         self.ssl_verify = ssl_verify
 
+        # login token of the current session, used to re-authenticate after a reconnect
+        self._token = None
+
         self._event_data: dict = {
             Event.MONITOR_LIST: None,
             Event.NOTIFICATION_LIST: None,
@@ -494,10 +599,30 @@ class UptimeKumaApi(object):
             Event.MAINTENANCE_LIST: None,
             Event.API_KEY_LIST: None
         }
+        # guards the event data and everything derived from it, the socketio client runs every event handler
+        # in its own thread while the threads of the caller read the data
+        self._lock = threading.RLock()
+        # signaled by the event handlers when the data of the event changes, the conditions share the lock
+        self._event_conditions = {event: threading.Condition(self._lock) for event in self._event_data}
+        # event -> (time of the last event, average gap between the events of a burst)
+        self._event_arrivals: dict = {}
+        # the event data is replaced by a new version on every change, readers share the frozen snapshot
+        self._event_versions: dict = {event: next(_revisions) for event in self._event_data}
+        self._event_snapshots: dict = {}
+        # secondary indexes over the monitor list, kept up to date by the event handlers
+        self._monitor_index = MonitorIndex()
+        # the tags are not pushed by the server, they are cached after the first request
+        self._tag_registry = None
+        # monitor id -> status and time of the last heartbeat
+        self._last_heartbeats: dict = {}
+        # monitor id -> revision the monitor was last stored with
+        self._monitor_revisions: dict = {}
 
         self.sio.on(Event.CONNECT, self._event_connect)
         self.sio.on(Event.DISCONNECT, self._event_disconnect)
         self.sio.on(Event.MONITOR_LIST, self._event_monitor_list)
+        self.sio.on(Event.UPDATE_MONITOR_INTO_LIST, self._event_update_monitor_into_list)
+        self.sio.on(Event.DELETE_MONITOR_FROM_LIST, self._event_delete_monitor_from_list)
         self.sio.on(Event.NOTIFICATION_LIST, self._event_notification_list)
         self.sio.on(Event.PROXY_LIST, self._event_proxy_list)
         self.sio.on(Event.STATUS_PAGE_LIST, self._event_status_page_list)
@@ -531,134 +656,369 @@ class UptimeKumaApi(object):
         except:
             raise
         else:
-            timestamp = time.time()
-            while self._event_data[event] is None:
-                if time.time() - timestamp > self.timeout:
-                    raise Timeout(f"Timed out while waiting for event {event}")
-                time.sleep(0.01)
-
-    def _get_event_data(self, event) -> Any:
-        monitor_events = [Event.AVG_PING, Event.UPTIME, Event.HEARTBEAT_LIST, Event.IMPORTANT_HEARTBEAT_LIST, Event.CERT_INFO, Event.HEARTBEAT]
-        timestamp = time.time()
-        while self._event_data[event] is None:
-            if time.time() - timestamp > self.timeout:
+            if not self._wait_for(event, lambda: self._event_data[event] is not None):
                 raise Timeout(f"Timed out while waiting for event {event}")
-            # do not wait for events that are not sent
-            if self._event_data[Event.MONITOR_LIST] == {} and event in monitor_events:
-                return []
-            time.sleep(0.01)
-        time.sleep(self.wait_events)  # wait for multiple messages
-        return deepcopy(self._event_data[event].copy())
+
+    def _wait_for(self, event, predicate, timeout: float = None) -> bool:
+        # blocks until the handler of the event signals that the predicate is true or the timeout expires
+        condition = self._event_conditions[event]
+        with condition:
+            return condition.wait_for(predicate, self.timeout if timeout is None else timeout)
+
+    def _notify(self, event) -> None:
+        # wakes up the threads waiting for the event
+        condition = self._event_conditions[event]
+        with condition:
+            self._record_event(event)
+            condition.notify_all()
+        if event == Event.MONITOR_LIST:
+            # the per-monitor events are complete once they match the new monitor list
+            for monitor_event in MONITOR_EVENTS:
+                condition = self._event_conditions[monitor_event]
+                with condition:
+                    condition.notify_all()
+
+    def _record_event(self, event) -> None:
+        self._event_versions[event] = next(_revisions)
+        now = time.monotonic()
+        last, gap = self._event_arrivals.get(event, (None, None))
+        if last is not None and now - last < self.wait_events:
+            # the gaps between bursts are not part of the average
+            gap = now - last if gap is None else (gap + now - last) / 2
+        self._event_arrivals[event] = (now, gap)
+
+    @_synchronized
+    def _is_complete(self, event) -> bool:
+        # per-monitor events are complete when every monitor of the monitor list has sent them
+        if event not in MONITOR_EVENTS:
+            return True
+        monitors = self._event_data[Event.MONITOR_LIST]
+        data = self._event_data[event]
+        if monitors is None or event == Event.CERT_INFO:
+            # cert info is only sent for monitors with a certificate
+            return False
+        for monitor_id in monitors:
+            monitor_data = data.get(int(monitor_id))
+            if monitor_data is None:
+                return False
+            if event == Event.UPTIME and not all(i in monitor_data for i in UPTIME_PERIODS):
+                return False
+        return True
+
+    @_synchronized
+    def _is_ready(self, event) -> bool:
+        # the data of the event has arrived for every monitor of the monitor list
+        monitors = self._event_data[Event.MONITOR_LIST]
+        if monitors is None:
+            return False
+        if not monitors:
+            return True
+        return self._event_data[event] is not None and self._is_complete(event)
+
+    def _check_ready_event(self, event) -> None:
+        if event not in MONITOR_EVENTS or event == Event.CERT_INFO:
+            raise ValueError(f"Readiness is not supported for event {event}")
+
+    def _quiet_period(self, event) -> float:
+        # remaining time until the burst of events is considered to be finished
+        last, gap = self._event_arrivals.get(event, (None, None))
+        if last is None:
+            return 0
+        if gap is None:
+            quiet_period = self.wait_events
+        else:
+            quiet_period = min(self.wait_events, max(gap * QUIET_PERIOD_FACTOR, QUIET_PERIOD_MIN))
+        return last + quiet_period - time.monotonic()
+
+    def _wait_for_burst(self, event) -> None:
+        # returns once the last message of the event has arrived
+        condition = self._event_conditions[event]
+        with condition:
+            while not self._is_complete(event):
+                remaining = self._quiet_period(event)
+                if remaining <= 0:
+                    break
+                condition.wait(remaining)
+
+    @_synchronized
+    def _snapshot(self, event) -> Any:
+        # the snapshot is only rebuilt if the event data has changed since the last read
+        version = self._event_versions[event]
+        snapshot = self._event_snapshots.get(event)
+        if snapshot is None or snapshot[0] != version:
+            data = self._event_data[event]
+            if isinstance(data, dict) and not isinstance(data, FrozenDict):
+                # the values are frozen by the event handlers, only the outer dict needs to be copied
+                data = FrozenDict((key, _snapshot_value(value)) for key, value in data.items())
+            snapshot = (version, data)
+            if event != Event.HEARTBEAT_LIST:
+                # the heartbeat dicts are built on demand and not kept
+                self._event_snapshots[event] = snapshot
+        return snapshot[1]
+
+    def _wait_for_event_data(self, event) -> bool:
+        # returns False if the event is not sent at all
+        def no_monitors():
+            return self._event_data[Event.MONITOR_LIST] == {} and event in MONITOR_EVENTS
+
+        self._wait_for(event, lambda: self._event_data[event] is not None or no_monitors())
+        if self._event_data[event] is None:
+            if no_monitors():
+                return False
+            raise Timeout(f"Timed out while waiting for event {event}")
+        self._wait_for_burst(event)  # wait for multiple messages
+        return True
+
+    def _get_event_data(self, event, copy: bool = False) -> Any:
+        if not self._wait_for_event_data(event):
+            return []
+        if copy:
+            return thaw(self._snapshot(event))
+        return self._snapshot(event)
+
+    @_synchronized
+    def _pushed_copy(self, event, key, revision: int = None) -> dict | None:
+        # mutable copy of an item of the pushed list, None if it is unknown or the list changed since the revision
+        if revision is not None and revision != self._event_versions[event]:
+            return None
+        item = (self._event_data[event] or {}).get(key)
+        if item is None:
+            return None
+        return thaw(item)
 
     def _call(self, event, data=None) -> Any:
         r = self.sio.call(event, data, timeout=self.timeout)
-        if isinstance(r, dict) and "ok" in r:
-            if not r["ok"]:
-                raise UptimeKumaException(r.get("msg"))
-            r.pop("ok")
-        return r
+        return _check_response(r)
+
+    def _call_future(self, event, data=None) -> Future:
+        # sends the event without blocking, socketio matches the acknowledgement to the call by its id
+        future = Future()
+
+        def ack(r=None, *args) -> None:
+            try:
+                future.set_result(_check_response(r))
+            except UptimeKumaException as e:
+                future.set_exception(e)
+
+        self.sio.emit(event, data, callback=ack)
+        return future
+
+    def _call_many(self, event, data: list) -> list:
+        # all calls are in flight at the same time, the responses are returned in the order of the data
+        futures = [self._call_future(event, i) for i in data]
+        deadline = time.monotonic() + self.timeout
+        try:
+            return [future.result(max(deadline - time.monotonic(), 0)) for future in futures]
+        except FutureTimeoutError:
+            raise Timeout(f"Timed out while waiting for the responses of {event}")
 
     # event handlers
 
     def _event_connect(self) -> None:
-        pass
+        if self._token:
+            # the socketio client reconnected on its own, the new connection is not logged in yet
+            self.sio.start_background_task(self._relogin)
+
+    def _relogin(self) -> None:
+        try:
+            self._call('loginByToken', self._token)
+        except (UptimeKumaException, socketio.exceptions.SocketIOError):
+            self._token = None
 
     def _event_disconnect(self) -> None:
         pass
 
-    def _event_monitor_list(self, data) -> None:
-        self._event_data[Event.MONITOR_LIST] = data
+    @_synchronized
+    def _store_monitor(self, monitor: dict) -> None:
+        # replaces a monitor of the monitor list, the caller notifies the waiters
+        monitor = freeze(monitor)
+        self._event_data[Event.MONITOR_LIST][str(monitor["id"])] = monitor
+        self._monitor_index.add(monitor)
+        self._monitor_revisions[monitor["id"]] = next(_revisions)
 
+    @_synchronized
+    def _event_monitor_list(self, data) -> None:
+        for monitor in data.values():
+            _parse_monitor(monitor)
+        self._event_data[Event.MONITOR_LIST] = {key: freeze(monitor) for key, monitor in data.items()}
+        self._monitor_index.reset(self._event_data[Event.MONITOR_LIST].values())
+        revision = next(_revisions)
+        self._monitor_revisions = {monitor["id"]: revision for monitor in self._event_data[Event.MONITOR_LIST].values()}
+        self._notify(Event.MONITOR_LIST)
+        if data == {}:
+            # the monitor events are not sent without monitors
+            for event in MONITOR_EVENTS:
+                self._notify(event)
+
+    @_synchronized
+    def _event_update_monitor_into_list(self, data) -> None:
+        # uptime kuma 2.0 only sends the changed monitors after the initial monitor list
+        if self._event_data[Event.MONITOR_LIST] is None:
+            return
+        for monitor in data.values():
+            _parse_monitor(monitor)
+            self._store_monitor(monitor)
+        self._notify(Event.MONITOR_LIST)
+
+    @_synchronized
+    def _event_delete_monitor_from_list(self, monitor_id) -> None:
+        if self._event_data[Event.MONITOR_LIST] is None:
+            return
+        self._event_data[Event.MONITOR_LIST].pop(str(monitor_id), None)
+        self._monitor_index.remove(int(monitor_id))
+        self._monitor_revisions.pop(int(monitor_id), None)
+        self._notify(Event.MONITOR_LIST)
+        if self._last_heartbeats.pop(int(monitor_id), None) is not None:
+            self._notify(Event.HEARTBEAT_LIST)
+
+    @_synchronized
     def _event_notification_list(self, data) -> None:
-        self._event_data[Event.NOTIFICATION_LIST] = data
+        self._event_data[Event.NOTIFICATION_LIST] = freeze(data)
+        self._notify(Event.NOTIFICATION_LIST)
 
+    @_synchronized
     def _event_proxy_list(self, data) -> None:
-        self._event_data[Event.PROXY_LIST] = data
+        int_to_bool(data, ["auth", "active", "default", "applyExisting"])
+        parse_proxy_protocol(data)
+        self._event_data[Event.PROXY_LIST] = freeze(data)
+        self._notify(Event.PROXY_LIST)
 
+    @_synchronized
     def _event_status_page_list(self, data) -> None:
-        self._event_data[Event.STATUS_PAGE_LIST] = data
+        self._event_data[Event.STATUS_PAGE_LIST] = {key: freeze(status_page) for key, status_page in data.items()}
+        self._notify(Event.STATUS_PAGE_LIST)
 
+    @_synchronized
     def _event_heartbeat_list(self, monitor_id, data, overwrite) -> None:
         monitor_id = int(monitor_id)
 
         if self._event_data[Event.HEARTBEAT_LIST] is None:
             self._event_data[Event.HEARTBEAT_LIST] = {}
-        if monitor_id not in self._event_data[Event.HEARTBEAT_LIST] or overwrite:
-            self._event_data[Event.HEARTBEAT_LIST][monitor_id] = data
-        else:
-            self._event_data[Event.HEARTBEAT_LIST][monitor_id].append(data)
-
+        heartbeats = self._event_data[Event.HEARTBEAT_LIST].get(monitor_id)
+        if heartbeats is not None and not overwrite:
+            # the list contains the heartbeats before the known ones
+            data = data + list(heartbeats.heartbeats())
+        self._event_data[Event.HEARTBEAT_LIST][monitor_id] = HeartbeatBuffer(self.heartbeat_capacity, data)
+        self._set_last_heartbeat(monitor_id, self._event_data[Event.HEARTBEAT_LIST][monitor_id].last())
+        self._notify(Event.HEARTBEAT_LIST)
+
+    @_synchronized
     def _event_important_heartbeat_list(self, monitor_id, data, overwrite) -> None:
         monitor_id = int(monitor_id)
 
+        _parse_heartbeats(data)
         if self._event_data[Event.IMPORTANT_HEARTBEAT_LIST] is None:
             self._event_data[Event.IMPORTANT_HEARTBEAT_LIST] = {}
+        # the newest heartbeat comes first, the buffer keeps the first ones
         if monitor_id not in self._event_data[Event.IMPORTANT_HEARTBEAT_LIST] or overwrite:
-            self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id] = data
+            self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id] = RingBuffer(
+                self.important_heartbeat_capacity, freeze(data[:self.important_heartbeat_capacity])
+            )
         else:
-            self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id].append(data)
+            # the list contains older heartbeats than the known ones, they are only kept while there is room
+            heartbeats = self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id]
+            room = max(self.important_heartbeat_capacity - len(heartbeats), 0)
+            heartbeats.extend(freeze(data[:room]))
+        self._notify(Event.IMPORTANT_HEARTBEAT_LIST)
 
+    @_synchronized
     def _event_avg_ping(self, monitor_id, data) -> None:
         monitor_id = int(monitor_id)
 
         if self._event_data[Event.AVG_PING] is None:
             self._event_data[Event.AVG_PING] = {}
         self._event_data[Event.AVG_PING][monitor_id] = data
+        self._notify(Event.AVG_PING)
 
+    @_synchronized
     def _event_uptime(self, monitor_id, type_, data) -> None:
         monitor_id = int(monitor_id)
 
         if self._event_data[Event.UPTIME] is None:
             self._event_data[Event.UPTIME] = {}
-        if monitor_id not in self._event_data[Event.UPTIME]:
-            self._event_data[Event.UPTIME][monitor_id] = {}
-        self._event_data[Event.UPTIME][monitor_id][type_] = data
+        uptimes = self._event_data[Event.UPTIME].get(monitor_id, {})
+        self._event_data[Event.UPTIME][monitor_id] = FrozenDict({**uptimes, type_: data})
+        self._notify(Event.UPTIME)
 
+    @_synchronized
     def _event_heartbeat(self, data) -> None:
+        _parse_heartbeats(data)
+        data = freeze(data)
         if self._event_data[Event.HEARTBEAT_LIST] is None:
             self._event_data[Event.HEARTBEAT_LIST] = {}
         monitor_id = data["monitorID"]
         if monitor_id not in self._event_data[Event.HEARTBEAT_LIST]:
-            self._event_data[Event.HEARTBEAT_LIST][monitor_id] = []
+            self._event_data[Event.HEARTBEAT_LIST][monitor_id] = HeartbeatBuffer(self.heartbeat_capacity)
         self._event_data[Event.HEARTBEAT_LIST][monitor_id].append(data)
-        if len(self._event_data[Event.HEARTBEAT_LIST][monitor_id]) >= 150:
-            self._event_data[Event.HEARTBEAT_LIST][monitor_id].pop(0)
+        self._set_last_heartbeat(monitor_id, data)
 
-        # add heartbeat to important heartbeat list
+        # add heartbeat to important heartbeat list, the newest heartbeat comes first
         if data["important"]:
             if self._event_data[Event.IMPORTANT_HEARTBEAT_LIST] is None:
                 self._event_data[Event.IMPORTANT_HEARTBEAT_LIST] = {}
             if monitor_id not in self._event_data[Event.IMPORTANT_HEARTBEAT_LIST]:
-                self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id] = []
-            self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id] = [data] + self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id]
+                self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id] = RingBuffer(self.important_heartbeat_capacity)
+            self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id].appendleft(data)
+        self._notify(Event.HEARTBEAT_LIST)
+        if data["important"]:
+            self._notify(Event.IMPORTANT_HEARTBEAT_LIST)
 
+    @_synchronized
+    def _set_last_heartbeat(self, monitor_id: int, heartbeat: dict = None) -> None:
+        if heartbeat is None:
+            self._last_heartbeats.pop(monitor_id, None)
+            self._monitor_index.set_status(monitor_id, None)
+            return
+        try:
+            status = MonitorStatus(heartbeat["status"])
+        except ValueError:
+            # unknown statuses are kept as sent, like in the heartbeat buffers
+            status = heartbeat["status"]
+        self._last_heartbeats[monitor_id] = FrozenDict(status=status, time=heartbeat.get("time"))
+        self._monitor_index.set_status(monitor_id, int(status))
+
+    @_synchronized
     def _event_info(self, data) -> None:
         if "version" not in data:
             # wait for the info event that is sent after login and contains the version
             return
-        self._event_data[Event.INFO] = data
+        self._event_data[Event.INFO] = freeze(data)
+        self._notify(Event.INFO)
 
+    @_synchronized
     def _event_cert_info(self, monitor_id, data) -> None:
         monitor_id = int(monitor_id)
 
         if self._event_data[Event.CERT_INFO] is None:
             self._event_data[Event.CERT_INFO] = {}
-        self._event_data[Event.CERT_INFO][monitor_id] = json.loads(data)
+        self._event_data[Event.CERT_INFO][monitor_id] = freeze(json.loads(data))
+        self._notify(Event.CERT_INFO)
 
+    @_synchronized
     def _event_docker_host_list(self, data) -> None:
-        self._event_data[Event.DOCKER_HOST_LIST] = data
+        parse_docker_type(data)
+        self._event_data[Event.DOCKER_HOST_LIST] = freeze(data)
+        self._notify(Event.DOCKER_HOST_LIST)
 
+    @_synchronized
     def _event_auto_login(self) -> None:
         self._event_data[Event.AUTO_LOGIN] = True
+        self._notify(Event.AUTO_LOGIN)
 
     def _event_init_server_timezone(self) -> None:
         pass
 
+    @_synchronized
     def _event_maintenance_list(self, data) -> None:
-        self._event_data[Event.MAINTENANCE_LIST] = data
+        parse_maintenance_strategy(list(data.values()))
+        self._event_data[Event.MAINTENANCE_LIST] = {key: freeze(maintenance) for key, maintenance in data.items()}
+        self._notify(Event.MAINTENANCE_LIST)
 
+    @_synchronized
     def _event_api_key_list(self, data) -> None:
-        self._event_data[Event.API_KEY_LIST] = data
+        int_to_bool(data, ["active"])
+        self._event_data[Event.API_KEY_LIST] = freeze(data)
+        self._notify(Event.API_KEY_LIST)
 
     # connection
 
@@ -682,6 +1042,7 @@ class UptimeKumaApi(object):
         Needs to be called to prevent blocking the program.
         """
         self.sio.disconnect()
+        self.http.close()
 
     # builder
 
@@ -1130,10 +1491,14 @@ class UptimeKumaApi(object):
 
     # monitor
 
-    def get_monitors(self) -> list[dict]:
+    def get_monitors(self, refresh: bool = True, copy: bool = False) -> list[dict]:
         """
         Get all monitors.
 
+        :param bool, optional refresh: Request the monitor list from the server. Set to ``False`` to answer from the
+                                       list the server pushed to this connection., defaults to True
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: A list of monitors.
         :rtype: list
 
@@ -1213,21 +1578,20 @@ class UptimeKumaApi(object):
             ]
         """
 
-        self._call('getMonitorList')
+        if refresh:
+            self._call('getMonitorList')
         with self.wait_for_event(Event.MONITOR_LIST):
-            r = list(self._get_event_data(Event.MONITOR_LIST).values())
-            for monitor in r:
-                _convert_monitor_return(monitor)
-            int_to_bool(r, ["active"])
-            parse_monitor_type(r)
-            parse_auth_method(r)
-            return r
+            return list(self._get_event_data(Event.MONITOR_LIST, copy=copy).values())
 
-    def get_monitor(self, id_: int) -> dict:
+    def get_monitor(self, id_: int, refresh: bool = True, copy: bool = False) -> dict:
         """
         Get a monitor.
 
         :param int id_: The monitor id.
+        :param bool, optional refresh: Request the monitor from the server. Set to ``False`` to answer from the
+                                       monitor list the server pushed to this connection., defaults to True
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: The monitor.
         :rtype: dict
         :raises UptimeKumaException: If the server returns an error.
@@ -1323,13 +1687,159 @@ class UptimeKumaApi(object):
                 'weight': 2000
             }
         """
+        if not refresh:
+            r = self._get_event_data(Event.MONITOR_LIST).get(str(id_))
+            if r is None:
+                raise UptimeKumaException("monitor does not exist")
+            return thaw(r) if copy else r
         r = self._call('getMonitor', id_)["monitor"]
-        _convert_monitor_return(r)
-        int_to_bool(r, ["active"])
-        parse_monitor_type(r)
-        parse_auth_method(r)
+        _parse_monitor(r)
         return r
 
+    @_synchronized
+    def _find_monitors(self, **filters) -> list[dict]:
+        index = self._monitor_index
+        return [index.monitors[monitor_id] for monitor_id in index.find(**filters)]
+
+    def find_monitors(
+            self,
+            type: MonitorType = None,
+            active: bool = None,
+            tag_id: int = None,
+            parent: int = None,
+            status: MonitorStatus = None,
+            name_prefix: str = None,
+            after: int = None,
+            limit: int = None
+    ) -> list[dict]:
+        """
+        Find the monitors that match all given filters, ordered by id.
+
+        The monitors are looked up in the secondary indexes that the client maintains while the server pushes
+        the monitor list and the heartbeats, the monitors are not requested from the server.
+
+        :param MonitorType, optional type: Monitor type, defaults to None
+        :param bool, optional active: Only active or only paused monitors, defaults to None
+        :param int, optional tag_id: Only monitors with this tag, defaults to None
+        :param int, optional parent: Only children of this group monitor, ``0`` for monitors without a group, defaults to None
+        :param MonitorStatus, optional status: Status of the last heartbeat, defaults to None
+        :param str, optional name_prefix: Case-insensitive prefix of the monitor name, defaults to None
+        :param int, optional after: Only monitors with a higher id, use the id of the last monitor of a page to get the next page, defaults to None
+        :param int, optional limit: Maximum number of monitors, defaults to None
+        :return: The matching monitors.
+        :rtype: list
+
+        Example::
+
+            >>> api.find_monitors(type=MonitorType.HTTP, active=True, limit=1)
+            [
+                {
+                    'id': 1,
+                    'name': 'monitor 1',
+                    'type': <MonitorType.HTTP: 'http'>,
+                    ...
+                }
+            ]
+        """
+        self._wait_for_event_data(Event.MONITOR_LIST)
+        if status is not None:
+            self._wait_for_event_data(Event.HEARTBEAT_LIST)
+        return self._find_monitors(
+            type=type, active=active, tag_id=tag_id, parent=parent, status=status,
+            name_prefix=name_prefix, after=after, limit=limit
+        )
+
+    def get_monitor_ids_by_tag(self, tag_id: int) -> list[int]:
+        """
+        Get the ids of the monitors with a tag.
+
+        :param int tag_id: Id of the tag.
+        :return: The monitor ids, ordered by id.
+        :rtype: list
+
+        Example::
+
+            >>> api.get_monitor_ids_by_tag(1)
+            [1, 3]
+        """
+        self._wait_for_event_data(Event.MONITOR_LIST)
+        with self._lock:
+            return self._monitor_index.ids("by_tag", tag_id)
+
+    def get_monitor_ids_by_type(self, type: MonitorType) -> list[int]:
+        """
+        Get the ids of the monitors of a type.
+
+        :param MonitorType type: Monitor type.
+        :return: The monitor ids, ordered by id.
+        :rtype: list
+
+        Example::
+
+            >>> api.get_monitor_ids_by_type(MonitorType.HTTP)
+            [1, 2]
+        """
+        self._wait_for_event_data(Event.MONITOR_LIST)
+        with self._lock:
+            return self._monitor_index.ids("by_type", type)
+
+    def get_monitor_children(self, parent: int) -> list[int]:
+        """
+        Get the ids of the monitors of a group.
+
+        :param int parent: Id of the group monitor, ``0`` for the monitors without a group.
+        :return: The monitor ids, ordered by id.
+        :rtype: list
+
+        Example::
+
+            >>> api.get_monitor_children(4)
+            [5, 6]
+        """
+        self._wait_for_event_data(Event.MONITOR_LIST)
+        with self._lock:
+            return self._monitor_index.ids("by_parent", parent)
+
+    def get_monitor_ids_by_status(self, status: MonitorStatus) -> list[int]:
+        """
+        Get the ids of the monitors whose last heartbeat has a status.
+
+        :param MonitorStatus status: Monitor status.
+        :return: The monitor ids, ordered by id.
+        :rtype: list
+
+        Example::
+
+            >>> api.get_monitor_ids_by_status(MonitorStatus.DOWN)
+            [2]
+        """
+        self._wait_for_event_data(Event.MONITOR_LIST)
+        self._wait_for_event_data(Event.HEARTBEAT_LIST)
+        with self._lock:
+            return self._monitor_index.ids("by_status", status)
+
+    def get_monitor_indexes(self) -> dict:
+        """
+        Get the secondary indexes over the monitor list.
+
+        :return: The monitor ids for each type, active state, tag id, parent id (``0`` for no group) and status.
+        :rtype: dict
+
+        Example::
+
+            >>> api.get_monitor_indexes()
+            {
+                'by_type': {<MonitorType.HTTP: 'http'>: [1, 2]},
+                'by_active': {True: [1], False: [2]},
+                'by_tag': {1: [1]},
+                'by_parent': {0: [1, 2]},
+                'by_status': {1: [1], 0: [2]}
+            }
+        """
+        self._wait_for_event_data(Event.MONITOR_LIST)
+        with self._lock:
+            return self._monitor_index.tables()
+
     def pause_monitor(self, id_: int) -> dict:
         """
         Pauses a monitor.
@@ -1387,12 +1897,16 @@ class UptimeKumaApi(object):
                 raise UptimeKumaException("monitor does not exist")
             return self._call('deleteMonitor', id_)
 
-    def get_monitor_beats(self, id_: int, hours: int) -> list[dict]:
+    def get_monitor_beats(self, id_: int, hours: int, refresh: bool = True) -> list[dict]:
         """
         Get monitor beats for a specific monitor in a time range.
 
         :param int id_: The monitor id.
         :param int hours: Period time in hours from now.
+        :param bool, optional refresh: Request the beats from the server. Set to ``False`` to answer from the
+                                       heartbeats the server pushed to this connection if they cover the period.
+                                       The beats have the keys of the server response, but ``id`` and
+                                       ``down_count`` are ``None``. Defaults to True
         :return: The server response.
         :rtype: list
         :raises UptimeKumaException: If the server returns an error.
@@ -1426,11 +1940,108 @@ class UptimeKumaApi(object):
                 ...
             ]
         """
+        if not refresh:
+            beats = self._pushed_beats(id_, hours)
+            if beats is not None:
+                return beats
         r = self._call('getMonitorBeats', (id_, hours))["data"]
         int_to_bool(r, ["important"])
         parse_monitor_status(r)
         return r
 
+    @_synchronized
+    def _pushed_beats(self, id_: int, hours: int) -> list[dict] | None:
+        # the pushed heartbeats of the period, None if they do not cover it
+        since = time.time() - hours * 3600
+        heartbeats = (self._event_data[Event.HEARTBEAT_LIST] or {}).get(id_)
+        if heartbeats is not None and heartbeats.covers(since):
+            return heartbeats.beats(since)
+        return None
+
+    def get_monitor_beats_many(self, ids: list[int], hours: int, refresh: bool = True) -> dict:
+        """
+        Get monitor beats for many monitors in a time range.
+
+        The beats of all monitors are requested at the same time on the connection of the client.
+
+        :param list ids: The monitor ids.
+        :param int hours: Period time in hours from now.
+        :param bool, optional refresh: Request the beats from the server. Set to ``False`` to answer from the
+                                       heartbeats the server pushed to this connection if they cover the period,
+                                       see :meth:`get_monitor_beats`., defaults to True
+        :return: The beats for each monitor id.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        :raises Timeout: If not all responses arrived in time.
+
+        Example::
+
+            >>> api.get_monitor_beats_many([1, 2], 6)
+            {
+                1: [
+                    {
+                        'down_count': 0,
+                        'duration': 0,
+                        'id': 25,
+                        'important': True,
+                        'monitor_id': 1,
+                        'msg': '200 - OK',
+                        'ping': 201,
+                        'status': <MonitorStatus.UP: 1>,
+                        'time': '2022-12-15 12:38:42.661'
+                    },
+                    ...
+                ],
+                2: [...]
+            }
+        """
+        beats = {}
+        if not refresh:
+            for id_ in ids:
+                pushed = self._pushed_beats(id_, hours)
+                if pushed is not None:
+                    beats[id_] = pushed
+        ids = [id_ for id_ in dict.fromkeys(ids) if id_ not in beats]
+        for id_, r in zip(ids, self._call_many('getMonitorBeats', [(id_, hours) for id_ in ids])):
+            r = r["data"]
+            int_to_bool(r, ["important"])
+            parse_monitor_status(r)
+            beats[id_] = r
+        return beats
+
+    def get_monitor_many(self, ids: list[int]) -> dict:
+        """
+        Get many monitors.
+
+        The monitors are requested at the same time on the connection of the client.
+
+        :param list ids: The monitor ids.
+        :return: The monitor for each monitor id.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        :raises Timeout: If not all responses arrived in time.
+
+        Example::
+
+            >>> api.get_monitor_many([1, 2])
+            {
+                1: {
+                    'id': 1,
+                    'name': 'monitor 1',
+                    'type': <MonitorType.HTTP: 'http'>,
+                    ...
+                },
+                2: {...}
+            }
+        """
+        ids = list(dict.fromkeys(ids))
+        monitors = {}
+        for id_, r in zip(ids, self._call_many('getMonitor', ids)):
+            r = r["monitor"]
+            _parse_monitor(r)
+            monitors[id_] = r
+        return monitors
+
     def get_game_list(self) -> list[dict]:
         """
         Get a list of games that are supported by the GameDig monitor type.
@@ -1514,11 +2125,26 @@ class UptimeKumaApi(object):
             return self._call('add', data)
 
     @append_docstring(monitor_docstring("edit"))
-    def edit_monitor(self, id_: int, **kwargs) -> dict:
+    def edit_monitor(
+            self,
+            id_: int,
+            refresh: bool = True,
+            revision: int = None,
+            wait: bool = True,
+            **kwargs
+    ) -> dict:
         """
         Edits an existing monitor.
 
         :param int id_: The monitor id.
+        :param bool, optional refresh: Request the monitor from the server before the edit. Set to ``False`` to
+                                       edit the monitor the server pushed to this connection, it is only requested
+                                       if it is unknown., defaults to True
+        :param int, optional revision: Only edit the pushed monitor if the monitor list is still at this revision
+                                       (see :meth:`get_revision`), otherwise the monitor is requested., defaults to None
+        :param bool, optional wait: Wait until the edited monitor is stored in the monitor list before returning, so
+                                    that the next edit builds on it. Set to ``False`` to return as soon as the
+                                    server confirmed the edit., defaults to True
         :return: The server response.
         :rtype: dict
         :raises UptimeKumaException: If the server returns an error.
@@ -1533,12 +2159,119 @@ class UptimeKumaApi(object):
                 'msg': 'Saved.'
             }
         """
-        data = self.get_monitor(id_)
+        data = None
+        if not refresh:
+            self._wait_for_event_data(Event.MONITOR_LIST)
+            data = self._pushed_copy(Event.MONITOR_LIST, str(id_), revision)
+        if data is None:
+            data = self.get_monitor(id_)
         data.update(kwargs)
         _convert_monitor_input(data)
         _check_arguments_monitor(data)
-        with self.wait_for_event(Event.MONITOR_LIST):
+        if not wait:
             return self._call('editMonitor', data)
+        with self.wait_for_event(Event.MONITOR_LIST):
+            stored = self._monitor_revisions.get(id_)
+            r = self._call('editMonitor', data)
+        # the server sends the edited monitor before the response, but its handler can run after the response
+        if not self._wait_for(Event.MONITOR_LIST, lambda: self._monitor_revisions.get(id_) != stored):
+            raise Timeout(f"Timed out while waiting for event {Event.MONITOR_LIST}")
+        return r
+
+    def _prepare_monitor_operation(self, operation: dict) -> tuple:
+        # validates a bulk operation and returns the socket event and the data to send
+        operation = dict(operation)
+        action = operation.pop("action", None)
+        if action not in MONITOR_OPERATIONS:
+            raise ValueError(f"unknown action {action}, must be one of {', '.join(MONITOR_OPERATIONS)}")
+        if action == "add":
+            data = self._build_monitor_data(**operation)
+        else:
+            id_ = operation.pop("id", None)
+            if id_ is None:
+                raise TypeError("missing 1 required argument: id")
+            data = self._pushed_copy(Event.MONITOR_LIST, str(id_))
+            if data is None:
+                raise UptimeKumaException("monitor does not exist")
+            if action != "edit":
+                if operation:
+                    raise TypeError(f"unexpected arguments for {action}: {', '.join(operation)}")
+                return MONITOR_OPERATIONS[action], id_
+            data.update(operation)
+        _convert_monitor_input(data)
+        _check_arguments_monitor(data)
+        return MONITOR_OPERATIONS[action], data
+
+    def _prepare_monitor_operations(self, operations: list[dict]) -> tuple[list, list]:
+        # the invalid operations get their result right away, the others are returned as (index, event, data)
+        results = [None] * len(operations)
+        calls = []
+        for i, operation in enumerate(operations):
+            try:
+                calls.append((i, *self._prepare_monitor_operation(operation)))
+            except (TypeError, ValueError, UptimeKumaException) as e:
+                results[i] = {"ok": False, "msg": str(e)}
+        return results, calls
+
+    def run_monitor_operations(self, operations: list[dict], concurrency: int = 8) -> list[dict]:
+        """
+        Adds, edits, deletes, pauses and resumes many monitors at once.
+
+        Every operation is a dict with the ``action`` (``add``, ``edit``, ``delete``, ``pause`` or ``resume``),
+        the ``id`` of the monitor for all actions except ``add`` and the monitor arguments for ``add`` and ``edit``.
+        All operations are validated before the first one is sent, invalid operations are not sent. The valid
+        operations are sent concurrently and the monitor list is refreshed once at the end.
+
+        :param list operations: The operations.
+        :param int, optional concurrency: How many operations are sent at the same time., defaults to 8
+        :return: The result of each operation, in the order of the operations. ``ok`` is ``False`` if the operation
+                 was invalid or the server returned an error, ``msg`` contains the error then.
+        :rtype: list
+        :raises UptimeKumaException: If the server returns an error while refreshing the monitor list.
+
+        Example::
+
+            >>> api.run_monitor_operations([
+            ...     {"action": "add", "type": MonitorType.HTTP, "name": "monitor 1", "url": "http://127.0.0.1"},
+            ...     {"action": "pause", "id": 1},
+            ...     {"action": "delete", "id": 42}
+            ... ])
+            [
+                {
+                    'ok': True,
+                    'msg': 'Added Successfully.',
+                    'monitorID': 2
+                },
+                {
+                    'ok': True,
+                    'msg': 'Paused Successfully.'
+                },
+                {
+                    'ok': False,
+                    'msg': 'monitor does not exist'
+                }
+            ]
+        """
+        self._wait_for_event_data(Event.MONITOR_LIST)
+        results, calls = self._prepare_monitor_operations(operations)
+
+        def run(call) -> None:
+            i, event, data = call
+            try:
+                results[i] = {"ok": True, **self._call(event, data)}
+            except Exception as e:
+                results[i] = {"ok": False, "msg": str(e) or type(e).__name__}
+
+        if calls:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(run, calls))
+            # the monitor list is sent before the response, one refresh covers all operations
+            stored = self._event_versions[Event.MONITOR_LIST]
+            self._call('getMonitorList')
+            # its handler can run after the response
+            if not self._wait_for(Event.MONITOR_LIST, lambda: self._event_versions[Event.MONITOR_LIST] != stored):
+                raise Timeout(f"Timed out while waiting for event {Event.MONITOR_LIST}")
+        return results
 
     # monitor tags
 
@@ -1566,9 +2299,18 @@ class UptimeKumaApi(object):
         """
         r = self._call('addMonitorTag', (tag_id, monitor_id, value))
         # the monitor list event does not send the updated tags
-        self._event_data[Event.MONITOR_LIST][str(monitor_id)] = self.get_monitor(monitor_id)
+        self._store_monitor(self.get_monitor(monitor_id))
+        self._notify(Event.MONITOR_LIST)
         return r
 
+    @_synchronized
+    def _has_monitor_tag(self, monitor_id: int, tag_id: int, value: str) -> bool:
+        # only the tags of the monitor are checked
+        if monitor_id not in self._monitor_index.by_tag.get(tag_id, ()):
+            return False
+        monitor = self._monitor_index.monitors[monitor_id]
+        return any(tag["tag_id"] == tag_id and tag["value"] == value for tag in monitor["tags"])
+
     # editMonitorTag is unused in uptime-kuma
     # def edit_monitor_tag(self, tag_id: int, monitor_id: int, value=""):
     #     return self._call('editMonitorTag', (tag_id, monitor_id, value))
@@ -1596,28 +2338,23 @@ class UptimeKumaApi(object):
             }
         """
         with self.wait_for_event(Event.MONITOR_LIST):
-            tags = [
-                {
-                    "monitor_id": y["monitor_id"],
-                    "tag_id": y["tag_id"],
-                    "value": y["value"]
-                } for x in [
-                    i.get("tags") for i in self.get_monitors()
-                ] for y in x
-            ]
-            if {"monitor_id": monitor_id, "tag_id": tag_id, "value": value} not in tags:
+            self.get_monitors()
+            if not self._has_monitor_tag(monitor_id, tag_id, value):
                 raise UptimeKumaException("monitor tag does not exist")
             r = self._call('deleteMonitorTag', (tag_id, monitor_id, value))
             # the monitor list event does not send the updated tags
-            self._event_data[Event.MONITOR_LIST][str(monitor_id)] = self.get_monitor(monitor_id)
+            self._store_monitor(self.get_monitor(monitor_id))
+            self._notify(Event.MONITOR_LIST)
             return r
 
     # notification
 
-    def get_notifications(self) -> list[dict]:
+    def get_notifications(self, copy: bool = False) -> list[dict]:
         """
         Get all notifications.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: All notifications.
         :rtype: list
 
@@ -1637,7 +2374,7 @@ class UptimeKumaApi(object):
                 }
             ]
         """
-        notifications = self._get_event_data(Event.NOTIFICATION_LIST)
+        notifications = self._get_event_data(Event.NOTIFICATION_LIST, copy=copy)
         r = []
         for notification_raw in notifications:
             notification = notification_raw.copy()
@@ -1812,10 +2549,12 @@ class UptimeKumaApi(object):
 
     # proxy
 
-    def get_proxies(self) -> list[dict]:
+    def get_proxies(self, copy: bool = False) -> list[dict]:
         """
         Get all proxies.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: All proxies.
         :rtype: list
 
@@ -1838,10 +2577,7 @@ class UptimeKumaApi(object):
                 }
             ]
         """
-        r = self._get_event_data(Event.PROXY_LIST)
-        int_to_bool(r, ["auth", "active", "default", "applyExisting"])
-        parse_proxy_protocol(r)
-        return r
+        return self._get_event_data(Event.PROXY_LIST, copy=copy)
 
     def get_proxy(self, id_: int) -> dict:
         """
@@ -1930,7 +2666,7 @@ class UptimeKumaApi(object):
                 'msg': 'Saved'
             }
         """
-        proxy = self.get_proxy(id_)
+        proxy = thaw(self.get_proxy(id_))
         proxy.update(kwargs)
         _check_arguments_proxy(proxy)
         with self.wait_for_event(Event.PROXY_LIST):
@@ -1959,10 +2695,12 @@ class UptimeKumaApi(object):
 
     # status page
 
-    def get_status_pages(self) -> list[dict]:
+    def get_status_pages(self, copy: bool = False) -> list[dict]:
         """
         Get all status pages.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: All status pages.
         :rtype: list
 
@@ -1987,7 +2725,7 @@ class UptimeKumaApi(object):
                 }
             ]
         """
-        return list(self._get_event_data(Event.STATUS_PAGE_LIST).values())
+        return list(self._get_event_data(Event.STATUS_PAGE_LIST, copy=copy).values())
 
     def get_status_page(self, slug: str) -> dict:
         """
@@ -2043,11 +2781,11 @@ class UptimeKumaApi(object):
                 'title': 'status page 1'
             }
         """
-        r1 = self._call('getStatusPage', slug)
-        try:
-            r2 = requests.get(f"{self.url}/api/status-page/{slug}", timeout=self.timeout, verify=self.ssl_verify).json()
-        except requests.exceptions.Timeout as e:
-            raise Timeout(e)
+        # the public status page is requested while the socket call is running
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._get_status_page_http, slug)
+            r1 = self._call('getStatusPage', slug)
+            r2 = future.result()
 
         config = r1["config"]
         config.update(r2["config"])
@@ -2065,6 +2803,13 @@ class UptimeKumaApi(object):
                 int_to_bool(j, ["sendUrl"])
         return data
 
+    def _get_status_page_http(self, slug: str) -> dict:
+        try:
+            r = self.http.get(f"{self.url}/api/status-page/{slug}", timeout=self.timeout)
+        except requests.exceptions.Timeout as e:
+            raise Timeout(e)
+        return r.json()
+
     def add_status_page(self, slug: str, title: str) -> dict:
         """
         Add a status page.
@@ -2104,11 +2849,13 @@ class UptimeKumaApi(object):
             r = self._call('deleteStatusPage', slug)
 
             # uptime kuma does not send the status page list event when a status page is deleted
-            for status_page in self._event_data[Event.STATUS_PAGE_LIST].values():
-                if status_page["slug"] == slug:
-                    status_page_id = status_page["id"]
-                    del self._event_data[Event.STATUS_PAGE_LIST][str(status_page_id)]
-                    break
+            with self._lock:
+                for status_page in self._event_data[Event.STATUS_PAGE_LIST].values():
+                    if status_page["slug"] == slug:
+                        status_page_id = status_page["id"]
+                        del self._event_data[Event.STATUS_PAGE_LIST][str(status_page_id)]
+                        self._notify(Event.STATUS_PAGE_LIST)
+                        break
 
             return r
 
@@ -2180,9 +2927,11 @@ class UptimeKumaApi(object):
         # uptime kuma does not send the status page list event when a status page is saved
         status_page = self._call('getStatusPage', slug)["config"]
         status_page_id = status_page["id"]
-        if self._event_data[Event.STATUS_PAGE_LIST] is None:
-            self._event_data[Event.STATUS_PAGE_LIST] = {}
-        self._event_data[Event.STATUS_PAGE_LIST][str(status_page_id)] = status_page
+        with self._lock:
+            if self._event_data[Event.STATUS_PAGE_LIST] is None:
+                self._event_data[Event.STATUS_PAGE_LIST] = {}
+            self._event_data[Event.STATUS_PAGE_LIST][str(status_page_id)] = freeze(status_page)
+            self._notify(Event.STATUS_PAGE_LIST)
 
         return r
 
@@ -2251,10 +3000,13 @@ class UptimeKumaApi(object):
 
     # heartbeat
 
-    def get_heartbeats(self) -> dict:
+    def get_heartbeats(self, limit: int = None, copy: bool = False) -> dict:
         """
         Get heartbeats.
 
+        :param int, optional limit: Only return the latest heartbeats of each monitor, defaults to None
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: The heartbeats for each monitor id.
         :rtype: dict
 
@@ -2288,16 +3040,23 @@ class UptimeKumaApi(object):
                 ]
             }
         """
-        r = self._get_event_data(Event.HEARTBEAT_LIST)
-        for i in r:
-            int_to_bool(r[i], ["important"])
-            parse_monitor_status(r[i])
-        return r
+        if limit is None:
+            return self._get_event_data(Event.HEARTBEAT_LIST, copy=copy)
+        if not self._wait_for_event_data(Event.HEARTBEAT_LIST):
+            return []
+        with self._lock:
+            r = FrozenDict(
+                (monitor_id, heartbeats.heartbeats(limit=limit))
+                for monitor_id, heartbeats in self._event_data[Event.HEARTBEAT_LIST].items()
+            )
+        return thaw(r) if copy else r
 
-    def get_important_heartbeats(self) -> dict:
+    def get_important_heartbeats(self, copy: bool = False) -> dict:
         """
         Get important heartbeats.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: The important heartbeats for each monitor id.
         :rtype: dict
 
@@ -2318,18 +3077,59 @@ class UptimeKumaApi(object):
                 ]
             }
         """
-        r = self._get_event_data(Event.IMPORTANT_HEARTBEAT_LIST)
-        for i in r:
-            int_to_bool(r[i], ["important"])
-            parse_monitor_status(r[i])
-        return r
+        return self._get_event_data(Event.IMPORTANT_HEARTBEAT_LIST, copy=copy)
+
+    # revisions
+
+    def get_revision(self, event: Event) -> int:
+        """
+        Get the revision of the data of an event.
+
+        The revision increases whenever the server pushes the event or the client changes the data of the
+        event. Data read at the same revision is unchanged, so results derived from it can be reused.
+        Revisions are unique across the client instances of a process, they can be used as ETags.
+
+        :param Event event: The event, for example :attr:`~.Event.MONITOR_LIST`.
+        :return: The revision of the event data.
+        :rtype: int
+
+        Example::
+
+            >>> api.get_revision(Event.MONITOR_LIST)
+            27
+        """
+        return self._event_versions[event]
+
+    # readiness
+
+    def wait_for_monitor_data(self, event: Event, timeout: float = None) -> bool:
+        """
+        Wait until the data of a per-monitor event has arrived for every monitor of the monitor list.
+
+        The wait is woken up by the event handlers, the monitor list is not fetched again.
+
+        :param Event event: :attr:`~.Event.AVG_PING`, :attr:`~.Event.UPTIME`, :attr:`~.Event.HEARTBEAT_LIST` or :attr:`~.Event.IMPORTANT_HEARTBEAT_LIST`.
+        :param float, optional timeout: Seconds to wait at most, defaults to the timeout of the client.
+        :return: ``True`` if the data is complete, ``False`` if the timeout expired first.
+        :rtype: bool
+        :raises ValueError: If the event is not sent for every monitor.
+
+        Example::
+
+            >>> api.wait_for_monitor_data(Event.AVG_PING, timeout=1)
+            True
+        """
+        self._check_ready_event(event)
+        return self._wait_for(event, lambda: self._is_ready(event), timeout)
 
     # avg ping
 
-    def avg_ping(self) -> dict:
+    def avg_ping(self, copy: bool = False) -> dict:
         """
         Get average ping.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: The average ping for each monitor id.
         :rtype: dict
 
@@ -2340,14 +3140,16 @@ class UptimeKumaApi(object):
                 1: 10
             }
         """
-        return self._get_event_data(Event.AVG_PING)
+        return self._get_event_data(Event.AVG_PING, copy=copy)
 
     # cert info
 
-    def cert_info(self) -> dict:
+    def cert_info(self, copy: bool = False) -> dict:
         """
         Get certificate info.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: Certificate info for each monitor id for which a certificate can be extracted.
         :rtype: dict
 
@@ -2502,14 +3304,16 @@ class UptimeKumaApi(object):
                 }
             }
         """
-        return self._get_event_data(Event.CERT_INFO)
+        return self._get_event_data(Event.CERT_INFO, copy=copy)
 
     # uptime
 
-    def uptime(self) -> dict:
+    def uptime(self, copy: bool = False) -> dict:
         """
         Get monitor uptime.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: Monitor uptime.
         :rtype: dict
 
@@ -2523,14 +3327,16 @@ class UptimeKumaApi(object):
                 }
             }
         """
-        return self._get_event_data(Event.UPTIME)
+        return self._get_event_data(Event.UPTIME, copy=copy)
 
     # info
 
-    def info(self) -> dict:
+    def info(self, copy: bool = False) -> dict:
         """
         Get server info.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: Server info.
         :rtype: dict
 
@@ -2546,7 +3352,7 @@ class UptimeKumaApi(object):
                 'version': '1.23.1'
             }
         """
-        r = self._get_event_data(Event.INFO)
+        r = self._get_event_data(Event.INFO, copy=copy)
         return r
 
     # clear
@@ -2600,10 +3406,32 @@ class UptimeKumaApi(object):
 
     # tags
 
-    def get_tags(self) -> list[dict]:
+    def _get_tag_registry(self, refresh: bool = False, previous: TagRegistry = None) -> TagRegistry:
+        # previous is the registry that missed a tag, its misses are kept
+        with self._lock:
+            registry = self._tag_registry
+            if not refresh and registry is not None and not registry.is_stale():
+                return registry
+        # the lock is not held during the request, the event handlers need it
+        tags = self._call('getTags')["tags"]
+        with self._lock:
+            registry = TagRegistry(tags, TAG_REGISTRY_TTL)
+            if previous is not None:
+                registry.keep_missing(previous)
+            self._tag_registry = registry
+            return registry
+
+    def get_tags(self, ids: list[int] = None, refresh: bool = True) -> list[dict]:
         """
         Get all tags.
 
+        The tags are cached by id and by name. With ``refresh=False`` the cache answers for up to 60 seconds
+        (``TAG_REGISTRY_TTL``), so tags changed by other clients can be missing or outdated for that long.
+        The cache is renewed earlier whenever this client adds, edits or deletes a tag. Unknown ids are
+        requested once, then they are skipped until the cache is renewed.
+
+        :param list, optional ids: Only return the tags with these ids, in this order. Unknown ids are skipped, defaults to None
+        :param bool, optional refresh: Request the tags from the server. Set to ``False`` to answer from the cache., defaults to True
         :return: All tags.
         :rtype: list
         :raises UptimeKumaException: If the server returns an error.
@@ -2618,14 +3446,36 @@ class UptimeKumaApi(object):
                     'name': 'tag 1'
                 }
             ]
+            >>> api.get_tags(ids=[1, 42])
+            [
+                {
+                    'color': '#ffffff',
+                    'id': 1,
+                    'name': 'tag 1'
+                }
+            ]
         """
-        return self._call('getTags')["tags"]
-
-    def get_tag(self, id_: int) -> dict:
+        registry = self._get_tag_registry(refresh)
+        if ids is None:
+            return registry.tags
+        unknown = {id_ for id_ in ids if registry.get(id_) is None}
+        with self._lock:
+            unexpected = unknown - registry.missing_ids
+        if not refresh and unexpected:
+            # the tags may have been added by another client
+            registry = self._get_tag_registry(refresh=True, previous=registry)
+            unknown = {id_ for id_ in ids if registry.get(id_) is None}
+        with self._lock:
+            registry.missing_ids.update(unknown)
+        return [registry.get(id_) for id_ in ids if registry.get(id_) is not None]
+
+    def get_tag(self, id_: int, refresh: bool = True) -> dict:
         """
         Get a tag.
 
         :param int id_: Id of the monitor to get.
+        :param bool, optional refresh: Request the tags from the server. Set to ``False`` to answer from the cache
+                                       (see :meth:`get_tags`)., defaults to True
         :return: The tag.
         :rtype: dict
         :raises UptimeKumaException: If the tag does not exist.
@@ -2639,12 +3489,48 @@ class UptimeKumaApi(object):
                 'name': 'tag 1'
             }
         """
+        registry = self._get_tag_registry(refresh)
+        tag = registry.get(id_)
+        if tag is None and not refresh and id_ not in registry.missing_ids:
+            # the tag may have been added by another client
+            registry = self._get_tag_registry(refresh=True, previous=registry)
+            tag = registry.get(id_)
+        if tag is None:
+            with self._lock:
+                registry.missing_ids.add(id_)
+            raise UptimeKumaException("tag does not exist")
+        return tag
+
+    def get_tag_by_name(self, name: str, refresh: bool = True) -> dict:
+        """
+        Get a tag by its name.
+
+        :param str name: Name of the tag.
+        :param bool, optional refresh: Request the tags from the server. Set to ``False`` to answer from the cache
+                                       (see :meth:`get_tags`)., defaults to True
+        :return: The tag.
+        :rtype: dict
+        :raises UptimeKumaException: If the tag does not exist.
 
-        tags = self.get_tags()
-        for tag in tags:
-            if tag["id"] == id_:
-                return tag
-        raise UptimeKumaException("tag does not exist")
+        Example::
+
+            >>> api.get_tag_by_name("tag 1")
+            {
+                'color': '#ffffff',
+                'id': 1,
+                'name': 'tag 1'
+            }
+        """
+        registry = self._get_tag_registry(refresh)
+        tag = registry.get_by_name(name)
+        if tag is None and not refresh and name not in registry.missing_names:
+            registry = self._get_tag_registry(refresh=True, previous=registry)
+            tag = registry.get_by_name(name)
+        if tag is None:
+            with self._lock:
+                registry.missing_names.add(name)
+            raise UptimeKumaException("tag does not exist")
+        return tag
 
     @append_docstring(tag_docstring("add"))
     def add_tag(self, **kwargs) -> dict:
@@ -2669,7 +3555,9 @@ class UptimeKumaApi(object):
         """
         data = _build_tag_data(**kwargs)
         _check_arguments_tag(data)
-        return self._call('addTag', data)["tag"]
+        r = self._call('addTag', data)["tag"]
+        self._tag_registry = None
+        return r
 
     @append_docstring(tag_docstring("edit"))
     def edit_tag(self, id_: int, **kwargs) -> dict:
@@ -2696,10 +3584,12 @@ class UptimeKumaApi(object):
                 }
             }
         """
-        data = self.get_tag(id_)
+        data = thaw(self.get_tag(id_))
         data.update(kwargs)
         _check_arguments_tag(data)
-        return self._call('editTag', data)
+        r = self._call('editTag', data)
+        self._tag_registry = None
+        return r
 
     def delete_tag(self, id_: int) -> dict:
         """
@@ -2717,9 +3607,10 @@ class UptimeKumaApi(object):
                 'msg': 'Deleted Successfully.'
             }
         """
-        if id_ not in [i["id"] for i in self.get_tags()]:
-            raise UptimeKumaException("tag does not exist")
-        return self._call('deleteTag', id_)
+        self.get_tag(id_)
+        r = self._call('deleteTag', id_)
+        self._tag_registry = None
+        return r
 
     # settings
 
@@ -3062,11 +3953,13 @@ class UptimeKumaApi(object):
             with self.wait_for_event(Event.AUTO_LOGIN):
                 return {}
 
-        return self._call('login', {
+        r = self._call('login', {
             "username": username,
             "password": password,
             "token": token
         })
+        self._token = r.get("token")
+        return r
 
     def login_by_token(self, token: str) -> dict:
         """
@@ -3082,7 +3975,9 @@ class UptimeKumaApi(object):
             >>> api.login_by_token(token)
             {}
         """
-        return self._call('loginByToken', token)
+        r = self._call('loginByToken', token)
+        self._token = token
+        return r
 
     def logout(self) -> None:
         """
@@ -3097,7 +3992,9 @@ class UptimeKumaApi(object):
             >>> api.logout()
             None
         """
-        return self._call('logout')
+        r = self._call('logout')
+        self._token = None
+        return r
 
     # setup
 
@@ -3173,10 +4070,12 @@ class UptimeKumaApi(object):
 
     # docker host
 
-    def get_docker_hosts(self) -> list[dict]:
+    def get_docker_hosts(self, copy: bool = False) -> list[dict]:
         """
         Get all docker hosts.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: All docker hosts.
         :rtype: list
 
@@ -3193,9 +4092,7 @@ class UptimeKumaApi(object):
                 }
             ]
         """
-        r = self._get_event_data(Event.DOCKER_HOST_LIST)
-        parse_docker_type(r)
-        return r
+        return self._get_event_data(Event.DOCKER_HOST_LIST, copy=copy)
 
     def get_docker_host(self, id_: int) -> dict:
         """
@@ -3292,7 +4189,7 @@ class UptimeKumaApi(object):
                 'msg': 'Saved'
             }
         """
-        data = self.get_docker_host(id_)
+        data = thaw(self.get_docker_host(id_))
         data.update(kwargs)
         _convert_docker_host_input(data)
         with self.wait_for_event(Event.DOCKER_HOST_LIST):
@@ -3321,10 +4218,12 @@ class UptimeKumaApi(object):
 
     # maintenance
 
-    def get_maintenances(self) -> list[dict]:
+    def get_maintenances(self, copy: bool = False) -> list[dict]:
         """
         Get all maintenances.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: All maintenances.
         :rtype: list
         :raises UptimeKumaException: If the server returns an error.
@@ -3370,9 +4269,7 @@ class UptimeKumaApi(object):
                 }
             ]
         """
-        r = list(self._get_event_data(Event.MAINTENANCE_LIST).values())
-        parse_maintenance_strategy(r)
-        return r
+        return list(self._get_event_data(Event.MAINTENANCE_LIST, copy=copy).values())
 
     def get_maintenance(self, id_: int) -> dict:
         """
@@ -3614,11 +4511,27 @@ class UptimeKumaApi(object):
         return self._call('addMaintenance', data)
 
     @append_docstring(maintenance_docstring("edit"))
-    def edit_maintenance(self, id_: int, **kwargs) -> dict:
+    def edit_maintenance(
+            self,
+            id_: int,
+            refresh: bool = True,
+            revision: int = None,
+            wait: bool = False,
+            **kwargs
+    ) -> dict:
         """
         Edits a maintenance.
 
         :param int id_: Id of the maintenance to edit.
+        :param bool, optional refresh: Request the maintenance from the server before the edit. Set to ``False`` to
+                                       edit the maintenance the server pushed to this connection, it is only
+                                       requested if it is unknown., defaults to True
+        :param int, optional revision: Only edit the pushed maintenance if the maintenance list is still at this
+                                       revision (see :meth:`get_revision`), otherwise the maintenance is
+                                       requested., defaults to None
+        :param bool, optional wait: Wait until the server sent the updated maintenance list before returning, so
+                                    that a following edit with ``refresh=False`` builds on it. This takes another
+                                    round trip., defaults to False
         :return: The server response.
         :rtype: dict
         :raises UptimeKumaException: If the server returns an error.
@@ -3655,10 +4568,22 @@ class UptimeKumaApi(object):
                 "maintenanceID": 1
             }
         """
-        maintenance = self.get_maintenance(id_)
+        maintenance = None
+        if not refresh:
+            self._wait_for_event_data(Event.MAINTENANCE_LIST)
+            maintenance = self._pushed_copy(Event.MAINTENANCE_LIST, str(id_), revision)
+        if maintenance is None:
+            maintenance = self.get_maintenance(id_)
         maintenance.update(kwargs)
         _check_arguments_maintenance(maintenance)
-        return self._call('editMaintenance', maintenance)
+        if not wait:
+            return self._call('editMaintenance', maintenance)
+        stored = self._event_versions[Event.MAINTENANCE_LIST]
+        r = self._call('editMaintenance', maintenance)
+        # the server sends the maintenance list before the response, but its handler can run after the response
+        if not self._wait_for(Event.MAINTENANCE_LIST, lambda: self._event_versions[Event.MAINTENANCE_LIST] != stored):
+            raise Timeout(f"Timed out while waiting for event {Event.MAINTENANCE_LIST}")
+        return r
 
     def delete_maintenance(self, id_: int) -> dict:
         """
@@ -3825,10 +4750,12 @@ class UptimeKumaApi(object):
 
     # api key
 
-    def get_api_keys(self) -> list[dict]:
+    def get_api_keys(self, copy: bool = False) -> list[dict]:
         """
         Get all api keys.
 
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
         :return: All api keys.
         :rtype: list
         :raises UptimeKumaException: If the server returns an error.
@@ -3860,9 +4787,7 @@ class UptimeKumaApi(object):
 
         # TODO: replace with getAPIKeyList?
 
-        r = self._get_event_data(Event.API_KEY_LIST)
-        int_to_bool(r, ["active"])
-        return r
+        return self._get_event_data(Event.API_KEY_LIST, copy=copy)
 
     def get_api_key(self, id_: int) -> dict:
         """
@@ -4010,9 +4935,33 @@ class UptimeKumaApi(object):
             >>> api.get_monitor_status(1)
             <MonitorStatus.PENDING: 2>
         """
-        heartbeats = self.get_heartbeats()
-        for heartbeat_monitor_id in heartbeats:
-            if heartbeat_monitor_id == monitor_id:
-                status = heartbeats[heartbeat_monitor_id][-1]["status"]
-                return MonitorStatus(status)
+        if self._wait_for_event_data(Event.HEARTBEAT_LIST):
+            last_heartbeat = self._last_heartbeats.get(monitor_id)
+            if last_heartbeat is not None:
+                return last_heartbeat["status"]
         raise UptimeKumaException("monitor does not exist")
+
+    def get_monitor_statuses(self, copy: bool = False) -> dict:
+        """
+        Get the status and the time of the last heartbeat of every monitor.
+
+        :param bool, optional copy: Return a mutable deep copy instead of the shared immutable snapshot, see
+                                    :func:`~uptime_kuma_api.thaw`., defaults to False
+        :return: The status and time for each monitor id.
+        :rtype: dict
+
+        Example::
+
+            >>> api.get_monitor_statuses()
+            {
+                1: {
+                    'status': <MonitorStatus.UP: 1>,
+                    'time': '2023-05-01 17:22:20.289'
+                }
+            }
+        """
+        if not self._wait_for_event_data(Event.HEARTBEAT_LIST):
+            return FrozenDict()
+        with self._lock:
+            r = FrozenDict(self._last_heartbeats)
+        return thaw(r) if copy else r
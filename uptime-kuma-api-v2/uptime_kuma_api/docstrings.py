@@ -387,3 +387,12 @@ def tag_docstring(mode) -> str:
         :param str{", optional" if mode == "edit" else ""} name: Tag name
         :param str{", optional" if mode == "edit" else ""} color: Tag color
     """
+
+
+def async_docstring(sync_func):
+    def _doc(func):
+        # reuses the docstring of the synchronous method, the examples are awaited
+        func.__doc__ = sync_func.__doc__.replace(">>> api.", ">>> await api.")
+        return func
+
+    return _doc
@@ -0,0 +1,90 @@
+from typing import Any
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"'{type(self).__name__}' object is immutable, use thaw() to get a mutable copy")
+
+
+class FrozenDict(dict):
+    """An immutable :class:`dict`.
+
+    The data that Uptime Kuma pushes to the client is stored as frozen objects, so that it can be returned
+    to every caller without copying it. Use :func:`thaw` to get a mutable copy.
+    """
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class FrozenList(list):
+    """An immutable :class:`list`.
+
+    See :class:`FrozenDict`.
+    """
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
+    append = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    clear = _immutable
+    sort = _immutable
+    reverse = _immutable
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def freeze(data: Any) -> Any:
+    """
+    Returns an immutable version of the data. Frozen objects are returned as they are.
+    """
+    if isinstance(data, (FrozenDict, FrozenList)):
+        return data
+    if isinstance(data, dict):
+        return FrozenDict((key, freeze(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return FrozenList(freeze(value) for value in data)
+    return data
+
+
+def thaw(data: Any) -> Any:
+    """
+    Returns a mutable deep copy of the data that was returned by the client.
+
+    Example::
+
+        >>> from uptime_kuma_api import thaw
+        >>> monitor = thaw(api.get_monitor(1, refresh=False))
+        >>> monitor["name"] = "Google"
+    """
+    if isinstance(data, dict):
+        return {key: thaw(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [thaw(value) for value in data]
+    return data
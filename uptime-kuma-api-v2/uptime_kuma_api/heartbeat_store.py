@@ -0,0 +1,187 @@
+import datetime
+import math
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Optional
+
+from .frozen import FrozenDict, FrozenList
+from .monitor_status import MonitorStatus
+
+# the keys of a heartbeat that are stored in columns, in the order uptime kuma sends them
+HEARTBEAT_KEYS = ("status", "time", "msg", "ping", "important", "duration")
+
+TIME_FORMATS = ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S")
+
+# marks a time that could not be parsed, the original value is kept with the other keys
+TIME_FORMAT_RAW = -1
+
+# marks a missing duration
+NO_DURATION = -1
+
+# keys of the rows of getMonitorBeats that are not part of the pushed heartbeats
+BEAT_ONLY_KEYS = ("id", "down_count")
+
+
+def _parse_time(value) -> tuple:
+    # returns the epoch time and the index of the time format
+    if isinstance(value, str):
+        for i, time_format in enumerate(TIME_FORMATS):
+            try:
+                parsed = datetime.datetime.strptime(value, time_format)
+            except ValueError:
+                continue
+            return parsed.replace(tzinfo=datetime.timezone.utc).timestamp(), i
+    return math.nan, TIME_FORMAT_RAW
+
+
+def _format_time(timestamp: float, time_format: int) -> str:
+    formatted = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).strftime(TIME_FORMATS[time_format])
+    if time_format == 0:
+        # uptime kuma sends milliseconds
+        formatted = formatted[:-3]
+    return formatted
+
+
+class HeartbeatBuffer(object):
+    """Stores the latest heartbeats of a monitor in parallel typed arrays.
+
+    The time, status, ping, duration and importance of each heartbeat are kept in columns and the messages
+    are interned. Heartbeat dicts are only built when they are read. Once the capacity is reached, the oldest
+    heartbeat is overwritten.
+    """
+
+    def __init__(self, capacity: int, heartbeats: Iterable[dict] = ()) -> None:
+        self.capacity = capacity
+        self._time = array("d")
+        self._time_format = array("b")
+        self._status = array("b")
+        self._ping = array("d")
+        self._duration = array("q")
+        self._important = array("b")
+        self._msg = []
+        # values of the keys that are not stored in columns, such as the monitor id
+        self._extra = []
+        # the tuples of these keys, shared by the heartbeats
+        self._extra_keys = []
+        self._key_tuples = {}
+        # index of the oldest heartbeat once the buffer is full
+        self._start = 0
+        for heartbeat in heartbeats:
+            self.append(heartbeat)
+
+    def __len__(self) -> int:
+        return len(self._time)
+
+    def append(self, heartbeat: dict) -> None:
+        timestamp, time_format = _parse_time(heartbeat.get("time"))
+        ping = heartbeat.get("ping")
+        duration = heartbeat.get("duration")
+        msg = heartbeat.get("msg")
+        extra = {key: value for key, value in heartbeat.items() if key not in HEARTBEAT_KEYS}
+        if time_format == TIME_FORMAT_RAW:
+            extra["time"] = heartbeat.get("time")
+        extra_keys = tuple(extra)
+        extra_keys = self._key_tuples.setdefault(extra_keys, extra_keys)
+        row = (
+            timestamp,
+            time_format,
+            int(heartbeat["status"]),
+            math.nan if ping is None else float(ping),
+            NO_DURATION if duration is None else int(duration),
+            1 if heartbeat.get("important") else 0,
+            sys.intern(msg) if isinstance(msg, str) else msg,
+            tuple(extra.values()),
+            extra_keys
+        )
+        columns = (
+            self._time, self._time_format, self._status, self._ping,
+            self._duration, self._important, self._msg, self._extra, self._extra_keys
+        )
+        if len(self) < self.capacity:
+            for column, value in zip(columns, row):
+                column.append(value)
+        else:
+            for column, value in zip(columns, row):
+                column[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+
+    def extend(self, heartbeats: Iterable[dict]) -> None:
+        for heartbeat in heartbeats:
+            self.append(heartbeat)
+
+    def _index(self, position: int) -> int:
+        # array index of the heartbeat at the given position, 0 is the oldest heartbeat
+        return (self._start + position) % len(self)
+
+    def _heartbeat(self, i: int) -> FrozenDict:
+        ping = self._ping[i]
+        duration = self._duration[i]
+        time_format = self._time_format[i]
+        try:
+            status = MonitorStatus(self._status[i])
+        except ValueError:
+            status = self._status[i]
+        heartbeat = dict(zip(self._extra_keys[i], self._extra[i]))
+        heartbeat["status"] = status
+        if time_format != TIME_FORMAT_RAW:
+            heartbeat["time"] = _format_time(self._time[i], time_format)
+        heartbeat["msg"] = self._msg[i]
+        heartbeat["ping"] = _ping(ping)
+        heartbeat["important"] = bool(self._important[i])
+        heartbeat["duration"] = None if duration == NO_DURATION else duration
+        return FrozenDict(heartbeat)
+
+    def heartbeats(self, since: float = None, limit: int = None) -> FrozenList:
+        """
+        Builds the heartbeats, the oldest first.
+
+        :param float, optional since: Only return heartbeats newer than this epoch time, defaults to None
+        :param int, optional limit: Only return the latest heartbeats, defaults to None
+        """
+        first = 0
+        if since is not None:
+            times = [self._time[self._index(i)] for i in range(len(self))]
+            first = bisect_right(times, since)
+        if limit is not None:
+            first = max(first, len(self) - limit)
+        return FrozenList(self._heartbeat(self._index(i)) for i in range(first, len(self)))
+
+    def beats(self, since: float = None) -> FrozenList:
+        """
+        Builds the heartbeats in the format of the rows of ``getMonitorBeats``, the oldest first.
+
+        The pushed heartbeats do not contain the ``id`` and ``down_count`` of the rows, they are ``None``.
+
+        :param float, optional since: Only return heartbeats newer than this epoch time, defaults to None
+        """
+        return FrozenList(_to_beat(heartbeat) for heartbeat in self.heartbeats(since))
+
+    def covers(self, since: float) -> bool:
+        # the buffer contains all heartbeats after the given time if it has an older one
+        return len(self) > 0 and self._time[self._index(0)] <= since
+
+    def last(self) -> Optional[FrozenDict]:
+        if not len(self):
+            return None
+        return self._heartbeat(self._index(len(self) - 1))
+
+    def last_status(self) -> Optional[int]:
+        if not len(self):
+            return None
+        return self._status[self._index(len(self) - 1)]
+
+
+def _ping(value: float) -> Optional[float]:
+    # uptime kuma sends whole milliseconds, fractions only for some monitor types
+    if math.isnan(value):
+        return None
+    return int(value) if value.is_integer() else value
+
+
+def _to_beat(heartbeat: dict) -> FrozenDict:
+    # the pushed heartbeats name the monitor id monitorID, the rows monitor_id
+    beat = {key: None for key in BEAT_ONLY_KEYS}
+    for key, value in heartbeat.items():
+        beat["monitor_id" if key == "monitorID" else key] = value
+    return FrozenDict(beat)
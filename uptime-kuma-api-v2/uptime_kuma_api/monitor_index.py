@@ -0,0 +1,181 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable
+
+from .monitor_status import MonitorStatus
+from .monitor_type import MonitorType
+
+
+class MonitorIndex(object):
+    """Secondary indexes over the monitor list.
+
+    The monitors are indexed by type, active state, tag, parent group, status of the last heartbeat and name.
+    The indexes are updated incrementally by the event handlers of the client. Filters intersect the sets of the
+    matching monitor ids instead of scanning every monitor, the results are ordered by monitor id.
+    """
+
+    def __init__(self, monitors: Iterable[dict] = ()) -> None:
+        self.monitors = {}
+        self.by_type = {}
+        self.by_active = {}
+        self.by_tag = {}
+        # top-level monitors are stored under 0
+        self.by_parent = {}
+        self.by_status = {}
+        # the status of a monitor is kept when the monitor list is replaced
+        self._statuses = {}
+        self._ids = []
+        self._names = []
+        self.reset(monitors)
+
+    def reset(self, monitors: Iterable[dict]) -> None:
+        """Replaces the monitors, the statuses of the remaining monitors are kept."""
+        self.monitors = {}
+        self.by_type = {}
+        self.by_active = {}
+        self.by_tag = {}
+        self.by_parent = {}
+        self._ids = []
+        self._names = []
+        for monitor in monitors:
+            self.add(monitor)
+        for monitor_id in [i for i in self._statuses if i not in self.monitors]:
+            self.set_status(monitor_id, None)
+
+    @staticmethod
+    def _keys(monitor: dict) -> tuple:
+        # the keys of the monitor in each table
+        tags = {tag["tag_id"] for tag in monitor.get("tags") or []}
+        return (
+            ("by_type", monitor["type"]),
+            ("by_active", bool(monitor.get("active"))),
+            ("by_parent", monitor.get("parent") or 0),
+        ), tags
+
+    @staticmethod
+    def _name(monitor: dict) -> tuple:
+        return (monitor.get("name") or "").casefold(), monitor["id"]
+
+    def add(self, monitor: dict) -> None:
+        """Adds or replaces a monitor."""
+        monitor_id = monitor["id"]
+        if monitor_id in self.monitors:
+            self._unindex(self.monitors[monitor_id])
+        else:
+            insort(self._ids, monitor_id)
+        self.monitors[monitor_id] = monitor
+        keys, tags = self._keys(monitor)
+        for table, key in keys:
+            getattr(self, table).setdefault(key, set()).add(monitor_id)
+        for tag_id in tags:
+            self.by_tag.setdefault(tag_id, set()).add(monitor_id)
+        insort(self._names, self._name(monitor))
+
+    def remove(self, monitor_id: int) -> None:
+        """Removes a monitor and its status."""
+        monitor = self.monitors.pop(monitor_id, None)
+        if monitor is not None:
+            self._unindex(monitor)
+            del self._ids[bisect_left(self._ids, monitor_id)]
+        self.set_status(monitor_id, None)
+
+    def _unindex(self, monitor: dict) -> None:
+        monitor_id = monitor["id"]
+        keys, tags = self._keys(monitor)
+        for table, key in keys:
+            _discard(getattr(self, table), key, monitor_id)
+        for tag_id in tags:
+            _discard(self.by_tag, tag_id, monitor_id)
+        name = self._name(monitor)
+        i = bisect_left(self._names, name)
+        if i < len(self._names) and self._names[i] == name:
+            del self._names[i]
+
+    def set_status(self, monitor_id: int, status: int = None) -> None:
+        """Sets the status of the last heartbeat of a monitor, ``None`` removes it."""
+        previous = self._statuses.get(monitor_id)
+        if previous == status:
+            return
+        if previous is not None:
+            _discard(self.by_status, previous, monitor_id)
+        if status is None:
+            self._statuses.pop(monitor_id, None)
+        else:
+            self._statuses[monitor_id] = status
+            self.by_status.setdefault(status, set()).add(monitor_id)
+
+    def ids(self, table: str, key) -> list:
+        """Returns the sorted ids of the monitors with the key in the table."""
+        return sorted(i for i in getattr(self, table).get(key, ()) if i in self.monitors)
+
+    def tables(self) -> dict:
+        """Returns every table with the sorted monitor ids of each key."""
+        return {
+            table: {key: self.ids(table, key) for key in getattr(self, table)}
+            for table in ("by_type", "by_active", "by_tag", "by_parent", "by_status")
+        }
+
+    def _by_name_prefix(self, prefix: str) -> set:
+        prefix = prefix.casefold()
+        start = bisect_left(self._names, (prefix,))
+        # every name with the prefix sorts before the prefix followed by the highest code point
+        end = bisect_left(self._names, (prefix + "\U0010ffff",), lo=start)
+        return {monitor_id for _, monitor_id in self._names[start:end]}
+
+    def find(
+            self,
+            type: MonitorType = None,
+            active: bool = None,
+            tag_id: int = None,
+            parent: int = None,
+            status: MonitorStatus = None,
+            name_prefix: str = None,
+            after: int = None,
+            limit: int = None
+    ) -> list:
+        """
+        Returns the ids of the monitors that match all given filters.
+
+        :param after: Only return monitors with a higher id, the cursor of the next page.
+        :param limit: Return this many monitors at most.
+        """
+        candidates = []
+        if type is not None:
+            candidates.append(self.by_type.get(type, set()))
+        if active is not None:
+            candidates.append(self.by_active.get(bool(active), set()))
+        if tag_id is not None:
+            candidates.append(self.by_tag.get(tag_id, set()))
+        if parent is not None:
+            candidates.append(self.by_parent.get(parent, set()))
+        if status is not None:
+            candidates.append(self.by_status.get(status, set()))
+        if name_prefix:
+            candidates.append(self._by_name_prefix(name_prefix))
+
+        if candidates:
+            # the smallest set is filtered by the others
+            candidates.sort(key=len)
+            ids = sorted(candidates[0])
+            others = candidates[1:]
+        else:
+            ids = self._ids
+            others = []
+        if after is not None:
+            ids = ids[bisect_right(ids, after):]
+        result = []
+        for monitor_id in ids:
+            # the status of a monitor can be known before the monitor
+            if monitor_id not in self.monitors or not all(monitor_id in other for other in others):
+                continue
+            result.append(monitor_id)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+
+def _discard(table: dict, key, monitor_id: int) -> None:
+    ids = table.get(key)
+    if ids is not None:
+        ids.discard(monitor_id)
+        if not ids:
+            del table[key]
@@ -0,0 +1,36 @@
+from collections import deque
+from typing import Any, Iterable
+
+from .frozen import FrozenList
+
+
+class RingBuffer(object):
+    """A bounded buffer that drops the oldest items once the capacity is reached.
+
+    Adding an item takes constant time. The frozen snapshot of the items is built on demand and reused
+    until the buffer changes.
+    """
+
+    def __init__(self, capacity: int, items: Iterable = ()) -> None:
+        self._items = deque(items, maxlen=capacity)
+        self._snapshot = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def append(self, item: Any) -> None:
+        self._items.append(item)
+        self._snapshot = None
+
+    def appendleft(self, item: Any) -> None:
+        self._items.appendleft(item)
+        self._snapshot = None
+
+    def extend(self, items: Iterable) -> None:
+        self._items.extend(items)
+        self._snapshot = None
+
+    def snapshot(self) -> FrozenList:
+        if self._snapshot is None:
+            self._snapshot = FrozenList(self._items)
+        return self._snapshot
@@ -0,0 +1,39 @@
+import time
+from typing import Iterable, Optional
+
+from .frozen import FrozenDict, FrozenList, freeze
+
+
+class TagRegistry(object):
+    """The tags of the server, indexed by id and by name.
+
+    :param tags: The tags returned by the server.
+    :param ttl: Seconds after which the registry is considered stale.
+    """
+
+    def __init__(self, tags: Iterable[dict], ttl: float) -> None:
+        self.tags = FrozenList(freeze(tag) for tag in tags)
+        self.by_id = {tag["id"]: tag for tag in self.tags}
+        self.by_name = {tag["name"]: tag for tag in self.tags}
+        # ids and names that were looked up but are unknown, they are not requested again while the registry is fresh
+        self.missing_ids = set()
+        self.missing_names = set()
+        self._expires_at = time.monotonic() + ttl
+
+    def keep_missing(self, previous: "TagRegistry") -> None:
+        """Takes over the unknown ids and names of the previous registry that are still unknown.
+
+        The registry expires with the previous one, so that the misses are not kept longer than its TTL.
+        """
+        self.missing_ids = {id_ for id_ in previous.missing_ids if id_ not in self.by_id}
+        self.missing_names = {name for name in previous.missing_names if name not in self.by_name}
+        self._expires_at = min(self._expires_at, previous._expires_at)
+
+    def is_stale(self) -> bool:
+        return time.monotonic() >= self._expires_at
+
+    def get(self, id_: int) -> Optional[FrozenDict]:
+        return self.by_id.get(id_)
+
+    def get_by_name(self, name: str) -> Optional[FrozenDict]:
+        return self.by_name.get(name)